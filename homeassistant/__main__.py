@@ -105,6 +105,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Write a trace of the startup and log its critical path",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -200,6 +205,7 @@ def main() -> int:
         recovery_mode=args.recovery_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        trace_startup=args.trace_startup,
         safe_mode=safe_mode,
     )
 
@@ -73,6 +73,7 @@ from .const import (
 from .exceptions import HomeAssistantError
 from .helpers import (
     area_registry,
+    boot_plan,
     category_registry,
     config_validation as cv,
     device_registry,
@@ -83,6 +84,7 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
@@ -96,6 +98,7 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_defer_setup_components,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -269,6 +272,9 @@ async def async_setup_hass(
     if runtime_config.debug or hass.loop.get_debug():
         hass.config.debug = True
 
+    if runtime_config.trace_startup:
+        startup_trace.async_enable(hass)
+
     hass.config.safe_mode = runtime_config.safe_mode
     hass.config.skip_pip = runtime_config.skip_pip
     hass.config.skip_pip_packages = runtime_config.skip_pip_packages
@@ -773,7 +779,7 @@ async def async_setup_multi_components(
 
 
 async def _async_resolve_domains_to_setup(
-    hass: core.HomeAssistant, config: dict[str, Any]
+    hass: core.HomeAssistant, config: dict[str, Any], plan: boot_plan.BootPlan
 ) -> tuple[set[str], dict[str, loader.Integration]]:
     """Resolve all dependencies and return list of domains to set up."""
     domains_to_setup = _get_domains(hass, config)
@@ -812,6 +818,12 @@ async def _async_resolve_domains_to_setup(
 
     translations_to_load = additional_manifests_to_load.copy()
 
+    # If the previous startup had the same configuration, load the
+    # manifests of everything it set up in the first batch so resolving
+    # the dependencies below does not need any further executor jobs
+    if plan_data := await plan.async_load(domains_to_setup):
+        additional_manifests_to_load.update(plan_data["domains"])
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start right-away
     integration_cache: dict[str, loader.Integration] = {}
@@ -927,9 +939,42 @@ async def _async_resolve_domains_to_setup(
         eager_start=True,
     )
 
+    # Import the integrations and platforms the previous startup
+    # imported in the same order ahead of setting them up
+    plan.async_prefetch()
+
     return domains_to_setup, integration_cache
 
 
+def _get_deferred_domains(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    domains_to_setup: set[str],
+    integration_cache: dict[str, loader.Integration],
+) -> set[str]:
+    """Get domains of which the setup can be deferred until they are used.
+
+    Only integrations which opt in with lazy_setup in their manifest
+    are deferred. They must not be configured in YAML, have no config
+    entries and no other integration to set up may depend on them.
+    """
+    configured_domains = {cv.domain_key(key) for key in config}
+    lazy_domains = {
+        domain
+        for domain in domains_to_setup
+        if (integration := integration_cache.get(domain)) is not None
+        and integration.lazy_setup
+        and domain not in configured_domains
+        and not hass.config_entries.async_entries(domain)
+    }
+    if not lazy_domains:
+        return lazy_domains
+    for domain in domains_to_setup:
+        if (integration := integration_cache.get(domain)) is not None:
+            lazy_domains.difference_update(integration.dependencies)
+    return lazy_domains
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -937,10 +982,19 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    plan = boot_plan.BootPlan(hass)
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
+        hass, config, plan
     )
 
+    if deferred_domains := _get_deferred_domains(
+        hass, config, domains_to_setup, integration_cache
+    ):
+        domains_to_setup -= deferred_domains
+        await async_defer_setup_components(
+            hass, (integration_cache[domain] for domain in deferred_domains), config
+        )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1033,6 +1087,8 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    plan.async_schedule_save(domains_to_setup)
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
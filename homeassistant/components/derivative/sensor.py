@@ -19,7 +19,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTime,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
@@ -27,7 +27,10 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.numeric_source import (
+    NumericStateChangedData,
+    async_track_numeric_state_change,
+)
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
@@ -209,8 +212,9 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
                 _LOGGER.warning("Could not restore last state: %s", err)
 
         @callback
-        def calc_derivative(event: Event[EventStateChangedData]) -> None:
+        def calc_derivative(change: NumericStateChangedData) -> None:
             """Handle the sensor state changes."""
+            event = change.event
             if (
                 (old_state := event.data["old_state"]) is None
                 or old_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE)
@@ -233,11 +237,17 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
                 < self._time_window
             ]
 
+            if change.old_value is None or change.new_value is None:
+                _LOGGER.warning(
+                    "Invalid state (%s > %s)", old_state.state, new_state.state
+                )
+                return
+
             try:
                 elapsed_time = (
                     new_state.last_updated - old_state.last_updated
                 ).total_seconds()
-                delta_value = Decimal(new_state.state) - Decimal(old_state.state)
+                delta_value = change.new_value - change.old_value
                 new_derivative = (
                     delta_value
                     / Decimal(elapsed_time)
@@ -283,7 +293,7 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
             self.async_write_ha_state()
 
         self.async_on_remove(
-            async_track_state_change_event(
+            async_track_numeric_state_change(
                 self.hass, self._sensor_source_id, calc_derivative
             )
         )
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import partial
+from itertools import pairwise
 import logging
+import math
 from numbers import Number
 import statistics
 from typing import Any, cast
@@ -16,7 +18,10 @@ import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.input_number import DOMAIN as INPUT_NUMBER_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.history.preload import (
+    async_preload_last_state_changes,
+    async_preload_state_changes_during_period,
+)
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     DOMAIN as SENSOR_DOMAIN,
@@ -320,41 +325,31 @@ class SensorFilter(SensorEntity):
 
             # Retrieve the largest window_size of each type
             if largest_window_items > 0:
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
+                history_list.extend(
+                    await async_preload_last_state_changes(
+                        self.hass, largest_window_items, self._entity
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                filter_history = await async_preload_state_changes_during_period(
+                    self.hass, start, entity_id=self._entity
+                )
+                # Both queries can return the same recorded states
+                loaded = {(s.last_updated, s.state) for s in history_list}
+                history_list.extend(
+                    state
+                    for state in filter_history
+                    if (state.last_updated, state.state) not in loaded
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
             # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
-            _LOGGER.debug(
-                "Loading from history: %s",
-                [(s.state, s.last_updated) for s in history_list],
-            )
+            history_list.sort(key=lambda s: s.last_updated)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Loading from history: %s",
+                    [(s.state, s.last_updated) for s in history_list],
+                )
 
             # Replay history through the filter chain
             for state in history_list:
@@ -484,12 +479,16 @@ class Filter:
         filtered.set_precision(self.filter_precision)
 
         if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
+            self._add_state(copy(FilterState(new_state)))
         else:
-            self.states.append(copy(filtered))
+            self._add_state(copy(filtered))
         new_state.state = filtered.state
         return new_state
 
+    def _add_state(self, state: FilterState) -> None:
+        """Add a state to the window of previous states."""
+        self.states.append(state)
+
 
 @FILTERS.register(FILTER_NAME_RANGE)
 class RangeFilter(Filter, SensorEntity):
@@ -575,15 +574,54 @@ class OutlierFilter(Filter, SensorEntity):
         self._radius = radius
         self._stats_internal: Counter = Counter()
         self._store_raw = True
+        # The values of the window in sorted order to find the median
+        self._sorted_values: list[float] = []
+        self._nan_values = 0
+
+    def reset(self) -> None:
+        """Reset filter."""
+        super().reset()
+        self._sorted_values.clear()
+        self._nan_values = 0
+
+    def _add_state(self, state: FilterState) -> None:
+        """Add a state to the window and the sorted values."""
+        states = self.states
+        if len(states) == states.maxlen:
+            if not states:
+                # A window of size 0 keeps no states
+                return
+            # We can cast safely here thanks to self._only_numbers = True
+            oldest_value = cast(float, states[0].state)
+            if math.isnan(oldest_value):
+                self._nan_values -= 1
+            else:
+                del self._sorted_values[bisect_left(self._sorted_values, oldest_value)]
+        if math.isnan(value := cast(float, state.state)):
+            self._nan_values += 1
+        else:
+            insort(self._sorted_values, value)
+        super()._add_state(state)
+
+    def _median(self) -> float:
+        """Return the median of the values in the window."""
+        if self._nan_values:
+            # Values which are not a number can't be sorted
+            return statistics.median(cast(float, s.state) for s in self.states)
+        # Same as statistics.median on the sorted values
+        values = self._sorted_values
+        count = len(values)
+        if count % 2 == 1:
+            return values[count // 2]
+        return (values[count // 2 - 1] + values[count // 2]) / 2
 
     def _filter_state(self, new_state: FilterState) -> FilterState:
         """Implement the outlier filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        previous_state_values = [cast(float, s.state) for s in self.states]
         new_state_value = cast(float, new_state.state)
 
-        median = statistics.median(previous_state_values) if self.states else 0
+        median = self._median() if self.states else 0
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state_value - median) > self._radius
@@ -659,30 +697,66 @@ class TimeSMAFilter(Filter, SensorEntity):
         self._time_window = window_size
         self.last_leak: FilterState | None = None
         self.queue = deque[FilterState]()
+        # Time weighted sum of the values in the queue until the last one
+        self._queue_sum: float = 0
+        # Updates of the sum since it was last computed from the queue
+        self._queue_sum_updates = 0
 
     def _leak(self, left_boundary: datetime) -> None:
         """Remove timeouted elements."""
-        while self.queue:
-            if self.queue[0].timestamp + self._time_window <= left_boundary:
-                self.last_leak = self.queue.popleft()
+        queue = self.queue
+        while queue:
+            if queue[0].timestamp + self._time_window <= left_boundary:
+                self.last_leak = leaked = queue.popleft()
+                if queue:
+                    # We can cast safely here thanks to self._only_numbers = True
+                    self._update_queue_sum(
+                        -(queue[0].timestamp - leaked.timestamp).total_seconds()
+                        * cast(float, leaked.state)
+                    )
+                else:
+                    self._queue_sum = 0
             else:
                 return
 
+    def _update_queue_sum(self, value: float) -> None:
+        """Add a value to the sum of the queue.
+
+        Adding and removing values to a float sum accumulates rounding
+        errors, so the sum is computed again from the queue once it was
+        updated as often as the queue is long.
+        """
+        self._queue_sum += value
+        self._queue_sum_updates += 1
+        if self._queue_sum_updates > len(self.queue):
+            self._queue_sum_updates = 0
+            # We can cast safely here thanks to self._only_numbers = True
+            self._queue_sum = math.fsum(
+                (current.timestamp - previous.timestamp).total_seconds()
+                * cast(float, previous.state)
+                for previous, current in pairwise(self.queue)
+            )
+
     def _filter_state(self, new_state: FilterState) -> FilterState:
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
-        self.queue.append(copy(new_state))
+        queue = self.queue
+        previous = queue[-1] if queue else None
+        queue.append(copy(new_state))
+        if previous is not None:
+            # We can cast safely here thanks to self._only_numbers = True
+            self._update_queue_sum(
+                (new_state.timestamp - previous.timestamp).total_seconds()
+                * cast(float, previous.state)
+            )
 
-        moving_sum: float = 0
+        # The value before the first one in the queue starts the window
         start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak if self.last_leak is not None else self.queue[0]
-        for state in self.queue:
-            # We can cast safely here thanks to self._only_numbers = True
-            prev_state_value = cast(float, prev_state.state)
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state_value
-            start = state.timestamp
-            prev_state = state
+        prev_state = self.last_leak if self.last_leak is not None else queue[0]
+        moving_sum = (queue[0].timestamp - start).total_seconds() * cast(
+            float, prev_state.state
+        ) + self._queue_sum
 
         new_state.state = moving_sum / self._time_window.total_seconds()
 
@@ -17,6 +17,7 @@ from yarl import URL
 from homeassistant.components import onboarding, websocket_api
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.messages import construct_result_message
 from homeassistant.config import async_hass_config_yaml
 from homeassistant.const import (
     CONF_MODE,
@@ -30,7 +31,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.icon import async_get_icons
 from homeassistant.helpers.json import json_dumps_sorted
 from homeassistant.helpers.storage import Store
-from homeassistant.helpers.translation import async_get_translations
+from homeassistant.helpers.translation import async_get_translations_json
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration, bind_hass
 
@@ -734,7 +735,7 @@ async def websocket_get_translations(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get translations command."""
-    resources = await async_get_translations(
+    resources = await async_get_translations_json(
         hass,
         msg["language"],
         msg["category"],
@@ -742,7 +743,7 @@ async def websocket_get_translations(
         msg.get("config_flow"),
     )
     connection.send_message(
-        websocket_api.result_message(msg["id"], {"resources": resources})
+        construct_result_message(msg["id"], b'{"resources":' + resources + b"}")
     )
 
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime as dt, timedelta
+from functools import partial
 from http import HTTPStatus
-from typing import cast
+from typing import Any, Literal, cast
 
 from aiohttp import web
+from typing_extensions import Generator
 import voluptuous as vol
 
 from homeassistant.components import frontend
@@ -14,7 +17,7 @@ from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import HomeAssistant, valid_entity_id
+from homeassistant.core import HomeAssistant, State, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
 from homeassistant.helpers.typing import ConfigType
@@ -22,10 +25,13 @@ import homeassistant.util.dt as dt_util
 
 from . import websocket_api
 from .const import DOMAIN
+from .export import CONTENT_TYPE_HISTORY_EXPORT, generate_export
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 CONF_ORDER = "use_include_order"
 
+EXPORT_PERIODS = {"5minute", "hour", "day", "week", "month"}
+
 _ONE_DAY = timedelta(days=1)
 
 CONFIG_SCHEMA = vol.Schema(
@@ -46,6 +52,7 @@ CONFIG_SCHEMA = vol.Schema(
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the history hooks."""
     hass.http.register_view(HistoryPeriodView())
+    hass.http.register_view(HistoryExportView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
     return True
@@ -60,7 +67,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         query = request.query
@@ -116,10 +123,11 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await get_instance(hass).async_add_executor_job(
-                self._sorted_significant_states_json,
+        return await self.async_stream_json(
+            request,
+            get_instance(hass).async_add_executor_job,
+            partial(
+                self._sorted_significant_states,
                 hass,
                 start_time,
                 end_time,
@@ -131,7 +139,7 @@ class HistoryPeriodView(HomeAssistantView):
             ),
         )
 
-    def _sorted_significant_states_json(
+    def _sorted_significant_states(
         self,
         hass: HomeAssistant,
         start_time: dt,
@@ -141,22 +149,90 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
-    ) -> web.Response:
-        """Fetch significant stats from the database as json."""
+    ) -> Generator[Iterator[State | dict[str, Any]]]:
+        """Fetch significant states from the database with a single query.
+
+        The rows are read in batches for long periods and the states of
+        each entity are streamed as they are read.
+        """
         with session_scope(hass=hass, read_only=True) as session:
-            return self.json(
-                list(
-                    history.get_significant_states_with_session(
-                        hass,
-                        session,
-                        start_time,
-                        end_time,
-                        entity_ids,
-                        None,
-                        include_start_time_state,
-                        significant_changes_only,
-                        minimal_response,
-                        no_attributes,
-                    ).values()
-                )
+            yield from history.iter_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
             )
+
+
+class HistoryExportView(HomeAssistantView):
+    """Handle compact binary history and statistics exports."""
+
+    url = "/api/history/export"
+    name = "api:history:export"
+    extra_urls = ["/api/history/export/{datetime}"]
+
+    async def get(
+        self, request: web.Request, datetime: str | None = None
+    ) -> web.StreamResponse:
+        """Export history and statistics over a period of time."""
+        datetime_ = None
+        query = request.query
+
+        if datetime and (datetime_ := dt_util.parse_datetime(datetime)) is None:
+            return self.json_message("Invalid datetime", HTTPStatus.BAD_REQUEST)
+
+        entity_ids = [
+            entity_id
+            for entity_id in query.get("filter_entity_id", "")
+            .strip()
+            .lower()
+            .split(",")
+            if entity_id
+        ]
+        statistic_ids = [
+            statistic_id
+            for statistic_id in query.get("statistic_ids", "").strip().split(",")
+            if statistic_id
+        ]
+        if not entity_ids and not statistic_ids:
+            return self.json_message(
+                "filter_entity_id or statistic_ids is missing", HTTPStatus.BAD_REQUEST
+            )
+        if not all(valid_entity_id(entity_id) for entity_id in entity_ids):
+            return self.json_message("Invalid filter_entity_id", HTTPStatus.BAD_REQUEST)
+        if (period := query.get("period", "hour")) not in EXPORT_PERIODS:
+            return self.json_message("Invalid period", HTTPStatus.BAD_REQUEST)
+
+        if datetime_:
+            start_time = dt_util.as_utc(datetime_)
+        else:
+            start_time = dt_util.utcnow() - _ONE_DAY
+
+        if end_time_str := query.get("end_time"):
+            if end_time := dt_util.parse_datetime(end_time_str):
+                end_time = dt_util.as_utc(end_time)
+            else:
+                return self.json_message("Invalid end_time", HTTPStatus.BAD_REQUEST)
+        else:
+            end_time = start_time + _ONE_DAY
+
+        hass = request.app[KEY_HASS]
+        return await self.async_stream(
+            request,
+            get_instance(hass).async_add_executor_job,
+            partial(
+                generate_export,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                statistic_ids,
+                cast(Literal["5minute", "day", "hour", "week", "month"], period),
+            ),
+            CONTENT_TYPE_HISTORY_EXPORT,
+        )
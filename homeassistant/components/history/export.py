@@ -0,0 +1,154 @@
+"""Compact binary export of history and statistics.
+
+The export is a sequence of little endian, struct packed blocks so it
+can be written while the rows are read from the database.
+
+Header:
+
+    4 bytes   magic b"HAHX"
+    uint8     format version
+
+Every series starts with:
+
+    uint8     series kind
+    uint16    length of the id, followed by the utf-8 encoded id
+    uint32    number of rows
+
+A state series (kind 1) continues with its columns:
+
+    float64[rows]  last updated timestamp
+    uint32         number of distinct states, followed by each state
+                   as uint16 length and utf-8 encoded state
+    uint32[rows]   index of the row state in the distinct states
+
+A statistics series (kind 2) continues with its columns:
+
+    float64[rows]  start timestamp
+    float64[rows]  mean, min, max, state and sum, one column each
+                   in that order; NaN when the value was not recorded
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime as dt
+import math
+import struct
+from typing import Any, Final, Literal
+
+from typing_extensions import Generator
+
+from homeassistant.components.recorder import history, statistics
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant
+
+CONTENT_TYPE_HISTORY_EXPORT: Final = "application/vnd.homeassistant.history-export"
+
+EXPORT_MAGIC: Final = b"HAHX"
+EXPORT_VERSION: Final = 1
+
+SERIES_STATES: Final = 1
+SERIES_STATISTICS: Final = 2
+
+STATISTIC_COLUMNS: Final = ("mean", "min", "max", "state", "sum")
+
+_HEADER = struct.Struct("<4sB")
+_SERIES = struct.Struct("<BH")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+
+
+def _pack_series_header(kind: int, series_id: str, rows: int) -> bytes:
+    """Pack the header of a series."""
+    encoded_id = series_id.encode()
+    return _SERIES.pack(kind, len(encoded_id)) + encoded_id + _UINT32.pack(rows)
+
+
+def _pack_float64(values: Iterable[float]) -> bytes:
+    """Pack a float64 column."""
+    column = list(values)
+    return struct.pack(f"<{len(column)}d", *column)
+
+
+def encode_state_series(entity_id: str, states: list[dict[str, Any]]) -> bytes:
+    """Encode compressed states of an entity as a state series."""
+    distinct: dict[str, int] = {}
+    indexes = [
+        distinct.setdefault(state[COMPRESSED_STATE_STATE], len(distinct))
+        for state in states
+    ]
+    return b"".join(
+        (
+            _pack_series_header(SERIES_STATES, entity_id, len(states)),
+            _pack_float64(state[COMPRESSED_STATE_LAST_UPDATED] for state in states),
+            _UINT32.pack(len(distinct)),
+            *(
+                _UINT16.pack(len(encoded)) + encoded
+                for encoded in (state.encode() for state in distinct)
+            ),
+            struct.pack(f"<{len(indexes)}I", *indexes),
+        )
+    )
+
+
+def encode_statistics_series(
+    statistic_id: str, rows: list[statistics.StatisticsRow]
+) -> bytes:
+    """Encode the rows of a statistic as a statistics series."""
+    return b"".join(
+        (
+            _pack_series_header(SERIES_STATISTICS, statistic_id, len(rows)),
+            _pack_float64(row["start"] for row in rows),
+            *(
+                _pack_float64(
+                    math.nan if (value := row.get(column)) is None else value
+                    for row in rows
+                )
+                for column in STATISTIC_COLUMNS
+            ),
+        )
+    )
+
+
+def generate_export(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    statistic_ids: list[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> Generator[bytes]:
+    """Generate the export one series at a time.
+
+    Each series is queried on its own so only the rows of a
+    single series are held in memory while it is encoded.
+    """
+    yield _HEADER.pack(EXPORT_MAGIC, EXPORT_VERSION)
+    with session_scope(hass=hass, read_only=True) as session:
+        for entity_id in entity_ids:
+            for states in history.get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                [entity_id],
+                None,
+                include_start_time_state=True,
+                significant_changes_only=False,
+                minimal_response=True,
+                no_attributes=True,
+                compressed_state_format=True,
+            ).values():
+                yield encode_state_series(entity_id, states)  # type: ignore[arg-type]
+    for statistic_id in statistic_ids:
+        for rows in statistics.statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            {statistic_id},
+            period,
+            None,
+            {"mean", "min", "max", "state", "sum"},
+        ).values():
+            yield encode_statistics_series(statistic_id, rows)
@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from bisect import bisect_right
+from dataclasses import dataclass, field
 import datetime
+import math
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.history.preload import (
+    async_preload_state_changes_during_period,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from . import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_TIMELINES: HassKey[dict[str, HistoryTimeline]] = HassKey(f"{DOMAIN}_timelines")
+
 
 @dataclass
 class HistoryStatsState:
@@ -32,6 +50,201 @@ class HistoryState:
     last_changed: float
 
 
+@dataclass(slots=True)
+class _TimelineTotals:
+    """Running totals of a timeline for a set of matching states.
+
+    The totals at an index are counted from the start of the timeline up
+    to the change at that index.
+    """
+
+    seconds: list[float] = field(default_factory=list)
+    changes: list[int] = field(default_factory=list)
+
+
+class HistoryTimeline:
+    """The state changes of an entity.
+
+    The first change is the state at the start of the timeline, or None
+    if the entity had no state yet. Changes before the timeline are
+    loaded from the database and added before the start.
+
+    A timeline shared by the history stats of an entity tracks the state
+    changes of the entity, it starts with the current state of the entity
+    if it has one when tracking starts. The changes no history stats needs anymore are
+    removed from the start, so the database only needs to be queried when
+    a period starts before the timeline. The timeline is dropped when no
+    history stats uses it anymore, as it would miss changes.
+
+    Running totals of the time spent in matching states and of the
+    changes to matching states are kept for each set of matching states,
+    so the stats of a period are found with a binary search. The changes
+    are loaded by one history stats at a time, so the others can use them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self._timestamps: list[float] = []
+        self._states: list[str | None] = []
+        self._totals: dict[frozenset[str], _TimelineTotals] = {}
+        self._history_stats: set[HistoryStats] = set()
+        self._starts: dict[HistoryStats, float] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self.load_lock = asyncio.Lock()
+
+    @property
+    def start(self) -> float:
+        """Return the start of the timeline, infinity if it has no changes."""
+        return self._timestamps[0] if self._timestamps else math.inf
+
+    @callback
+    def async_track_state_changes(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Start the timeline with the current state and add the state changes."""
+        if (state := hass.states.get(entity_id)) is not None:
+            self.async_add(state.state, state.last_changed.timestamp())
+        self._unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_changed
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change of the entity."""
+        if (new_state := event.data["new_state"]) is not None:
+            self.async_add(new_state.state, new_state.last_changed.timestamp())
+
+    @callback
+    def async_add_history_stats(self, history_stats: HistoryStats) -> None:
+        """Add a history stats using the timeline."""
+        self._history_stats.add(history_stats)
+
+    @callback
+    def async_remove_history_stats(self, history_stats: HistoryStats) -> bool:
+        """Remove a history stats and return if no history stats uses it."""
+        self._history_stats.discard(history_stats)
+        self._starts.pop(history_stats, None)
+        if self._history_stats:
+            return False
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        return True
+
+    @callback
+    def async_load(self, states: list[HistoryState], start: float) -> None:
+        """Add the state changes since the start before the timeline.
+
+        The first state is the state at the start, as the history is
+        fetched including the state at the start time. The changes which
+        are not before the timeline are known already and ignored.
+        """
+        timeline_start = self.start
+        if start >= timeline_start:
+            return
+        timestamps = [start]
+        entity_states = [states[0].state if states else None]
+        for state in states[1:]:
+            if state.last_changed >= timeline_start:
+                break
+            timestamps.append(state.last_changed)
+            entity_states.append(state.state)
+        self._timestamps[:0] = timestamps
+        self._states[:0] = entity_states
+        self._totals = {}
+
+    @callback
+    def async_add(self, state: str | None, timestamp: float) -> None:
+        """Add a state change.
+
+        The history stats of the entity add the same state changes as the
+        timeline, so changes which are not newer than the last one are
+        ignored.
+        """
+        if not self._timestamps:
+            self._timestamps.append(timestamp)
+            self._states.append(state)
+            return
+        if timestamp < (last_timestamp := self._timestamps[-1]):
+            return
+        if timestamp == last_timestamp:
+            if state == self._states[-1]:
+                return
+            # The totals at the last change depend on its state
+            self._states[-1] = state
+            for totals in self._totals.values():
+                del totals.seconds[len(self._states) - 1 :]
+                del totals.changes[len(self._states) - 1 :]
+            return
+        self._timestamps.append(timestamp)
+        self._states.append(state)
+
+    @callback
+    def async_set_start(self, history_stats: HistoryStats, start: float) -> None:
+        """Set the start of the period of a history stats.
+
+        Changes before the earliest start are removed once they make up
+        half of the timeline.
+        """
+        self._starts[history_stats] = start
+        index = bisect_right(self._timestamps, min(self._starts.values())) - 1
+        if index <= 0 or index * 2 < len(self._timestamps):
+            return
+        del self._timestamps[:index]
+        del self._states[:index]
+        for totals in self._totals.values():
+            del totals.seconds[:index]
+            del totals.changes[:index]
+
+    def _totals_for(self, entity_states: frozenset[str]) -> _TimelineTotals:
+        """Return the running totals for matching states up to the last change."""
+        if (totals := self._totals.get(entity_states)) is None:
+            totals = self._totals[entity_states] = _TimelineTotals()
+        seconds = totals.seconds
+        changes = totals.changes
+        timestamps = self._timestamps
+        states = self._states
+        if not seconds:
+            seconds.append(0.0)
+            changes.append(0)
+        for index in range(len(seconds), len(timestamps)):
+            previous_matches = states[index - 1] in entity_states
+            seconds.append(
+                seconds[-1]
+                + (timestamps[index] - timestamps[index - 1] if previous_matches else 0)
+            )
+            changes.append(
+                changes[-1] + (not previous_matches and states[index] in entity_states)
+            )
+        return totals
+
+    @callback
+    def async_compute_seconds_and_changes(
+        self, entity_states: frozenset[str], start: float, end: float, now: float
+    ) -> tuple[float, int]:
+        """Compute the seconds matched and changes of a period until now.
+
+        The start must not be before the start of the timeline.
+        """
+        totals = self._totals_for(entity_states)
+        timestamps = self._timestamps
+        states = self._states
+        first = bisect_right(timestamps, start) - 1
+        if end >= now:
+            # All changes are counted for a period which has not ended yet,
+            # including changes after now returned by the database
+            last = len(timestamps) - 1
+        else:
+            last = max(bisect_right(timestamps, end) - 1, first)
+        first_matches = states[first] in entity_states
+        seconds_matched = totals.seconds[last] - totals.seconds[first]
+        if first_matches:
+            seconds_matched -= start - timestamps[first]
+        # Count time elapsed between last state change and end of measure
+        if states[last] in entity_states:
+            seconds_matched += min(end, now) - timestamps[last]
+        match_count = first_matches + totals.changes[last] - totals.changes[first]
+        return seconds_matched, match_count
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -49,19 +262,35 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._previous_run_before_start = False
-        self._entity_states = set(entity_states)
+        self._tracking_timeline: HistoryTimeline | None = None
+        self._entity_states = frozenset(entity_states)
         self._duration = duration
         self._start = start
         self._end = end
 
+    @callback
+    def async_start_tracking(self) -> None:
+        """Start using the shared timeline of the entity."""
+        timelines = self.hass.data.setdefault(DATA_TIMELINES, {})
+        if (timeline := timelines.get(self.entity_id)) is None:
+            timeline = timelines[self.entity_id] = HistoryTimeline()
+            timeline.async_track_state_changes(self.hass, self.entity_id)
+        timeline.async_add_history_stats(self)
+        self._tracking_timeline = timeline
+
+    @callback
+    def async_stop_tracking(self) -> None:
+        """Stop using the shared timeline of the entity."""
+        if (timeline := self._tracking_timeline) is None:
+            return
+        self._tracking_timeline = None
+        if timeline.async_remove_history_stats(self):
+            del self.hass.data[DATA_TIMELINES][self.entity_id]
+
     async def async_update(
         self, event: Event[EventStateChangedData] | None
     ) -> HistoryStatsState:
         """Update the stats at a given time."""
-        # Get previous values of start and end
-        previous_period_start, previous_period_end = self._period
         # Parse templates
         self._period = async_calculate_period(self._duration, self._start, self._end)
         # Get the current period
@@ -70,138 +299,69 @@ class HistoryStats:
         # Convert times to UTC
         current_period_start = dt_util.as_utc(current_period_start)
         current_period_end = dt_util.as_utc(current_period_end)
-        previous_period_start = dt_util.as_utc(previous_period_start)
-        previous_period_end = dt_util.as_utc(previous_period_end)
 
         # Compute integer timestamps
         current_period_start_timestamp = floored_timestamp(current_period_start)
         current_period_end_timestamp = floored_timestamp(current_period_end)
-        previous_period_start_timestamp = floored_timestamp(previous_period_start)
-        previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
-            self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
-        #
-        # We avoid querying the database if the below did NOT happen:
-        #
-        # - The previous run happened before the start time
-        # - The start time changed
-        # - The period shrank in size
-        # - The previous period ended before now
-        #
-        if (
-            not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
-            and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
-            )
-        ):
-            new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
-                if (
-                    current_period_start_timestamp
-                    <= floored_timestamp(new_state.last_changed)
-                    <= current_period_end_timestamp
-                ):
-                    self._history_current_period.append(
-                        HistoryState(
-                            new_state.state, new_state.last_changed.timestamp()
-                        )
-                    )
-                    new_data = True
-            if not new_data and current_period_end_timestamp < now_timestamp:
-                # If period has not changed and current time after the period end...
-                # Don't compute anything as the value cannot have changed
-                return self._state
+
+        if (timeline := self._tracking_timeline) is None:
+            # The state changes are not tracked yet, e.g. before Home
+            # Assistant started, the period is loaded from the database
+            timeline = HistoryTimeline()
         else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
-            )
-            self._previous_run_before_start = False
+            if event and (new_state := event.data["new_state"]) is not None:
+                timeline.async_add(new_state.state, new_state.last_changed.timestamp())
+            # Set the start first, so the changes of the period are kept
+            # while the changes before the timeline are loaded
+            timeline.async_set_start(self, current_period_start_timestamp)
+        # The database is only queried if the period starts before the timeline,
+        # without changes the timeline is loaded until now or the end of the period
+        async with timeline.load_lock:
+            if current_period_start_timestamp < timeline.start:
+                await self._async_history_from_db(
+                    timeline,
+                    current_period_start_timestamp,
+                    min(
+                        timeline.start,
+                        max(current_period_end_timestamp, now_timestamp),
+                    ),
+                )
 
-        seconds_matched, match_count = self._async_compute_seconds_and_changes(
-            now_timestamp,
+        seconds_matched, match_count = timeline.async_compute_seconds_and_changes(
+            self._entity_states,
             current_period_start_timestamp,
             current_period_end_timestamp,
+            now_timestamp,
         )
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
     async def _async_history_from_db(
-        self,
-        current_period_start_timestamp: float,
-        current_period_end_timestamp: float,
+        self, timeline: HistoryTimeline, start_timestamp: float, end_timestamp: float
     ) -> None:
-        """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
-        )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
+        """Load the changes from the start until the end before the timeline."""
+        if timeline is self._tracking_timeline and self.hass.state is CoreState.running:
+            # Make sure the changes before the tracked changes are committed,
+            # the recorder only commits once Home Assistant has started
+            await get_instance(self.hass).async_block_till_done()
+        states = await async_preload_state_changes_during_period(
             self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
+            dt_util.utc_from_timestamp(start_timestamp),
+            dt_util.utc_from_timestamp(end_timestamp),
+            entity_id=self.entity_id,
             no_attributes=True,
-        ).get(self.entity_id, [])
-
-    def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
-    ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
         )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
-
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
-
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
-
-        # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
+        timeline.async_load(
+            [
+                HistoryState(state.state, state.last_changed.timestamp())
+                for state in states
+            ],
+            start_timestamp,
+        )
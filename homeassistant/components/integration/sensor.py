@@ -30,14 +30,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTime,
 )
-from homeassistant.core import (
-    CALLBACK_TYPE,
-    Event,
-    EventStateChangedData,
-    HomeAssistant,
-    State,
-    callback,
-)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
@@ -45,7 +38,12 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.numeric_source import (
+    NumericStateChangedData,
+    async_track_numeric_state_change,
+    decimal_state,
+)
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
@@ -107,7 +105,7 @@ class _IntegrationMethod(ABC):
 
     @abstractmethod
     def validate_states(
-        self, left: State, right: State
+        self, left: Decimal | None, right: Decimal | None
     ) -> tuple[Decimal, Decimal] | None:
         """Check state requirements for integration."""
 
@@ -130,13 +128,11 @@ class _Trapezoidal(_IntegrationMethod):
         return elapsed_time * (left + right) / 2
 
     def validate_states(
-        self, left: State, right: State
+        self, left: Decimal | None, right: Decimal | None
     ) -> tuple[Decimal, Decimal] | None:
-        if (left_dec := _decimal_state(left.state)) is None or (
-            right_dec := _decimal_state(right.state)
-        ) is None:
+        if left is None or right is None:
             return None
-        return (left_dec, right_dec)
+        return (left, right)
 
 
 class _Left(_IntegrationMethod):
@@ -146,11 +142,11 @@ class _Left(_IntegrationMethod):
         return self.calculate_area_with_one_state(elapsed_time, left)
 
     def validate_states(
-        self, left: State, right: State
+        self, left: Decimal | None, right: Decimal | None
     ) -> tuple[Decimal, Decimal] | None:
-        if (left_dec := _decimal_state(left.state)) is None:
+        if left is None:
             return None
-        return (left_dec, left_dec)
+        return (left, left)
 
 
 class _Right(_IntegrationMethod):
@@ -160,18 +156,11 @@ class _Right(_IntegrationMethod):
         return self.calculate_area_with_one_state(elapsed_time, right)
 
     def validate_states(
-        self, left: State, right: State
+        self, left: Decimal | None, right: Decimal | None
     ) -> tuple[Decimal, Decimal] | None:
-        if (right_dec := _decimal_state(right.state)) is None:
+        if right is None:
             return None
-        return (right_dec, right_dec)
-
-
-def _decimal_state(state: str) -> Decimal | None:
-    try:
-        return Decimal(state)
-    except (InvalidOperation, TypeError):
-        return None
+        return (right, right)
 
 
 _NAME_TO_INTEGRATION_METHOD: dict[str, type[_IntegrationMethod]] = {
@@ -449,23 +438,23 @@ class IntegrationSensor(RestoreSensor):
 
         if self._max_sub_interval is not None:
             source_state = self.hass.states.get(self._sensor_source_id)
-            self._schedule_max_sub_interval_exceeded_if_state_is_numeric(source_state)
+            self._schedule_max_sub_interval_exceeded_if_state_is_numeric(
+                source_state, decimal_state(source_state)
+            )
             self.async_on_remove(self._cancel_max_sub_interval_exceeded_callback)
             handle_state_change = self._integrate_on_state_change_and_max_sub_interval
         else:
             handle_state_change = self._integrate_on_state_change_callback
 
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                [self._sensor_source_id],
-                handle_state_change,
+            async_track_numeric_state_change(
+                self.hass, self._sensor_source_id, handle_state_change
             )
         )
 
     @callback
     def _integrate_on_state_change_and_max_sub_interval(
-        self, event: Event[EventStateChangedData]
+        self, change: NumericStateChangedData
     ) -> None:
         """Integrate based on state change and time.
 
@@ -473,29 +462,28 @@ class IntegrationSensor(RestoreSensor):
         reschedules time based integration.
         """
         self._cancel_max_sub_interval_exceeded_callback()
-        old_state = event.data["old_state"]
-        new_state = event.data["new_state"]
+        new_state = change.event.data["new_state"]
         try:
-            self._integrate_on_state_change(old_state, new_state)
+            self._integrate_on_state_change(change)
             self._last_integration_trigger = _IntegrationTrigger.StateChange
             self._last_integration_time = datetime.now(tz=UTC)
         finally:
             # When max_sub_interval exceeds without state change the source is assumed
             # constant with the last known state (new_state).
-            self._schedule_max_sub_interval_exceeded_if_state_is_numeric(new_state)
+            self._schedule_max_sub_interval_exceeded_if_state_is_numeric(
+                new_state, change.new_value
+            )
 
     @callback
     def _integrate_on_state_change_callback(
-        self, event: Event[EventStateChangedData]
+        self, change: NumericStateChangedData
     ) -> None:
         """Handle the sensor state changes."""
-        old_state = event.data["old_state"]
-        new_state = event.data["new_state"]
-        return self._integrate_on_state_change(old_state, new_state)
+        return self._integrate_on_state_change(change)
 
-    def _integrate_on_state_change(
-        self, old_state: State | None, new_state: State | None
-    ) -> None:
+    def _integrate_on_state_change(self, change: NumericStateChangedData) -> None:
+        old_state = change.event.data["old_state"]
+        new_state = change.event.data["new_state"]
         if old_state is None or new_state is None:
             return
 
@@ -507,7 +495,9 @@ class IntegrationSensor(RestoreSensor):
         self._attr_available = True
         self._derive_and_set_attributes_from_state(new_state)
 
-        if not (states := self._method.validate_states(old_state, new_state)):
+        if not (
+            states := self._method.validate_states(change.old_value, change.new_value)
+        ):
             self.async_write_ha_state()
             return
 
@@ -523,7 +513,7 @@ class IntegrationSensor(RestoreSensor):
         self.async_write_ha_state()
 
     def _schedule_max_sub_interval_exceeded_if_state_is_numeric(
-        self, source_state: State | None
+        self, source_state: State | None, source_state_dec: Decimal | None
     ) -> None:
         """Schedule possible integration using the source state and max_sub_interval.
 
@@ -536,7 +526,7 @@ class IntegrationSensor(RestoreSensor):
         if (
             self._max_sub_interval is not None
             and source_state is not None
-            and (source_state_dec := _decimal_state(source_state.state))
+            and source_state_dec
         ):
 
             @callback
@@ -556,7 +546,7 @@ class IntegrationSensor(RestoreSensor):
                 self._last_integration_trigger = _IntegrationTrigger.TimeElapsed
 
                 self._schedule_max_sub_interval_exceeded_if_state_is_numeric(
-                    source_state
+                    source_state, source_state_dec
                 )
 
             self._max_sub_interval_exceeded_callback = async_call_later(
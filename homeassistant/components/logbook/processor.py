@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Sequence
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 import logging
 from typing import Any
@@ -85,6 +85,7 @@ class LogbookRun:
     include_entity_name: bool
     format_time: Callable[[Row | EventAsRow], Any]
     memoize_new_contexts: bool = True
+    context_data_lookup: dict[bytes, dict[str, Any]] = field(default_factory=dict)
 
 
 class EventProcessor:
@@ -137,6 +138,7 @@ class EventProcessor:
         """
         self.logbook_run.event_cache.clear()
         self.logbook_run.context_lookup.clear()
+        self.logbook_run.context_data_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
     def get_events(
@@ -145,6 +147,19 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return list(self.iter_events(start_day, end_day))
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[dict[str, Any]]:
+        """Generate events for a period of time.
+
+        Rows for periods longer than a day are fetched in batches
+        so the events can be consumed while the query is still
+        being read.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -169,8 +184,18 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            yield from _humanify(
+                self.hass,
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    dt_util.as_utc(start_day),
+                    dt_util.as_utc(end_day),
+                    orm_rows=False,
+                ),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
 
     def humanify(
@@ -281,7 +306,9 @@ class ContextAugmenter:
 
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
+        self.logbook_run = logbook_run
         self.context_lookup = logbook_run.context_lookup
+        self.context_data_lookup = logbook_run.context_data_lookup
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
@@ -329,6 +356,26 @@ class ContextAugmenter:
             # this log entry.
             if _rows_match(row, context_row):
                 return
+
+        # The context data only depends on the origin row of the context
+        # so it is resolved once per context and reused for every other
+        # row that was caused by it.
+        if not self.logbook_run.memoize_new_contexts:
+            self._augment_from_context_row(data, context_row)
+            return
+        origin_context_id_bin: bytes = context_row.context_id_bin
+        if (
+            context_data := self.context_data_lookup.get(origin_context_id_bin)
+        ) is None:
+            context_data = {}
+            self._augment_from_context_row(context_data, context_row)
+            self.context_data_lookup[origin_context_id_bin] = context_data
+        data.update(context_data)
+
+    def _augment_from_context_row(
+        self, data: dict[str, Any], context_row: Row | EventAsRow
+    ) -> None:
+        """Augment data from the origin row of the context."""
         event_type = context_row.event_type
         # State change
         if context_entity_id := context_row.entity_id:
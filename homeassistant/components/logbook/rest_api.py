@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
 from http import HTTPStatus
-from typing import Any, cast
+from typing import Any
 
 from aiohttp import web
 import voluptuous as vol
@@ -54,7 +55,7 @@ class LogbookView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Retrieve logbook entries."""
         if datetime:
             if (datetime_dt := dt_util.parse_datetime(datetime)) is None:
@@ -107,15 +108,8 @@ class LogbookView(HomeAssistantView):
             include_entity_name=True,
         )
 
-        def json_events() -> web.Response:
-            """Fetch events and generate JSON."""
-            return self.json(
-                event_processor.get_events(
-                    start_day,
-                    end_day,
-                )
-            )
-
-        return cast(
-            web.Response, await get_instance(hass).async_add_executor_job(json_events)
+        return await self.async_stream_json(
+            request,
+            get_instance(hass).async_add_executor_job,
+            partial(event_processor.iter_events, start_day, end_day),
         )
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
-from operator import attrgetter
+from operator import attrgetter, ge
 import socket
 import ssl
 import time
@@ -77,6 +77,7 @@ from .const import (
     PROTOCOL_31,
     TRANSPORT_WEBSOCKETS,
 )
+from .matcher import TopicMatcher
 from .models import (
     DATA_MQTT,
     MessageCallbackType,
@@ -118,6 +119,13 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
+# Maximum number of published messages per QoS level which were handed
+# to paho but not yet written (QoS 0) or acknowledged (QoS 1 and 2).
+# Messages exceeding the limit wait in the publish queue.
+MAX_INFLIGHT_MESSAGES = (100, 20, 20)
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -208,6 +216,7 @@ def async_subscribe_internal(
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
     job_type: HassJobType | None = None,
+    coalesce: bool = False,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
@@ -215,6 +224,9 @@ def async_subscribe_internal(
     and may change at any time. It should not be considered
     a stable API.
 
+    If coalesce is set, only the latest message on a topic is passed
+    to the callback when multiple messages are read at once.
+
     Call the return value to unsubscribe.
     """
     try:
@@ -235,7 +247,9 @@ def async_subscribe_internal(
             translation_domain=DOMAIN,
             translation_placeholders={"topic": topic},
         )
-    return client.async_subscribe(topic, msg_callback, qos, encoding, job_type)
+    return client.async_subscribe(
+        topic, msg_callback, qos, encoding, job_type, coalesce
+    )
 
 
 @bind_hass
@@ -268,10 +282,23 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    coalesce: bool = False
+
+
+@dataclass(slots=True)
+class QueuedPublish:
+    """Class to hold a message waiting to be published."""
+
+    topic: str
+    payload: PublishPayloadType
+    qos: int
+    retain: bool
+    queued: float
+    # Set to the mid and result code when handed to paho
+    handed_over: asyncio.Future[tuple[int, int]]
 
 
 class MqttClientSetup:
@@ -457,12 +484,23 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions: TopicMatcher[Subscription] = TopicMatcher()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
+        # Messages read while reading available packets, they are handled
+        # once all were read to only pass the latest message on a topic to
+        # subscriptions that coalesce messages
+        self._reading_packets = False
+        self._read_messages: list[mqtt.MQTTMessage] = []
+        # Callbacks to run once all available packets were read
+        self._read_done_callbacks: list[Callable[[], None]] = []
+        # Messages waiting to be published in the order they were published
+        self._publish_queue: deque[QueuedPublish] = deque()
+        self._publish_inflight = [0, 0, 0]
+        self._publish_scheduled = False
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -575,7 +613,14 @@ class MQTT:
     @callback
     def _async_reader_callback(self, client: mqtt.Client) -> None:
         """Handle reading data from the socket."""
-        if (status := client.loop_read(MAX_PACKETS_TO_READ)) != 0:
+        self._reading_packets = True
+        try:
+            status = client.loop_read(MAX_PACKETS_TO_READ)
+        finally:
+            self._reading_packets = False
+            self._async_handle_read_messages()
+            self._async_run_read_done_callbacks()
+        if status != 0:
             self._async_on_disconnect(status)
 
     @callback
@@ -703,24 +748,111 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic_filter(topic)
         )
 
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
     ) -> None:
-        """Publish a MQTT message."""
-        msg_info = self._mqttc.publish(topic, payload, qos, retain)
-        _LOGGER.debug(
-            "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
-            " retained" if retain else "",
-            topic,
-            payload,
-            msg_info.mid,
-            qos,
+        """Publish a MQTT message.
+
+        The message is queued and handed to paho with the other messages
+        published in the same iteration of the event loop, so they are
+        written to the socket together.
+        """
+        queued = QueuedPublish(
+            topic, payload, qos, retain, time.monotonic(), self.loop.create_future()
+        )
+        self._publish_queue.append(queued)
+        mqtt_data = self._mqtt_data
+        mqtt_data.publish_queue_max_depth = max(
+            mqtt_data.publish_queue_max_depth, len(self._publish_queue)
+        )
+        self._async_schedule_publish()
+        handed_over = queued.handed_over
+        try:
+            mid, result_code = await handed_over
+        except asyncio.CancelledError:
+            # A cancelled message is skipped when the queue is processed
+            if not handed_over.cancelled() and handed_over.exception() is None:
+                self._publish_inflight[qos] -= 1
+            raise
+        try:
+            await self._async_wait_for_mid_or_raise(mid, result_code)
+        finally:
+            self._publish_inflight[qos] -= 1
+            if self._publish_queue:
+                self._async_schedule_publish()
+        mqtt_data.messages_published += 1
+        mqtt_data.publish_latency += time.monotonic() - queued.queued
+
+    @callback
+    def _async_schedule_publish(self) -> None:
+        """Schedule handing the queued messages to paho."""
+        if not self._publish_scheduled:
+            self._publish_scheduled = True
+            self.loop.call_soon(self._async_publish_queued)
+
+    @callback
+    def _async_publish_queued(self) -> None:
+        """Hand the queued messages to paho within the inflight limits.
+
+        Messages that are not retained, which are typically commands, are
+        handed over before retained messages, which typically echo state.
+        Otherwise messages are handed over in the order they were published.
+        Messages exceeding the limit of their QoS level wait until an inflight
+        message completes, later messages on the same topic wait behind them.
+        """
+        self._publish_scheduled = False
+        self._publish_queue = self._async_hand_over_queued(
+            self._publish_queue, commands_only=True
+        )
+        self._publish_queue = self._async_hand_over_queued(
+            self._publish_queue, commands_only=False
         )
-        await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
+
+    @callback
+    def _async_hand_over_queued(
+        self, publish_queue: deque[QueuedPublish], commands_only: bool
+    ) -> deque[QueuedPublish]:
+        """Hand queued messages to paho and return the messages still waiting."""
+        inflight = self._publish_inflight
+        waiting: deque[QueuedPublish] = deque()
+        waiting_topics: set[str] = set()
+        while publish_queue and not all(map(ge, inflight, MAX_INFLIGHT_MESSAGES)):
+            queued = publish_queue.popleft()
+            if queued.handed_over.done():
+                continue
+            qos = queued.qos
+            if (
+                (commands_only and queued.retain)
+                or inflight[qos] >= MAX_INFLIGHT_MESSAGES[qos]
+                or queued.topic in waiting_topics
+            ):
+                waiting.append(queued)
+                waiting_topics.add(queued.topic)
+                continue
+            try:
+                msg_info = self._mqttc.publish(
+                    queued.topic, queued.payload, qos, queued.retain
+                )
+            except Exception as err:  # noqa: BLE001
+                # Raise the error to the publisher, do not fail the others
+                queued.handed_over.set_exception(err)
+                continue
+            _LOGGER.debug(
+                "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
+                " retained" if queued.retain else "",
+                queued.topic,
+                queued.payload,
+                msg_info.mid,
+                qos,
+            )
+            inflight[qos] += 1
+            queued.handed_over.set_result((msg_info.mid, msg_info.rc))
+        waiting.extend(publish_queue)
+        return waiting
 
     async def async_connect(self, client_available: asyncio.Future[bool]) -> None:
         """Connect to the host. Does not process messages yet."""
@@ -827,7 +959,7 @@ class MQTT:
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
-            self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscriptions.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -845,7 +977,7 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -890,6 +1022,7 @@ class MQTT:
         qos: int,
         encoding: str | None = None,
         job_type: HassJobType | None = None,
+        coalesce: bool = False,
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos."""
         if not isinstance(topic, str):
@@ -908,9 +1041,10 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(
+            topic, is_simple_match, job, qos, encoding, coalesce
+        )
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1109,24 +1243,72 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    # The cache is bounded as topics may contain unique ids
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
     def _async_mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
+        if self._reading_packets:
+            self._read_messages.append(msg)
+            return
+        self._async_handle_message(msg)
+
+    @callback
+    def _async_handle_read_messages(self) -> None:
+        """Handle the messages read at once in the order they were received.
+
+        Multiple messages may be read at once when the broker sends a burst
+        of messages. Subscriptions that coalesce messages only receive the
+        latest message on a topic, when the other subscriptions receive it.
+        """
+        if not (messages := self._read_messages):
+            return
+        self._read_messages = []
+        if len(messages) == 1:
+            self._async_handle_message(messages[0])
+            return
+        topics: list[str | None] = []
+        latest_messages: dict[str, int] = {}
+        superseding_topics: set[str] = set()
+        for index, msg in enumerate(messages):
+            try:
+                topic = msg.topic
+            except UnicodeDecodeError:
+                topics.append(None)
+                continue
+            topics.append(topic)
+            if topic in latest_messages:
+                superseding_topics.add(topic)
+            latest_messages[topic] = index
+        for index, (msg, topic) in enumerate(zip(messages, topics, strict=True)):
+            if topic is None or topic not in superseding_topics:
+                self._async_handle_message(msg)
+            else:
+                self._async_handle_message(
+                    msg, superseded=latest_messages[topic] != index, superseding=True
+                )
+
+    @callback
+    def _async_handle_message(
+        self,
+        msg: mqtt.MQTTMessage,
+        superseded: bool = False,
+        superseding: bool = False,
+    ) -> None:
+        """Pass a received message to the matching subscriptions.
+
+        A superseded message is followed by a message on the same topic
+        which was read at the same time, and is not passed to subscriptions
+        that coalesce messages.
+        """
         try:
             # msg.topic is a property that decodes the topic to a string
             # every time it is accessed. Save the result to avoid
@@ -1153,6 +1335,12 @@ class MQTT:
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
 
         for subscription in subscriptions:
+            if superseding and subscription.coalesce:
+                # A superseded message must not mark a retained topic as seen
+                if superseded:
+                    self._mqtt_data.messages_dropped += 1
+                    continue
+                self._mqtt_data.messages_coalesced += 1
             if msg.retain:
                 retained_topics = self._retained_topics[subscription]
                 # Skip if the subscription already received a retained message
@@ -1205,6 +1393,30 @@ class MQTT:
                 self.hass.async_run_hass_job(job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
+    @callback
+    def async_call_when_read_done(self, read_done_callback: Callable[[], None]) -> None:
+        """Call a callback once all available packets were read.
+
+        The callback is called right away when no packets are being read.
+        A callback that is already waiting will only be called once.
+        """
+        if not self._reading_packets:
+            read_done_callback()
+        elif read_done_callback not in self._read_done_callbacks:
+            self._read_done_callbacks.append(read_done_callback)
+
+    @callback
+    def _async_run_read_done_callbacks(self) -> None:
+        """Run the callbacks waiting for all available packets to be read."""
+        if not (read_done_callbacks := self._read_done_callbacks):
+            return
+        self._read_done_callbacks = []
+        for read_done_callback in read_done_callbacks:
+            try:
+                read_done_callback()
+            except Exception:
+                _LOGGER.exception("Error running %s", read_done_callback)
+
     @callback
     def _async_mqtt_on_callback(
         self,
@@ -1311,13 +1523,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
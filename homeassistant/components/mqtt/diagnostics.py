@@ -45,7 +45,8 @@ def _async_get_diagnostics(
     device: DeviceEntry | None = None,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    mqtt_instance = hass.data[DATA_MQTT].client
+    mqtt_data = hass.data[DATA_MQTT]
+    mqtt_instance = mqtt_data.client
     if TYPE_CHECKING:
         assert mqtt_instance is not None
 
@@ -54,6 +55,17 @@ def _async_get_diagnostics(
     data = {
         "connected": is_connected(hass),
         "mqtt_config": redacted_config,
+        "mqtt_message_stats": {
+            "coalesced": mqtt_data.messages_coalesced,
+            "dropped": mqtt_data.messages_dropped,
+            "published": mqtt_data.messages_published,
+            "publish_latency": (
+                mqtt_data.publish_latency / mqtt_data.messages_published
+                if mqtt_data.messages_published
+                else None
+            ),
+            "publish_queue_max_depth": mqtt_data.publish_queue_max_depth,
+        },
     }
 
     if device:
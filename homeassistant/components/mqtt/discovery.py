@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections import deque
 import functools
 import logging
@@ -55,7 +54,7 @@ TOPIC_MATCHER = re.compile(
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}_{}"
 )
-MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
+MQTT_DISCOVERY_NEW: SignalTypeFormat[list[MQTTDiscoveryPayload]] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
 MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
@@ -190,30 +189,68 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
-    platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # New components by platform, waiting to be dispatched as a batch
+    new_components: dict[str, list[MQTTDiscoveryPayload]] = {}
+    # New components by platform, waiting for the platform to be set up
+    platform_setup_pending: dict[str, list[MQTTDiscoveryPayload]] = {}
 
     @callback
-    def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
-        """Add a component from a discovery message."""
+    def _async_dispatch_new_components() -> None:
+        """Dispatch the new components queued since the last dispatch."""
+        batches = new_components.copy()
+        new_components.clear()
+        for component, discovery_payloads in batches.items():
+            async_dispatcher_send(
+                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payloads
+            )
+
+    @callback
+    def _async_queue_component(discovery_payload: MQTTDiscoveryPayload) -> None:
+        """Queue a new component to be dispatched with the next batch."""
         discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
         component, discovery_id = discovery_hash
         message = f"Found new component: {component} {discovery_id}"
         async_log_discovery_origin_info(message, discovery_payload)
         mqtt_data.discovery_already_discovered.add(discovery_hash)
-        async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
-        )
+        new_components.setdefault(component, []).append(discovery_payload)
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
-            if component not in mqtt_data.platforms_loaded:
-                await async_forward_entry_setup_and_setup_discovery(
-                    hass, config_entry, {component}, late=True
+    @callback
+    def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
+        """Add a component from a discovery message."""
+        _async_queue_component(discovery_payload)
+        # Discovery messages usually arrive in bursts, e.g. the retained
+        # discovery messages after subscribing. The components discovered
+        # while reading a burst are validated and added to their platform
+        # in one go when all available packets were read.
+        mqtt_data.client.async_call_when_read_done(_async_dispatch_new_components)
+
+    async def _async_component_setup(component: str) -> None:
+        """Set up a platform and add the components discovered meanwhile."""
+        setup_failed = True
+        try:
+            await async_forward_entry_setup_and_setup_discovery(
+                hass, config_entry, {component}, late=True
+            )
+            setup_failed = False
+        except Exception:
+            _LOGGER.exception("Error setting up MQTT %s platform", component)
+        finally:
+            discovery_payloads = platform_setup_pending.pop(component)
+        if setup_failed:
+            for discovery_payload in discovery_payloads:
+                discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+                _LOGGER.error(
+                    "Discovered %s %s was not added as its platform failed to set up",
+                    *discovery_hash,
                 )
-        _async_add_component(discovery_payload)
+                # Process the next discovery message of the component again
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None
+                )
+            return
+        for discovery_payload in discovery_payloads:
+            _async_queue_component(discovery_payload)
+        _async_dispatch_new_components()
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
@@ -325,9 +362,11 @@ async def async_start(  # noqa: C901
 
         if component not in mqtt_data.platforms_loaded and payload:
             # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            if component in platform_setup_pending:
+                platform_setup_pending[component].append(payload)
+            else:
+                platform_setup_pending[component] = [payload]
+                config_entry.async_create_task(hass, _async_component_setup(component))
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
@@ -91,6 +91,8 @@ class MqttEvent(MqttEntity, EventEntity):
     _default_name = DEFAULT_NAME
     _entity_id_format = ENTITY_ID_FORMAT
     _attributes_extra_blocked = MQTT_EVENT_ATTRIBUTES_BLOCKED
+    # Every message is an event
+    _coalesce_messages = False
     _template: Callable[[ReceivePayloadType, PayloadSentinel], ReceivePayloadType]
 
     @staticmethod
@@ -0,0 +1,100 @@
+"""Match MQTT topics against subscriptions with wildcards."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator
+
+
+class _TopicNode[_T: Hashable]:
+    """A level of a topic filter in the trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicMatcher[_T: Hashable]:
+    """Trie of topic filters to find the values subscribed to a topic.
+
+    Matching a topic takes time proportional to the number of topic
+    levels instead of the number of topic filters. Topics starting with
+    `$` are not matched by wildcards on the first level as required by
+    the MQTT specification.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the matcher."""
+        self._root: _TopicNode[_T] = _TopicNode()
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all values."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.values
+            nodes.extend(node.children.values())
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.values.add(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path: list[tuple[_TopicNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        # Prune the levels that no longer lead to any value
+        for parent, level in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if there are values for exactly the topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        match_wildcards = not topic.startswith("$")
+        matches: list[_T] = []
+        nodes: list[tuple[_TopicNode[_T], int]] = [(self._root, 0)]
+        while nodes:
+            node, index = nodes.pop()
+            children = node.children
+            if index == depth:
+                matches.extend(node.values)
+            else:
+                if (child := children.get(levels[index])) is not None:
+                    nodes.append((child, index + 1))
+                if (match_wildcards or index) and (
+                    child := children.get("+")
+                ) is not None:
+                    nodes.append((child, index + 1))
+            # A multi level wildcard also matches the parent level
+            if (match_wildcards or index) and (child := children.get("#")) is not None:
+                matches.extend(child.values)
+        return matches
@@ -216,11 +216,7 @@ def async_setup_non_entity_entry_helper(
     async def _async_setup_non_entity_entry_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
     ) -> None:
-        """Set up an MQTT entity, automation or tag from discovery."""
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
+        """Set up an MQTT automation or tag from discovery."""
         try:
             config: ConfigType = discovery_schema(discovery_payload)
             await async_setup(config, discovery_data=discovery_payload.discovery_data)
@@ -229,13 +225,31 @@ def async_setup_non_entity_entry_helper(
             async_handle_schema_error(discovery_payload, err)
         except Exception:
             _handle_discovery_failure(hass, discovery_payload)
-            raise
+            _LOGGER.exception(
+                "Unexpected error setting up discovered MQTT %s item: %s",
+                domain,
+                discovery_payload,
+            )
+
+    @callback
+    def _async_setup_non_entity_entries_from_discovery(
+        discovery_payloads: list[MQTTDiscoveryPayload],
+    ) -> None:
+        """Set up MQTT automations or tags from a batch of discovery payloads."""
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            hass.async_create_task(
+                _async_setup_non_entity_entry_from_discovery(discovery_payload)
+            )
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_non_entity_entry_from_discovery,
+            _async_setup_non_entity_entries_from_discovery,
         )
     )
 
@@ -255,36 +269,46 @@ def async_setup_entity_entry_helper(
     mqtt_data = hass.data[DATA_MQTT]
 
     @callback
-    def _async_setup_entity_entry_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+    def _async_setup_entity_entries_from_discovery(
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity from discovery."""
+        """Set up MQTT entities from a batch of discovery payloads."""
         nonlocal entity_class
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            if schema_class_mapping is not None:
-                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-            if TYPE_CHECKING:
-                assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        entities: list[Entity] = []
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                if schema_class_mapping is not None:
+                    entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert entity_class is not None
+                entities.append(
+                    entity_class(hass, config, entry, discovery_payload.discovery_data)
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                # Do not let a single bad payload fail the rest of the batch
+                _handle_discovery_failure(hass, discovery_payload)
+                _LOGGER.exception(
+                    "Unexpected error setting up discovered MQTT %s item: %s",
+                    domain,
+                    discovery_payload,
+                )
+        # Add all entities of the batch to the platform in one go
+        if entities:
+            async_add_entities(entities)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_entity_entry_from_discovery,
+            _async_setup_entity_entries_from_discovery,
         )
     )
 
@@ -1054,6 +1078,8 @@ class MqttEntity(
     _attr_force_update = False
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # State updates only need the latest message received on a topic
+    _coalesce_messages = True
     _default_name: str | None
     _entity_id_format: str
 
@@ -1300,6 +1326,7 @@ class MqttEntity(
                 "qos": qos,
                 "encoding": encoding,
                 "job_type": HassJobType.Callback,
+                "coalesce": self._coalesce_messages and not self.force_update,
             }
             return True
         return False
@@ -8,7 +8,9 @@ from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
+import re
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import voluptuous as vol
@@ -21,6 +23,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, TemplateVarsType
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -45,6 +48,17 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+# Templates which only look up a value in the JSON payload,
+# e.g. `{{ value_json.temperature }}` or `{{ value_json['state'][0] }}`
+_JSON_PATH_TEMPLATE = re.compile(
+    r"\{\{\s*value_json((?:\.[A-Za-z_]\w*|\[(?:\d+|'[^'\\]*'|\"[^\"\\]*\")\])+)\s*\}\}"
+)
+_JSON_PATH_SEGMENT = re.compile(
+    r"\.(?P<attr>[A-Za-z_]\w*)|\[(?:(?P<index>\d+)|'(?P<sq>[^'\\]*)'|\"(?P<dq>[^\"\\]*)\")\]"
+)
+# Payloads are parsed once per message for all subscribers sharing a payload
+JSON_PAYLOAD_CACHE_SIZE = 256
+
 type PublishPayloadType = str | bytes | int | float | None
 
 
@@ -260,6 +274,55 @@ class MqttValueTemplateException(TemplateError):
         return self._message
 
 
+type _JsonPath = tuple[tuple[str | int, bool], ...]
+
+
+def _compile_json_path(value_template: str) -> _JsonPath | None:
+    """Compile a template that only looks up a value in the JSON payload.
+
+    Returns the keys to look up and whether they were accessed as attribute,
+    or None if the template does more than a lookup.
+    """
+    if not (match := _JSON_PATH_TEMPLATE.fullmatch(value_template.strip())):
+        return None
+    path: list[tuple[str | int, bool]] = []
+    for segment in _JSON_PATH_SEGMENT.finditer(match.group(1)):
+        if (attr := segment["attr"]) is not None:
+            path.append((attr, True))
+        elif (index := segment["index"]) is not None:
+            path.append((int(index), False))
+        else:
+            path.append(
+                (segment["sq"] if segment["sq"] is not None else segment["dq"], False)
+            )
+    return tuple(path)
+
+
+@lru_cache(maxsize=JSON_PAYLOAD_CACHE_SIZE)
+def _json_loads_payload(payload: str | bytes) -> Any:
+    """Parse a JSON payload.
+
+    The result is shared by all templates rendering the same payload
+    and must not be modified.
+    """
+    return json_loads(payload)
+
+
+def _lookup_json_path(value_json: Any, path: _JsonPath) -> Any:
+    """Look up a value in a parsed JSON payload.
+
+    Raises LookupError or TypeError if the value can't be looked up
+    the same way the template engine would.
+    """
+    for key, is_attr in path:
+        # The template engine prefers attributes like dict.items
+        # over items when a key is accessed as attribute
+        if is_attr and hasattr(value_json, key):  # type: ignore[arg-type]
+            raise LookupError(key)
+        value_json = value_json[key]
+    return value_json
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -275,9 +338,12 @@ class MqttValueTemplate:
         self._template_state: template.TemplateStateFromEntityId | None = None
         self._value_template = value_template
         self._config_attributes = config_attributes
+        self._json_path: _JsonPath | None = None
         if value_template is None:
             return
 
+        self._json_path = _compile_json_path(value_template.template)
+
         value_template.hass = hass
         self._entity = entity
 
@@ -297,6 +363,15 @@ class MqttValueTemplate:
         if self._value_template is None:
             return payload
 
+        if self._json_path is not None:
+            # Skip rendering the template if it only looks up a value,
+            # else fall back to rendering to handle errors the same way
+            try:
+                value_json = _json_loads_payload(payload)
+                return str(_lookup_json_path(value_json, self._json_path)).strip()
+            except (*JSON_DECODE_EXCEPTIONS, LookupError, TypeError):
+                pass
+
         values: dict[str, Any] = {}
 
         if variables is not None:
@@ -372,7 +447,7 @@ class EntityTopicState:
         self.subscribe_calls: dict[str, Entity] = {}
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+    def process_write_state_requests(self, msg: MQTTMessage | ReceiveMessage) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
             entity_id, entity = self.subscribe_calls.popitem()
@@ -415,6 +490,16 @@ class MqttData:
     discovery_unsubscribe: list[CALLBACK_TYPE] = field(default_factory=list)
     integration_unsubscribe: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     last_discovery: float = 0.0
+    # Deliveries of a message that superseded coalesced messages
+    messages_coalesced: int = 0
+    # Coalesced messages that were superseded and never delivered
+    messages_dropped: int = 0
+    # Messages published and acknowledged or written
+    messages_published: int = 0
+    # Total time from queueing to completion of the published messages
+    publish_latency: float = 0.0
+    # Maximum number of messages waiting in the publish queue
+    publish_queue_max_depth: int = 0
     platforms_loaded: set[Platform | str] = field(default_factory=set)
     reload_dispatchers: list[CALLBACK_TYPE] = field(default_factory=list)
     reload_handlers: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
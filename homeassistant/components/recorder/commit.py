@@ -0,0 +1,67 @@
+"""Adaptive commit interval for the recorder."""
+
+from __future__ import annotations
+
+from typing import Final
+
+# Grow the interval when at least this many items wait in the queue
+# after a commit, shrink it again once fewer than the low mark wait.
+COMMIT_BACKLOG_HIGH: Final = 1000
+COMMIT_BACKLOG_LOW: Final = 100
+
+# How far the interval may grow relative to the configured commit interval
+MAX_COMMIT_INTERVAL_FACTOR: Final = 6
+
+# Smallest interval used for databases other than SQLite
+MIN_COMMIT_INTERVAL: Final = 1.0
+
+
+class CommitController:
+    """Adapt the commit interval to the write load.
+
+    Under load the interval grows so more rows are written per
+    transaction. Once the queue drains it shrinks again to keep
+    the latency of recorded data low. On SQLite the configured
+    commit interval is never undercut since every commit syncs
+    the database file to disk.
+
+    The controller is updated from the recorder thread and the
+    interval is read from the event loop to schedule the commits.
+    """
+
+    __slots__ = (
+        "base_interval",
+        "min_interval",
+        "max_interval",
+        "interval",
+        "pending_rows",
+        "last_commit_duration",
+        "last_commit_rows",
+        "last_commit_backlog",
+    )
+
+    def __init__(self, commit_interval: float, is_sqlite: bool) -> None:
+        """Initialize the controller."""
+        self.base_interval = commit_interval
+        self.min_interval = (
+            commit_interval
+            if is_sqlite
+            else min(commit_interval, max(commit_interval / 2, MIN_COMMIT_INTERVAL))
+        )
+        self.max_interval = commit_interval * MAX_COMMIT_INTERVAL_FACTOR
+        self.interval = commit_interval
+        self.pending_rows = 0
+        self.last_commit_duration: float | None = None
+        self.last_commit_rows = 0
+        self.last_commit_backlog = 0
+
+    def record_commit(self, duration: float, backlog: int) -> None:
+        """Record a commit and adapt the interval to the remaining backlog."""
+        self.last_commit_duration = duration
+        self.last_commit_rows = self.pending_rows
+        self.last_commit_backlog = backlog
+        self.pending_rows = 0
+        if backlog >= COMMIT_BACKLOG_HIGH:
+            self.interval = min(self.interval * 2, self.max_interval)
+        elif backlog < COMMIT_BACKLOG_LOW:
+            self.interval = max(self.interval / 2, self.min_interval)
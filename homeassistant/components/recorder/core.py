@@ -35,10 +35,13 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
     EventStateChangedData,
+    HassJob,
+    HassJobType,
     HomeAssistant,
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -50,6 +53,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .commit import CommitController
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -193,6 +197,9 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.commit_controller = CommitController(
+            commit_interval, uri.startswith(SQLITE_URL_PREFIX)
+        )
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -242,6 +249,11 @@ class Recorder(threading.Thread):
         self._queue_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
+        self._commit_job = HassJob(
+            self._async_commit_and_reschedule,
+            "Recorder commit",
+            job_type=HassJobType.Callback,
+        )
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
@@ -364,6 +376,16 @@ class Recorder(threading.Thread):
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_commit_and_reschedule(self, now: datetime) -> None:
+        """Queue a commit and schedule the next one with the adapted interval."""
+        self._async_commit(now)
+        self._commit_listener = async_call_later(
+            self.hass,
+            self.commit_controller.interval,
+            self._commit_job,
+        )
+
     @callback
     def async_add_executor_job[_T](
         self, target: Callable[..., _T], *args: Any
@@ -662,11 +684,8 @@ class Recorder(threading.Thread):
 
         # If the commit interval is not 0, we need to commit periodically
         if self.commit_interval:
-            self._commit_listener = async_track_time_interval(
-                self.hass,
-                self._async_commit,
-                timedelta(seconds=self.commit_interval),
-                name="Recorder commit",
+            self._commit_listener = async_call_later(
+                self.hass, self.commit_controller.interval, self._commit_job
             )
 
         # Run nightly tasks at 4:12am
@@ -714,6 +733,7 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
+        self.commit_controller.pending_rows += 1
         session.add(obj)
 
     def _run(self) -> None:
@@ -1208,6 +1228,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        commit_start = time.monotonic()
 
         if (
             pending_last_reported
@@ -1227,6 +1248,9 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self.commit_controller.record_commit(
+            time.monotonic() - commit_start, self.backlog
+        )
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -229,6 +230,127 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ) is None:
+        return {}
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def iter_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> Iterator[Iterator[State | dict[str, Any]]]:
+    """Generate the significant states of each entity during a time period.
+
+    Like get_significant_states_with_session, but the rows of the query
+    are fetched in batches for periods longer than a day and converted
+    while they are consumed. The states of each entity must be consumed
+    before the next entity. Entities are generated in the order of
+    entity_ids and entities without states are skipped.
+    """
+    if (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ) is None:
+        return
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    # The query is ordered by metadata id, the states of entities which come
+    # before their turn in entity_ids are buffered. Entities with a lower
+    # metadata id than the current one which did not come have no states.
+    requested = iter(
+        [
+            entity_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        ]
+    )
+    next_entity_id = next(requested, None)
+    buffered: dict[str, list[State | dict[str, Any]]] = {}
+    for entity_id, states in _iter_entity_states(
+        execute_stmt_lambda_element(
+            session, stmt, start_time, end_time, orm_rows=False
+        ),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        False,
+        no_attributes,
+    ):
+        metadata_id = cast(int, entity_id_to_metadata_id[entity_id])
+        while (
+            next_entity_id is not None
+            and next_entity_id != entity_id
+            and (
+                next_entity_id in buffered
+                or cast(int, entity_id_to_metadata_id[next_entity_id]) < metadata_id
+            )
+        ):
+            if entity_states := buffered.pop(next_entity_id, None):
+                yield iter(entity_states)
+            next_entity_id = next(requested, None)
+        if entity_id != next_entity_id:
+            buffered[entity_id] = list(states)
+            continue
+        if (first_state := next(states, None)) is not None:
+            yield chain((first_state,), states)
+        next_entity_id = next(requested, None)
+    while next_entity_id is not None:
+        if entity_states := buffered.pop(next_entity_id, None):
+            yield iter(entity_states)
+        next_entity_id = next(requested, None)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, float | None, dict[str, int | None]] | None:
+    """Return the significant states statement of the entities.
+
+    Returns the statement, the start time of the states at the start time
+    if they are included and the metadata ids of the entities, or None if
+    no entity has states.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +359,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +397,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        stmt,
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -324,6 +442,7 @@ def _state_changed_during_period_stmt(
     end_time_ts: float | None,
     single_metadata_id: int,
     no_attributes: bool,
+    descending: bool,
     limit: int | None,
     include_start_time_state: bool,
     run_start_ts: float | None,
@@ -346,12 +465,23 @@ def _state_changed_during_period_stmt(
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    if limit:
-        stmt = stmt.limit(limit)
-    stmt = stmt.order_by(
-        States.metadata_id,
-        States.last_updated_ts,
-    )
+    if limit and descending:
+        # The newest states are selected, they are returned in ascending order
+        subquery = (
+            stmt.order_by(States.metadata_id, States.last_updated_ts.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = _select_from_subquery(
+            subquery, no_attributes, False, include_last_reported
+        ).order_by(subquery.c.metadata_id, subquery.c.last_updated_ts)
+    else:
+        if limit:
+            stmt = stmt.limit(limit)
+        stmt = stmt.order_by(
+            States.metadata_id,
+            States.last_updated_ts,
+        )
     if not include_start_time_state or not run_start_ts:
         return stmt
     return _select_from_subquery(
@@ -424,6 +554,7 @@ def state_changes_during_period(
                 end_time_ts,
                 single_metadata_id,
                 no_attributes,
+                descending,
                 limit,
                 include_start_time_state,
                 run_start_ts,
@@ -432,6 +563,7 @@ def state_changes_during_period(
             track_on=[
                 bool(end_time_ts),
                 no_attributes,
+                descending,
                 bool(limit),
                 include_start_time_state,
                 has_last_reported,
@@ -692,26 +824,44 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    field_map = _FIELD_MAP
-    state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
-        State | dict[str, Any],
-    ]
-    if compressed_state_format:
-        state_class = row_to_compressed_state
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
-
     # Set all entity IDs to empty lists in result set to maintain the order
     result: dict[str, list[State | dict[str, Any]]] = {
         entity_id: [] for entity_id in entity_ids
     }
-    metadata_id_to_entity_id: dict[int, str] = {}
-    metadata_id_to_entity_id = {
+    for entity_id, entity_states in _iter_entity_states(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(entity_states)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _iter_entity_states(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[tuple[str, Iterator[State | dict[str, Any]]]]:
+    """Convert SQL results into the states of each entity.
+
+    States must be sorted by entity_id and last_updated. The states of
+    an entity must be consumed before the next entity is generated.
+    """
+    metadata_id_to_entity_id: dict[int, str] = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
     # Get the states at the start time
@@ -722,89 +872,109 @@ def _sorted_states_to_dict(
             (metadata_id, iter(states)),
         )
     else:
-        key_func = itemgetter(field_map["metadata_id"])
+        key_func = itemgetter(_FIELD_MAP["metadata_id"])
         states_iter = groupby(states, key_func)
 
-    state_idx = field_map["state"]
-    last_updated_ts_idx = field_map["last_updated_ts"]
-
-    # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
-        if (
-            not minimal_response
-            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
-        ):
-            ent_results.extend(
-                state_class(
-                    db_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    db_state[state_idx],
-                    db_state[last_updated_ts_idx],
-                    False,
-                )
-                for db_state in group
-            )
-            continue
+        yield (
+            entity_id,
+            _rows_to_states(
+                group,
+                start_time_ts,
+                entity_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes,
+            ),
+        )
 
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
-            )
 
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
+def _rows_to_states(
+    group: Iterator[Row],
+    start_time_ts: float | None,
+    entity_id: str,
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[State | dict[str, Any]]:
+    """Convert the SQL results of a single entity into its states."""
+    field_map = _FIELD_MAP
+    state_class: Callable[
+        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ]
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
+
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    attr_cache: dict[str, dict[str, Any]] = {}
+
+    if not minimal_response or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        yield from (
+            state_class(
+                db_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                db_state[state_idx],
+                db_state[last_updated_ts_idx],
+                False,
             )
-            continue
+            for db_state in group
+        )
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if (first_state := next(group, None)) is None:
+        return
+    prev_state: str | None = first_state[state_idx]
+    yield state_class(
+        first_state,
+        attr_cache,
+        start_time_ts,
+        entity_id,
+        prev_state,  # type: ignore[arg-type]
+        first_state[last_updated_ts_idx],
+        no_attributes,
+    )
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
+    #
+    # minimal_response only makes sense with last_updated == last_updated
+    #
+    # We use last_updated for for last_changed since its the same
+    #
+    # With minimal response we do not care about attribute
+    # changes so we can filter out duplicate states
+    if compressed_state_format:
+        # Compressed state format uses the timestamp directly
+        yield from (
             {
                 attr_state: (prev_state := state),
-                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+                attr_time: row[last_updated_ts_idx],
             }
             for row in group
             if (state := row[state_idx]) != prev_state
         )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        return
+
+    # Non-compressed state format returns an ISO formatted string
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    yield from (
+        {
+            attr_state: (prev_state := state),
+            attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+        }
+        for row in group
+        if (state := row[state_idx]) != prev_state
+    )
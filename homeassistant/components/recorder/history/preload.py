@@ -0,0 +1,276 @@
+"""Batch the history queries of helpers loading their history when added.
+
+Helpers like statistics, filter and history_stats sensors load the recent
+history of their source entity when they are added. During startup this
+happens for all of them at the same time, so the queries are collected
+while the previous batch is running and queries for the same period of
+several entities are merged into a single query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import cast
+
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .. import get_instance, history
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HISTORY_PRELOADER: HassKey[HistoryPreloader] = HassKey(
+    "recorder_history_preloader"
+)
+
+_EPOCH = datetime.fromtimestamp(0, tz=dt_util.UTC)
+
+
+@dataclass(slots=True, frozen=True)
+class _StateChangesQuery:
+    """Query for the state changes of an entity during a period."""
+
+    entity_id: str
+    start_time: datetime | None
+    end_time: datetime | None
+    no_attributes: bool
+    descending: bool
+    limit: int | None
+    include_start_time_state: bool
+
+    @property
+    def merge_key(self) -> Hashable | None:
+        """Return the key of the queries which can be merged with this one.
+
+        Queries without a start time are limited to their last states and
+        would load the whole history if merged. The state at the start
+        time differs for each start time.
+        """
+        if self.start_time is None:
+            return None
+        return (
+            self.start_time if self.include_start_time_state else None,
+            self.end_time,
+            self.no_attributes,
+            self.include_start_time_state,
+        )
+
+    def fetch(self, hass: HomeAssistant) -> list[State]:
+        """Fetch the states of the query from the database."""
+        return history.state_changes_during_period(
+            hass,
+            self.start_time or _EPOCH,
+            self.end_time,
+            self.entity_id,
+            no_attributes=self.no_attributes,
+            descending=self.descending,
+            limit=self.limit,
+            include_start_time_state=self.include_start_time_state,
+        ).get(self.entity_id, [])
+
+    def select(self, states: list[State]) -> list[State]:
+        """Return the states of the query from the states of a merged query.
+
+        The merged query returns all states of the entity since the earliest
+        start time, including the ones which only changed attributes.
+        """
+        start_time = cast(datetime, self.start_time)
+        selected = [
+            state
+            for state in states
+            if state.last_changed == state.last_updated
+            and (self.include_start_time_state or state.last_updated > start_time)
+        ]
+        if self.descending:
+            # The newest states are returned when limited
+            if self.limit:
+                selected = selected[-self.limit :]
+            selected.reverse()
+        elif self.limit:
+            selected = selected[: self.limit]
+        return selected
+
+
+@dataclass(slots=True, frozen=True)
+class _LastStateChangesQuery:
+    """Query for the last state changes of an entity."""
+
+    entity_id: str
+    number_of_states: int
+
+    @property
+    def merge_key(self) -> Hashable | None:
+        """Return None as the last states of each entity are limited."""
+        return None
+
+    def fetch(self, hass: HomeAssistant) -> list[State]:
+        """Fetch the states of the query from the database."""
+        return history.get_last_state_changes(
+            hass, self.number_of_states, self.entity_id
+        ).get(self.entity_id, [])
+
+
+type _Query = _StateChangesQuery | _LastStateChangesQuery
+
+
+def _fetch_merged(
+    hass: HomeAssistant, queries: list[_StateChangesQuery]
+) -> dict[_Query, list[State]]:
+    """Fetch the states of queries of several entities with a single query."""
+    query = queries[0]
+    states = history.get_significant_states(
+        hass,
+        min(cast(datetime, query.start_time) for query in queries),
+        query.end_time,
+        sorted({query.entity_id for query in queries}),
+        None,
+        query.include_start_time_state,
+        significant_changes_only=False,
+        no_attributes=query.no_attributes,
+    )
+    return {
+        query: query.select(cast(list[State], states.get(query.entity_id, [])))
+        for query in queries
+    }
+
+
+def _fetch(
+    hass: HomeAssistant, queries: Iterable[_Query]
+) -> dict[_Query, list[State] | Exception]:
+    """Fetch the states of a batch of queries, merging them where possible."""
+    results: dict[_Query, list[State] | Exception] = {}
+    groups: defaultdict[Hashable, list[_StateChangesQuery]] = defaultdict(list)
+    single: list[_Query] = []
+    for query in queries:
+        if (key := query.merge_key) is None:
+            single.append(query)
+        else:
+            groups[key].append(cast(_StateChangesQuery, query))
+    for group in groups.values():
+        if len({query.entity_id for query in group}) == 1:
+            single.extend(group)
+            continue
+        try:
+            results.update(_fetch_merged(hass, group))
+        except Exception as err:  # noqa: BLE001
+            results.update(dict.fromkeys(group, err))
+    for query in single:
+        try:
+            results[query] = query.fetch(hass)
+        except Exception as err:  # noqa: BLE001
+            results[query] = err
+    return results
+
+
+class HistoryPreloader:
+    """Run history queries in batches.
+
+    Queries are collected while the previous batch is running in the
+    recorder executor. Equal queries are only run once.
+    """
+
+    __slots__ = ("_hass", "_pending", "_task")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the preloader."""
+        self._hass = hass
+        self._pending: dict[_Query, list[asyncio.Future[list[State]]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def async_fetch(self, query: _Query) -> list[State]:
+        """Return the states of a query once its batch ran."""
+        future: asyncio.Future[list[State]] = self._hass.loop.create_future()
+        self._pending.setdefault(query, []).append(future)
+        if self._task is None:
+            # Not started eagerly, so queries made at the same time are batched
+            self._task = self._hass.async_create_task(
+                self._async_run(), "recorder history preload", eager_start=False
+            )
+        return await future
+
+    async def _async_run(self) -> None:
+        """Run the pending queries until there are none left."""
+        instance = get_instance(self._hass)
+        pending: dict[_Query, list[asyncio.Future[list[State]]]] = {}
+        try:
+            while self._pending:
+                pending, self._pending = self._pending, {}
+                _LOGGER.debug("Fetching history for %s queries", len(pending))
+                try:
+                    results = await instance.async_add_executor_job(
+                        _fetch, self._hass, list(pending)
+                    )
+                except Exception as err:  # noqa: BLE001
+                    results = dict.fromkeys(pending, err)
+                for query, futures in pending.items():
+                    result = results[query]
+                    for future in futures:
+                        if future.done():
+                            continue
+                        if isinstance(result, Exception):
+                            future.set_exception(result)
+                        else:
+                            future.set_result(list(result))
+        finally:
+            self._task = None
+            # Don't leave callers waiting if the task is cancelled
+            for futures in (*pending.values(), *self._pending.values()):
+                for future in futures:
+                    future.cancel()
+            self._pending = {}
+
+
+def _get_preloader(hass: HomeAssistant) -> HistoryPreloader:
+    """Return the history preloader."""
+    if (preloader := hass.data.get(DATA_HISTORY_PRELOADER)) is None:
+        preloader = hass.data[DATA_HISTORY_PRELOADER] = HistoryPreloader(hass)
+    return preloader
+
+
+async def async_preload_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime | None,
+    end_time: datetime | None = None,
+    *,
+    entity_id: str,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> list[State]:
+    """Return the state changes of an entity during a period.
+
+    Like `state_changes_during_period`, but batched with the queries made
+    at the same time. A start time of None returns the states since the
+    history began.
+    """
+    return await _get_preloader(hass).async_fetch(
+        _StateChangesQuery(
+            entity_id.lower(),
+            start_time,
+            end_time,
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        )
+    )
+
+
+async def async_preload_last_state_changes(
+    hass: HomeAssistant, number_of_states: int, entity_id: str
+) -> list[State]:
+    """Return the last state changes of an entity.
+
+    Like `get_last_state_changes`, but batched with the queries made at
+    the same time.
+    """
+    return await _get_preloader(hass).async_fetch(
+        _LastStateChangesQuery(entity_id.lower(), number_of_states)
+    )
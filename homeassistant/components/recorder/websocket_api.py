@@ -495,6 +495,13 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        commit_controller = instance.commit_controller
+        commit = {
+            "interval": commit_controller.interval,
+            "last_duration": commit_controller.last_commit_duration,
+            "last_rows": commit_controller.last_commit_rows,
+            "last_backlog": commit_controller.last_commit_backlog,
+        }
     else:
         backlog = None
         migration_in_progress = False
@@ -502,9 +509,11 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        commit = None
 
     recorder_info = {
         "backlog": backlog,
+        "commit": commit,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
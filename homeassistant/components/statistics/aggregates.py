@@ -0,0 +1,322 @@
+"""Incrementally updated aggregates over the samples of a statistics sensor."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from fractions import Fraction
+import math
+import sys
+
+# Bit width used to correctly round square roots, as done by `statistics.stdev`
+_SQRT_BIT_WIDTH = 2 * sys.float_info.mant_dig + 3
+
+
+def _integer_sqrt_of_frac_rto(numerator: int, denominator: int) -> int:
+    """Return the square root of a fraction rounded to an integer using round-to-odd."""
+    root = math.isqrt(numerator // denominator)
+    return root | (root * root * denominator != numerator)
+
+
+def float_sqrt_of_fraction(value: Fraction) -> float:
+    """Return the square root of a fraction as a correctly rounded float."""
+    numerator, denominator = value.numerator, value.denominator
+    shift = (numerator.bit_length() - denominator.bit_length() - _SQRT_BIT_WIDTH) // 2
+    if shift >= 0:
+        return float(
+            _integer_sqrt_of_frac_rto(numerator, denominator << 2 * shift) << shift
+        )
+    return _integer_sqrt_of_frac_rto(numerator << -2 * shift, denominator) / (
+        1 << -shift
+    )
+
+
+class ExactSum:
+    """Exact sum of floats that supports removing values.
+
+    Floats are fractions with a power of two as denominator. The sum is
+    kept as an integer numerator over the largest denominator seen, so
+    adding and removing values doesn't accumulate rounding errors.
+    """
+
+    __slots__ = ("_numerator", "_denominator", "_not_finite")
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self._numerator = 0
+        self._denominator = 1
+        self._not_finite = 0
+
+    def _scale(self, numerator: int, denominator: int) -> int:
+        """Return the numerator scaled to the denominator of the sum."""
+        if denominator > self._denominator:
+            self._numerator *= denominator // self._denominator
+            self._denominator = denominator
+        return numerator * (self._denominator // denominator)
+
+    def add(self, value: float, square: bool = False) -> None:
+        """Add a value or its square to the sum."""
+        if not math.isfinite(value):
+            self._not_finite += 1
+            return
+        numerator, denominator = value.as_integer_ratio()
+        if square:
+            numerator, denominator = numerator * numerator, denominator * denominator
+        scaled = self._scale(numerator, denominator)
+        self._numerator += scaled
+
+    def remove(self, value: float, square: bool = False) -> None:
+        """Remove a value or its square which was added before."""
+        if not math.isfinite(value):
+            self._not_finite -= 1
+            return
+        numerator, denominator = value.as_integer_ratio()
+        if square:
+            numerator, denominator = numerator * numerator, denominator * denominator
+        scaled = self._scale(numerator, denominator)
+        self._numerator -= scaled
+
+    @property
+    def value(self) -> Fraction | None:
+        """Return the exact sum or None if a value is not finite."""
+        if self._not_finite:
+            return None
+        return Fraction(self._numerator, self._denominator)
+
+
+class WindowAggregate(ABC):
+    """Aggregate over the samples in the buffer of a statistics sensor.
+
+    The buffers are passed after a sample was appended and before the
+    oldest sample is removed.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+
+    @abstractmethod
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+
+
+class SumAggregate(WindowAggregate):
+    """Sum of the samples and optionally of their squares."""
+
+    __slots__ = ("values", "squares")
+
+    def __init__(self, squares: bool = False) -> None:
+        """Initialize the aggregate."""
+        self.values = ExactSum()
+        self.squares = ExactSum() if squares else None
+
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+        value = states[-1]
+        self.values.add(value)
+        if self.squares is not None:
+            self.squares.add(value, square=True)
+
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+        value = states[0]
+        self.values.remove(value)
+        if self.squares is not None:
+            self.squares.remove(value, square=True)
+
+    def sum_of_squared_deviations(self, count: int) -> Fraction | None:
+        """Return the sum of squared deviations from the mean of the samples."""
+        assert self.squares is not None
+        if (total := self.values.value) is None or (
+            squares := self.squares.value
+        ) is None:
+            return None
+        return (count * squares - total * total) / count
+
+
+class CircularSumAggregate(WindowAggregate):
+    """Sum of the sine and cosine of samples which are angles in degrees."""
+
+    __slots__ = ("sin", "cos")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self.sin = ExactSum()
+        self.cos = ExactSum()
+
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+        if not math.isfinite(value := states[-1]):
+            # The sums are unknown while the sample is in the buffer
+            self.sin.add(math.nan)
+            self.cos.add(math.nan)
+            return
+        radians = math.radians(value)
+        self.sin.add(math.sin(radians))
+        self.cos.add(math.cos(radians))
+
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+        if not math.isfinite(value := states[0]):
+            self.sin.remove(math.nan)
+            self.cos.remove(math.nan)
+            return
+        radians = math.radians(value)
+        self.sin.remove(math.sin(radians))
+        self.cos.remove(math.cos(radians))
+
+
+class PairwiseSumAggregate(WindowAggregate):
+    """Sum of a term calculated from each pair of consecutive samples."""
+
+    __slots__ = ("term", "values")
+
+    def __init__(
+        self, term: Callable[[float | bool, datetime, float | bool, datetime], float]
+    ) -> None:
+        """Initialize the aggregate."""
+        self.term = term
+        self.values = ExactSum()
+
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+        if len(states) >= 2:
+            self.values.add(self.term(states[-2], ages[-2], states[-1], ages[-1]))
+
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+        if len(states) >= 2:
+            self.values.remove(self.term(states[0], ages[0], states[1], ages[1]))
+
+
+class CountAggregate(WindowAggregate):
+    """Number of samples which are on."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self.count = 0
+
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+        if states[-1] is True:
+            self.count += 1
+
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+        if states[0] is True:
+            self.count -= 1
+
+
+class ExtremesAggregate(WindowAggregate):
+    """Minimum and maximum of the samples using monotonic queues.
+
+    Each queue holds the sequence number and value of the samples which
+    can still become the extreme, so the extreme is always the first one.
+    Of equal values the oldest one is kept, like `max` and `min` do.
+    """
+
+    __slots__ = ("_minimums", "_maximums", "_added", "_removed", "_nan")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._minimums: deque[tuple[int, float]] = deque()
+        self._maximums: deque[tuple[int, float]] = deque()
+        self._added = 0
+        self._removed = 0
+        self._nan = 0
+
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+        value = states[-1]
+        sequence = self._added
+        self._added += 1
+        if math.isnan(value):
+            self._nan += 1
+            return
+        minimums = self._minimums
+        while minimums and minimums[-1][1] > value:
+            minimums.pop()
+        minimums.append((sequence, value))
+        maximums = self._maximums
+        while maximums and maximums[-1][1] < value:
+            maximums.pop()
+        maximums.append((sequence, value))
+
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+        sequence = self._removed
+        self._removed += 1
+        if math.isnan(states[0]):
+            self._nan -= 1
+            return
+        if self._minimums[0][0] == sequence:
+            self._minimums.popleft()
+        if self._maximums[0][0] == sequence:
+            self._maximums.popleft()
+
+    @property
+    def minimum_index(self) -> int | None:
+        """Return the index of the minimum in the buffer or None if unknown."""
+        if self._nan or not self._minimums:
+            return None
+        return self._minimums[0][0] - self._removed
+
+    @property
+    def maximum_index(self) -> int | None:
+        """Return the index of the maximum in the buffer or None if unknown."""
+        if self._nan or not self._maximums:
+            return None
+        return self._maximums[0][0] - self._removed
+
+
+class SortedAggregate(WindowAggregate):
+    """The samples in sorted order for order statistics."""
+
+    __slots__ = ("values", "_nan")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self.values: list[float] = []
+        self._nan = 0
+
+    def sample_added(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate after a sample was appended."""
+        if math.isnan(value := states[-1]):
+            self._nan += 1
+            return
+        insort(self.values, value)
+
+    def sample_removing(
+        self, states: deque[float | bool], ages: deque[datetime]
+    ) -> None:
+        """Update the aggregate before the oldest sample is removed."""
+        if math.isnan(value := states[0]):
+            self._nan -= 1
+            return
+        del self.values[bisect_left(self.values, value)]
+
+    @property
+    def sorted_values(self) -> list[float] | None:
+        """Return the sorted samples or None if a sample is not a number."""
+        if self._nan:
+            return None
+        return self.values
@@ -6,6 +6,7 @@ from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
+from fractions import Fraction
 import logging
 import math
 import statistics
@@ -14,7 +15,9 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.history.preload import (
+    async_preload_state_changes_during_period,
+)
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     PLATFORM_SCHEMA,
@@ -54,6 +57,16 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregates import (
+    CircularSumAggregate,
+    CountAggregate,
+    ExtremesAggregate,
+    PairwiseSumAggregate,
+    SortedAggregate,
+    SumAggregate,
+    WindowAggregate,
+    float_sqrt_of_fraction,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -324,6 +337,9 @@ class StatisticsSensor(SensorEntity):
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
+        self._aggregate: WindowAggregate | None = self._create_aggregate(
+            self._state_characteristic
+        )
 
         self._update_listener: CALLBACK_TYPE | None = None
 
@@ -372,10 +388,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._add_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._add_sample(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -388,6 +403,22 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _add_sample(self, value: float | bool, age: datetime) -> None:
+        """Add a sample to the buffer, removing the oldest sample if it is full."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._remove_oldest_sample()
+        self.states.append(value)
+        self.ages.append(age)
+        if self._aggregate is not None:
+            self._aggregate.sample_added(self.states, self.ages)
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        if self._aggregate is not None:
+            self._aggregate.sample_removing(self.states, self.ages)
+        self.ages.popleft()
+        self.states.popleft()
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -499,8 +530,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -561,10 +591,10 @@ class StatisticsSensor(SensorEntity):
         self._async_purge_update_and_schedule()
         self.async_write_ha_state()
 
-    def _fetch_states_from_database(self) -> list[State]:
+    async def _async_fetch_states_from_database(self) -> list[State]:
         """Fetch the states from the database."""
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-        lower_entity_id = self._source_entity_id.lower()
+        start_date: datetime | None = None
         if self._samples_max_age is not None:
             start_date = (
                 dt_util.utcnow() - self._samples_max_age - timedelta(microseconds=1)
@@ -575,16 +605,15 @@ class StatisticsSensor(SensorEntity):
                 start_date,
             )
         else:
-            start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        return await async_preload_state_changes_during_period(
             self.hass,
             start_date,
-            entity_id=lower_entity_id,
+            entity_id=self._source_entity_id,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
+        )
 
     async def _initialize_from_database(self) -> None:
         """Initialize the list of states from the database.
@@ -596,9 +625,7 @@ class StatisticsSensor(SensorEntity):
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
-        ):
+        if states := await self._async_fetch_states_from_database():
             for state in reversed(states):
                 self._add_state_to_queue(state)
 
@@ -650,29 +677,93 @@ class StatisticsSensor(SensorEntity):
         )
         return function
 
+    def _create_aggregate(self, characteristic: str) -> WindowAggregate | None:
+        """Return the aggregate to update incrementally for a characteristic.
+
+        Characteristics which only look at the first or last samples
+        don't need an aggregate.
+        """
+        if self.is_binary:
+            if characteristic == STAT_AVERAGE_STEP:
+                return PairwiseSumAggregate(_binary_on_seconds)
+            if characteristic in (
+                STAT_AVERAGE_TIMELESS,
+                STAT_COUNT_BINARY_ON,
+                STAT_COUNT_BINARY_OFF,
+                STAT_MEAN,
+            ):
+                return CountAggregate()
+            return None
+        if characteristic == STAT_AVERAGE_LINEAR:
+            return PairwiseSumAggregate(_linear_area)
+        if characteristic == STAT_AVERAGE_STEP:
+            return PairwiseSumAggregate(_step_area)
+        if characteristic in (STAT_AVERAGE_TIMELESS, STAT_MEAN, STAT_SUM, STAT_TOTAL):
+            return SumAggregate()
+        if characteristic in (
+            STAT_DISTANCE_95P,
+            STAT_DISTANCE_99P,
+            STAT_STANDARD_DEVIATION,
+            STAT_VARIANCE,
+        ):
+            return SumAggregate(squares=True)
+        if characteristic in (
+            STAT_DATETIME_VALUE_MAX,
+            STAT_DATETIME_VALUE_MIN,
+            STAT_DISTANCE_ABSOLUTE,
+            STAT_VALUE_MAX,
+            STAT_VALUE_MIN,
+        ):
+            return ExtremesAggregate()
+        if characteristic == STAT_MEAN_CIRCULAR:
+            return CircularSumAggregate()
+        if characteristic in (STAT_MEDIAN, STAT_PERCENTILE):
+            return SortedAggregate()
+        if characteristic in (STAT_NOISINESS, STAT_SUM_DIFFERENCES):
+            return PairwiseSumAggregate(_difference)
+        if characteristic == STAT_SUM_DIFFERENCES_NONNEGATIVE:
+            return PairwiseSumAggregate(_nonnegative_difference)
+        return None
+
+    def _pairwise_sum(self) -> float:
+        """Return the sum of the pairwise aggregate."""
+        aggregate = cast(PairwiseSumAggregate, self._aggregate)
+        if (total := aggregate.values.value) is not None:
+            return float(total)
+        # Not finite, sum the terms like the aggregate would
+        return sum(
+            aggregate.term(
+                self.states[i - 1], self.ages[i - 1], self.states[i], self.ages[i]
+            )
+            for i in range(1, len(self.states))
+        )
+
+    def _extreme_index(self, maximum: bool) -> int:
+        """Return the index of the minimum or maximum sample."""
+        aggregate = cast(ExtremesAggregate, self._aggregate)
+        index = aggregate.maximum_index if maximum else aggregate.minimum_index
+        if index is None:
+            # Compare like max and min do when a sample is not a number
+            return self.states.index(max(self.states) if maximum else min(self.states))
+        return index
+
+    def _sum_of_squared_deviations(self) -> Fraction | None:
+        """Return the sum of squared deviations from the mean."""
+        aggregate = cast(SumAggregate, self._aggregate)
+        return aggregate.sum_of_squared_deviations(len(self.states))
+
     # Statistics for numeric sensor
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = self._pairwise_sum()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = self._pairwise_sum()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -712,12 +803,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self.ages[self._extreme_index(maximum=True)]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self.ages[self._extreme_index(maximum=False)]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -732,24 +823,44 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return (
+                self.states[self._extreme_index(maximum=True)]
+                - self.states[self._extreme_index(maximum=False)]
+            )
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            aggregate = cast(SumAggregate, self._aggregate)
+            if (total := aggregate.values.value) is None:
+                return statistics.mean(self.states)
+            # Same as statistics.mean which also divides the exact sum
+            return float(total / len(self.states))
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
-            return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+            aggregate = cast(CircularSumAggregate, self._aggregate)
+            if (sin_sum := aggregate.sin.value) is None or (
+                cos_sum := aggregate.cos.value
+            ) is None:
+                sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
+                cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+            return (
+                math.degrees(math.atan2(float(sin_sum), float(cos_sum))) + 360
+            ) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            aggregate = cast(SortedAggregate, self._aggregate)
+            if (values := aggregate.sorted_values) is None:
+                return statistics.median(self.states)
+            # Same as statistics.median on the sorted samples
+            count = len(values)
+            if count % 2 == 1:
+                return values[count // 2]
+            return (values[count // 2 - 1] + values[count // 2]) / 2
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -759,34 +870,44 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            aggregate = cast(SortedAggregate, self._aggregate)
+            if (values := aggregate.sorted_values) is None:
+                percentiles = statistics.quantiles(
+                    self.states, n=100, method="exclusive"
+                )
+                return percentiles[self._percentile - 1]
+            # Same as the exclusive method of statistics.quantiles
+            count = len(values)
+            position = self._percentile * (count + 1)
+            index = min(max(position // 100, 1), count - 1)
+            delta = position - index * 100
+            return (values[index - 1] * (100 - delta) + values[index] * delta) / 100
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            if (squared_deviations := self._sum_of_squared_deviations()) is None:
+                return statistics.stdev(self.states)
+            # Same as statistics.stdev which also rounds the square root correctly
+            return float_sqrt_of_fraction(squared_deviations / (len(self.states) - 1))
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            aggregate = cast(SumAggregate, self._aggregate)
+            if (total := aggregate.values.value) is None:
+                return sum(self.states)
+            return float(total)
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._pairwise_sum()
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._pairwise_sum()
         return None
 
     def _stat_total(self) -> StateType:
@@ -794,27 +915,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self.states[self._extreme_index(maximum=True)]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self.states[self._extreme_index(maximum=False)]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            if (squared_deviations := self._sum_of_squared_deviations()) is None:
+                return statistics.variance(self.states)
+            # Same as statistics.variance which also divides the exact sums
+            return float(squared_deviations / (len(self.states) - 1))
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = self._pairwise_sum()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -826,10 +947,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return cast(CountAggregate, self._aggregate).count
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - cast(CountAggregate, self._aggregate).count
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -839,5 +960,44 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return (
+                100.0 / len(self.states) * cast(CountAggregate, self._aggregate).count
+            )
         return None
+
+
+def _linear_area(
+    previous: float, previous_age: datetime, value: float, age: datetime
+) -> float:
+    """Return the area below the line between two samples."""
+    return 0.5 * (value + previous) * (age - previous_age).total_seconds()
+
+
+def _step_area(
+    previous: float, previous_age: datetime, value: float, age: datetime
+) -> float:
+    """Return the area below the previous sample until the next sample."""
+    return previous * (age - previous_age).total_seconds()
+
+
+def _difference(
+    previous: float, previous_age: datetime, value: float, age: datetime
+) -> float:
+    """Return the absolute difference between two samples."""
+    return abs(value - previous)
+
+
+def _nonnegative_difference(
+    previous: float, previous_age: datetime, value: float, age: datetime
+) -> float:
+    """Return the difference between two samples, or the value after a reset."""
+    return value - previous if value >= previous else value - 0
+
+
+def _binary_on_seconds(
+    previous: bool, previous_age: datetime, value: bool, age: datetime
+) -> float:
+    """Return the seconds a binary sensor was on until the next sample."""
+    if previous is True:
+        return (age - previous_age).total_seconds()
+    return 0
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from decimal import Decimal, DecimalException, InvalidOperation
+from decimal import Decimal, InvalidOperation
 import logging
 from typing import Any, Self
 
@@ -28,7 +28,6 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_UNIQUE_ID,
     STATE_UNAVAILABLE,
-    STATE_UNKNOWN,
 )
 from homeassistant.core import (
     Event,
@@ -49,6 +48,10 @@ from homeassistant.helpers.event import (
     async_track_point_in_time,
     async_track_state_change_event,
 )
+from homeassistant.helpers.numeric_source import (
+    NumericStateChangedData,
+    async_track_numeric_state_change,
+)
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.template import is_number
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -435,28 +438,13 @@ class UtilityMeterSensor(RestoreSensor):
         self._state = 0
         self.async_write_ha_state()
 
-    @staticmethod
-    def _validate_state(state: State | None) -> Decimal | None:
-        """Parse the state as a Decimal if available. Throws DecimalException if the state is not a number."""
-        try:
-            return (
-                None
-                if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]
-                else Decimal(state.state)
-            )
-        except DecimalException:
-            return None
-
-    def calculate_adjustment(
-        self, old_state: State | None, new_state: State
+    def _calculate_adjustment(
+        self,
+        old_state: State | None,
+        old_state_val: Decimal | None,
+        new_state_val: Decimal,
     ) -> Decimal | None:
-        """Calculate the adjustment based on the old and new state."""
-
-        # First check if the new_state is valid (see discussion in PR #88446)
-        if (new_state_val := self._validate_state(new_state)) is None:
-            _LOGGER.warning("Invalid state %s", new_state.state)
-            return None
-
+        """Calculate the adjustment based on the parsed old and new state."""
         if self._sensor_delta_values:
             return new_state_val
 
@@ -466,7 +454,7 @@ class UtilityMeterSensor(RestoreSensor):
         ):  # Fallback to old_state if sensor is periodically resetting but last_valid_state is None
             return new_state_val - self._last_valid_state
 
-        if (old_state_val := self._validate_state(old_state)) is not None:
+        if old_state_val is not None:
             return new_state_val - old_state_val
 
         _LOGGER.debug(
@@ -479,7 +467,7 @@ class UtilityMeterSensor(RestoreSensor):
         return None
 
     @callback
-    def async_reading(self, event: Event[EventStateChangedData]) -> None:
+    def async_reading(self, change: NumericStateChangedData) -> None:
         """Handle the sensor state changes."""
         if (
             source_state := self.hass.states.get(self._sensor_source_id)
@@ -491,14 +479,14 @@ class UtilityMeterSensor(RestoreSensor):
 
         self._attr_available = True
 
-        old_state = event.data["old_state"]
-        new_state = event.data["new_state"]
+        old_state = change.event.data["old_state"]
+        new_state = change.event.data["new_state"]
         if new_state is None:
             return
         new_state_attributes: Mapping[str, Any] = new_state.attributes or {}
 
         # First check if the new_state is valid (see discussion in PR #88446)
-        if (new_state_val := self._validate_state(new_state)) is None:
+        if (new_state_val := change.new_value) is None:
             _LOGGER.warning(
                 "%s received an invalid new state from %s : %s",
                 self.name,
@@ -521,7 +509,9 @@ class UtilityMeterSensor(RestoreSensor):
                     )
 
         if (
-            adjustment := self.calculate_adjustment(old_state, new_state)
+            adjustment := self._calculate_adjustment(
+                old_state, change.old_value, new_state_val
+            )
         ) is not None and (self._sensor_net_consumption or adjustment >= 0):
             # If net_consumption is off, the adjustment must be non-negative
             self._state += adjustment  # type: ignore[operator] # self._state will be set to by the start function if it is None, therefore it always has a valid Decimal value at this line
@@ -541,8 +531,8 @@ class UtilityMeterSensor(RestoreSensor):
 
     def _change_status(self, tariff: str) -> None:
         if self._tariff == tariff:
-            self._collecting = async_track_state_change_event(
-                self.hass, [self._sensor_source_id], self.async_reading
+            self._collecting = async_track_numeric_state_change(
+                self.hass, self._sensor_source_id, self.async_reading
             )
         else:
             if self._collecting:
@@ -691,8 +681,8 @@ class UtilityMeterSensor(RestoreSensor):
                 self._unit_of_measurement,
                 self._sensor_source_id,
             )
-            self._collecting = async_track_state_change_event(
-                self.hass, [self._sensor_source_id], self.async_reading
+            self._collecting = async_track_numeric_state_change(
+                self.hass, self._sensor_source_id, self.async_reading
             )
 
         self.async_on_remove(async_at_started(self.hass, async_source_tracking))
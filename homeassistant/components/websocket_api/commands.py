@@ -55,7 +55,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_deferred_domains,
+    async_get_loaded_integrations,
+    async_get_setup_timings,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -466,15 +470,33 @@ def _send_handle_entities_init_response(
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
     """Return JSON of descriptions (i.e. user documentation) for all service calls."""
     descriptions = await async_get_all_descriptions(hass)
+    cached_domains: dict[str, tuple[dict[str, Any], bytes]] = {}
     if ALL_SERVICE_DESCRIPTIONS_JSON_CACHE in hass.data:
-        cached_descriptions, cached_json_payload = hass.data[
+        cached_descriptions, cached_json_payload, cached_domains = hass.data[
             ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
         ]
         # If the descriptions are the same, return the cached JSON payload
         if cached_descriptions is descriptions:
             return cast(bytes, cached_json_payload)
-    json_payload = json_bytes(descriptions)
-    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
+    # Only serialize the domains whose descriptions changed and
+    # splice them together with the ones that did not
+    domains: dict[str, tuple[dict[str, Any], bytes]] = {}
+    for domain, domain_descriptions in descriptions.items():
+        cached_domain = cached_domains.get(domain)
+        if cached_domain is None or cached_domain[0] is not domain_descriptions:
+            cached_domain = (
+                domain_descriptions,
+                b"".join((json_bytes(domain), b":", json_bytes(domain_descriptions))),
+            )
+        domains[domain] = cached_domain
+    json_payload = b"".join(
+        (b"{", b",".join(domain_json for _, domain_json in domains.values()), b"}")
+    )
+    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (
+        descriptions,
+        json_payload,
+        domains,
+    )
     return json_payload
 
 
@@ -494,7 +516,12 @@ def handle_get_config(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get config command."""
-    connection.send_result(msg["id"], hass.config.as_dict())
+    config = hass.config.as_dict()
+    if deferred_domains := async_get_deferred_domains(hass):
+        # Integrations set up on first use are shown as loaded,
+        # so the frontend offers them
+        config["components"] = [*config["components"], *deferred_domains]
+    connection.send_result(msg["id"], config)
 
 
 @decorators.websocket_command(
@@ -13,6 +13,10 @@ from homeassistant.auth.models import RefreshToken, User
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
+from homeassistant.setup import (
+    async_get_deferred_domains,
+    async_setup_deferred_component,
+)
 from homeassistant.util.json import JsonValueType
 
 from . import const, messages
@@ -210,16 +214,52 @@ class ActiveConnection:
             return
 
         if not (handler_schema := self.handlers.get(type_)):
-            self.logger.info("Received unknown command: %s", type_)
-            self.send_message(
-                messages.error_message(
-                    cur_id, const.ERR_UNKNOWN_COMMAND, "Unknown command."
+            if (domain := type_.partition("/")[0]) in async_get_deferred_domains(
+                self.hass
+            ):
+                self.hass.async_create_task(
+                    self._async_handle_deferred_command(domain, msg),
+                    f"websocket deferred setup {domain}",
+                    eager_start=True,
                 )
-            )
+                self.last_id = cur_id
+                return
+            self._async_send_unknown_command(cur_id, type_)
             return
 
-        handler, schema = handler_schema
+        self._async_dispatch(*handler_schema, msg)
+        self.last_id = cur_id
 
+    async def _async_handle_deferred_command(
+        self, domain: str, msg: dict[str, Any]
+    ) -> None:
+        """Set up a deferred integration and handle its command."""
+        if not await async_setup_deferred_component(self.hass, domain) or not (
+            handler_schema := self.handlers.get(msg["type"])
+        ):
+            self._async_send_unknown_command(msg["id"], msg["type"])
+            return
+
+        self._async_dispatch(*handler_schema, msg)
+
+    @callback
+    def _async_send_unknown_command(self, msg_id: int, type_: str) -> None:
+        """Send an error for a command without handler."""
+        self.logger.info("Received unknown command: %s", type_)
+        self.send_message(
+            messages.error_message(
+                msg_id, const.ERR_UNKNOWN_COMMAND, "Unknown command."
+            )
+        )
+
+    @callback
+    def _async_dispatch(
+        self,
+        handler: MessageHandler,
+        schema: vol.Schema | Literal[False],
+        msg: dict[str, Any],
+    ) -> None:
+        """Validate a command with the schema and pass it to the handler."""
         try:
             if schema is False:
                 if len(msg) > 2:
@@ -230,8 +270,6 @@ class ActiveConnection:
         except Exception as err:  # noqa: BLE001
             self.async_handle_exception(msg, err)
 
-        self.last_id = cur_id
-
     @callback
     def async_handle_close(self) -> None:
         """Handle closing down connection."""
@@ -72,7 +72,7 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import SECRET_YAML, NodeCache, Secrets, YamlTypeError, load_yaml_dict
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -83,6 +83,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
+DATA_YAML_NODE_CACHE: HassKey[NodeCache] = HassKey("yaml_node_cache")
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -480,7 +481,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     This function allows a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
-    secrets = Secrets(Path(hass.config.config_dir))
+    if (node_cache := hass.data.get(DATA_YAML_NODE_CACHE)) is None:
+        node_cache = hass.data[DATA_YAML_NODE_CACHE] = NodeCache()
+    secrets = Secrets(Path(hass.config.config_dir), node_cache)
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -500,6 +503,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         if base_exc.problem_mark and base_exc.problem_mark.name:
             base_exc.problem_mark.name = _relpath(hass, base_exc.problem_mark.name)
         raise
+    node_cache.retain(secrets.loaded_files)
 
     invalid_domains = []
     for key in config:
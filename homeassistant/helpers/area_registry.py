@@ -168,6 +168,14 @@ class AreaRegistryItems(NormalizedNameBaseRegistryItems[AreaEntry]):
         data = self.data
         return [data[key] for key in self._floors_index.get(floor, ())]
 
+    def get_area_ids_for_label(self, label: str) -> list[str]:
+        """Get area ids for label."""
+        return list(self._labels_index.get(label, ()))
+
+    def get_area_ids_for_floor(self, floor: str) -> list[str]:
+        """Get area ids for floor."""
+        return list(self._floors_index.get(floor, ()))
+
 
 class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
     """Class to hold a registry of areas."""
@@ -0,0 +1,139 @@
+"""Persisted plan of the integrations and modules loaded during startup.
+
+At the end of startup the domains that were set up and the modules
+that were imported, in import order, are stored. On the next startup
+with the same Home Assistant version, custom integrations and
+configured domains the plan is used to load all manifests at once
+and to import the integrations and their platforms ahead of setup.
+
+The plan is only a hint. When it is outdated the worst case is
+an import that would not have been needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import hashlib
+import logging
+from typing import Any, TypedDict
+
+from homeassistant import loader
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+
+from .json import json_bytes
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.boot_plan"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+class BootPlanData(TypedDict):
+    """Boot plan data as stored."""
+
+    key: str
+    domains: list[str]
+    imports: dict[str, list[str]]
+
+
+class BootPlan:
+    """Load, apply and save the boot plan."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the boot plan."""
+        self.hass = hass
+        self.key: str | None = None
+        self.data: BootPlanData | None = None
+        self._store = Store[BootPlanData](
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
+        )
+
+    async def async_load(self, config_domains: Iterable[str]) -> BootPlanData | None:
+        """Load the plan and return it if it matches this startup."""
+        self.key = await _async_get_plan_key(self.hass, config_domains)
+        if (data := await self._store.async_load()) is None or data["key"] != self.key:
+            _LOGGER.debug("No usable boot plan found")
+            return None
+        self.data = data
+        return data
+
+    @callback
+    def async_prefetch(self) -> None:
+        """Import the planned integrations and platforms in the background."""
+        if self.data and self.data["imports"]:
+            self.hass.async_create_background_task(
+                _async_prefetch(self.hass, self.data["imports"]),
+                "boot plan prefetch",
+                eager_start=True,
+            )
+
+    @callback
+    def async_schedule_save(self, domains_to_setup: Iterable[str]) -> None:
+        """Schedule storing the domains set up and the modules imported."""
+        if self.key is None:
+            return
+        imports: dict[str, list[str]] = {}
+        for name in self.hass.data[loader.DATA_COMPONENTS]:
+            domain, _, platform_name = name.partition(".")
+            platforms = imports.setdefault(domain, [])
+            if platform_name:
+                platforms.append(platform_name)
+        data = BootPlanData(
+            key=self.key, domains=sorted(domains_to_setup), imports=imports
+        )
+        if data == self.data:
+            return
+        self.data = data
+        self._store.async_delay_save(lambda: data, SAVE_DELAY)
+
+
+async def _async_get_plan_key(
+    hass: HomeAssistant, config_domains: Iterable[str]
+) -> str:
+    """Return the key a plan has to match to be used."""
+    custom_components = await loader.async_get_custom_components(hass)
+    key_data: list[Any] = [
+        __version__,
+        sorted(config_domains),
+        sorted(
+            (domain, str(integration.version), integration.manifest)
+            for domain, integration in custom_components.items()
+        ),
+    ]
+    return hashlib.sha256(json_bytes(key_data)).hexdigest()
+
+
+async def _async_prefetch(hass: HomeAssistant, imports: dict[str, list[str]]) -> None:
+    """Import the planned integrations and their platforms in parallel.
+
+    Requirements are not processed as the prefetch must not install
+    packages, so integrations with missing requirements fail to import
+    and are left to setup. Setup waits for any import that is still in
+    progress instead of starting its own.
+    """
+    integrations = await loader.async_get_integrations(hass, imports)
+    await asyncio.gather(
+        *(
+            _async_prefetch_integration(integration, imports[domain])
+            for domain, integration in integrations.items()
+            if isinstance(integration, loader.Integration)
+        )
+    )
+
+
+async def _async_prefetch_integration(
+    integration: loader.Integration, platform_names: list[str]
+) -> None:
+    """Import an integration and its platforms."""
+    try:
+        await integration.async_get_component()
+        if platform_names:
+            await integration.async_get_platforms(
+                integration.platforms_exists(platform_names)
+            )
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Failed to prefetch %s", integration.domain, exc_info=True)
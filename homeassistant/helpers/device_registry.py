@@ -561,6 +561,14 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
             data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
+    def get_device_ids_for_area_id(self, area_id: str) -> list[str]:
+        """Get device ids for area."""
+        return list(self._area_id_index.get(area_id, ()))
+
+    def get_device_ids_for_label(self, label: str) -> list[str]:
+        """Get device ids for label."""
+        return list(self._labels_index.get(label, ()))
+
 
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
@@ -578,6 +586,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_collections={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -594,6 +594,19 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             if not (entry := data[key]).disabled_by or include_disabled_entities
         ]
 
+    def get_entity_ids_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[str]:
+        """Get entity ids for device."""
+        if include_disabled_entities:
+            return list(self._device_id_index.get(device_id, ()))
+        data = self.data
+        return [
+            key
+            for key in self._device_id_index.get(device_id, ())
+            if not data[key].disabled_by
+        ]
+
     def get_entries_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
@@ -613,6 +626,18 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_entity_ids_for_config_entry_id(self, config_entry_id: str) -> list[str]:
+        """Get entity ids for config entry."""
+        return list(self._config_entry_id_index.get(config_entry_id, ()))
+
+    def get_entity_ids_for_area_id(self, area_id: str) -> list[str]:
+        """Get entity ids for area."""
+        return list(self._area_id_index.get(area_id, ()))
+
+    def get_entity_ids_for_label(self, label: str) -> list[str]:
+        """Get entity ids for label."""
+        return list(self._labels_index.get(label, ()))
+
 
 def _validate_item(
     hass: HomeAssistant,
@@ -684,6 +709,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_collections={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from contextvars import ContextVar
 from http import HTTPStatus
+from itertools import batched
 import logging
+import threading
 from typing import Any, Final
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.typedefs import LooseHeaders
 from aiohttp.web import AppKey, Request
 from aiohttp.web_exceptions import (
@@ -29,6 +31,12 @@ from .json import find_paths_unserializable_data, json_bytes, json_dumps
 
 _LOGGER = logging.getLogger(__name__)
 
+CONTENT_TYPE_NDJSON: Final = "application/x-ndjson"
+# Number of encoded fragments joined into a single chunk of a streamed response
+STREAM_CHUNK_ITEMS: Final = 100
+# Number of encoded chunks that may be buffered while the client catches up
+STREAM_MAX_PENDING_CHUNKS: Final = 4
+
 
 type AllowCorsType = Callable[[AbstractRoute | AbstractResource], None]
 KEY_AUTHENTICATED: Final = "ha_authenticated"
@@ -104,6 +112,38 @@ def request_handler_factory(
     return handle
 
 
+def _json_fragments(items: Iterable[Any], ndjson: bool) -> Iterator[bytes]:
+    """Encode items as fragments of a JSON array or of newline delimited JSON.
+
+    Items which are iterators are encoded as nested arrays one value at a
+    time, so they don't have to be held in memory as a whole.
+    """
+    if not ndjson:
+        yield b"["
+    first = True
+    for item in items:
+        if not first and not ndjson:
+            yield b","
+        first = False
+        if isinstance(item, Iterator):
+            yield b"["
+            for index, value in enumerate(item):
+                yield b"," + json_bytes(value) if index else json_bytes(value)
+            yield b"]"
+        else:
+            yield json_bytes(item)
+        if ndjson:
+            yield b"\n"
+    if not ndjson:
+        yield b"]"
+
+
+def _json_stream_chunks(items: Iterable[Any], ndjson: bool) -> Iterator[bytes]:
+    """Encode items as chunks of a JSON array or of newline delimited JSON."""
+    for batch in batched(_json_fragments(items, ndjson), STREAM_CHUNK_ITEMS):
+        yield b"".join(batch)
+
+
 class HomeAssistantView:
     """Base view for all views."""
 
@@ -148,6 +188,74 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def async_stream(
+        request: web.Request,
+        add_executor_job: Callable[[Callable[[], None]], Awaitable[None]],
+        generate_chunks: Callable[[], Iterable[bytes]],
+        content_type: str,
+    ) -> web.StreamResponse:
+        """Stream the chunks of a blocking generator as a chunked response.
+
+        The generator is consumed in the executor. Only a few chunks
+        are buffered at a time so memory use does not grow with the
+        size of the response.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(STREAM_MAX_PENDING_CHUNKS)
+        cancelled = threading.Event()
+
+        def _produce() -> None:
+            """Hand the chunks over to the event loop."""
+            try:
+                for chunk in generate_chunks():
+                    if cancelled.is_set():
+                        return
+                    asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+            finally:
+                if not cancelled.is_set():
+                    asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+        producer = add_executor_job(_produce)
+        response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: content_type})
+        response.enable_chunked_encoding()
+        response.enable_compression()
+        try:
+            while (chunk := await queue.get()) is not None:
+                if not response.prepared:
+                    await response.prepare(request)
+                await response.write(chunk)
+        finally:
+            # Unblock the producer if the client went away
+            cancelled.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
+        if not response.prepared:
+            await response.prepare(request)
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    async def async_stream_json(
+        request: web.Request,
+        add_executor_job: Callable[[Callable[[], None]], Awaitable[None]],
+        generate: Callable[[], Iterable[Any]],
+    ) -> web.StreamResponse:
+        """Stream the items of a blocking generator as a JSON response.
+
+        The items are sent as a chunked JSON array, or as newline
+        delimited JSON when the client accepts it. Items which are
+        iterators are sent as nested arrays.
+        """
+        ndjson = CONTENT_TYPE_NDJSON in request.headers.get(hdrs.ACCEPT, "")
+        return await HomeAssistantView.async_stream(
+            request,
+            add_executor_job,
+            lambda: _json_stream_chunks(generate(), ndjson),
+            CONTENT_TYPE_NDJSON if ndjson else CONTENT_TYPE_JSON,
+        )
+
     def json_message(
         self,
         message: str,
@@ -0,0 +1,127 @@
+"""Helpers to track the numeric state of the source entity of derived sensors.
+
+Sensors like integration, derivative and utility_meter sensors calculate
+their state from the numeric state of a source entity, and often several
+of them use the same source. The state changes of each source are tracked
+once and its states are parsed once for all of them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal, DecimalException
+import logging
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from .event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_NUMERIC_SOURCES: HassKey[dict[str, _NumericSource]] = HassKey("numeric_sources")
+
+
+@dataclass(slots=True, frozen=True)
+class NumericStateChangedData:
+    """State change of a source entity with its old and new state as Decimal.
+
+    The values are None if the state is missing or not a number.
+    """
+
+    event: Event[EventStateChangedData]
+    old_value: Decimal | None
+    new_value: Decimal | None
+
+
+def decimal_state(state: State | None) -> Decimal | None:
+    """Return the state as a Decimal or None if it is not a number."""
+    if state is None:
+        return None
+    try:
+        return Decimal(state.state)
+    except DecimalException:
+        return None
+
+
+class _NumericSource:
+    """Track the state changes of a source entity for all its consumers."""
+
+    __slots__ = ("_actions", "_hass", "_entity_id", "_unsub", "_state", "_value")
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the source."""
+        self._hass = hass
+        self._entity_id = entity_id
+        self._actions: list[Callable[[NumericStateChangedData], None]] = []
+        self._state: State | None = None
+        self._value: Decimal | None = None
+        self._unsub = async_track_state_change_event(
+            hass, entity_id, self._async_state_changed
+        )
+
+    @callback
+    def async_add(
+        self, action: Callable[[NumericStateChangedData], None]
+    ) -> CALLBACK_TYPE:
+        """Add a consumer of the state changes."""
+        self._actions.append(action)
+
+        @callback
+        def remove() -> None:
+            """Remove the consumer and stop tracking without consumers."""
+            self._actions.remove(action)
+            if not self._actions:
+                self._unsub()
+                del self._hass.data[DATA_NUMERIC_SOURCES][self._entity_id]
+
+        return remove
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Parse the state once and pass the change to the consumers."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        # The old state is the new state of the previous change
+        if old_state is not None and old_state is self._state:
+            old_value = self._value
+        else:
+            old_value = decimal_state(old_state)
+        self._state = new_state
+        self._value = new_value = decimal_state(new_state)
+        data = NumericStateChangedData(event, old_value, new_value)
+        for action in self._actions.copy():
+            try:
+                action(data)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    self._entity_id,
+                    action,
+                )
+
+
+@callback
+def async_track_numeric_state_change(
+    hass: HomeAssistant,
+    entity_id: str,
+    action: Callable[[NumericStateChangedData], None],
+) -> CALLBACK_TYPE:
+    """Track the state changes of a source entity with its states as Decimal.
+
+    The action must be a callback. Actions tracking the same entity share
+    a single listener and the states are only parsed once.
+    """
+    entity_id = entity_id.lower()
+    sources = hass.data.setdefault(DATA_NUMERIC_SOURCES, {})
+    if (source := sources.get(entity_id)) is None:
+        source = sources[entity_id] = _NumericSource(hass, entity_id)
+    return source.async_add(action)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import cached_property
 import logging
 from typing import Any, Self, cast
 
@@ -96,6 +97,42 @@ class StoredState:
         )
 
 
+class _LoadedStoredState(StoredState):
+    """Stored state loaded from storage which is decoded on first access.
+
+    Most restored states are never read, or only read once when their
+    entity is added, so decoding them all on startup is wasted work.
+    Until the entity is back they are also written back as loaded.
+    """
+
+    def __init__(self, json_dict: dict[str, Any]) -> None:
+        """Initialize a stored state from a dict."""
+        self._json_dict = json_dict
+
+    @cached_property
+    def state(self) -> State:  # type: ignore[override]
+        """Return the stored state."""
+        return cast(State, State.from_dict(self._json_dict["state"]))
+
+    @cached_property
+    def extra_data(self) -> ExtraStoredData | None:  # type: ignore[override]
+        """Return the stored extra data."""
+        extra_data_dict = self._json_dict.get("extra_data")
+        return RestoredExtraData(extra_data_dict) if extra_data_dict else None
+
+    @cached_property
+    def last_seen(self) -> datetime:  # type: ignore[override]
+        """Return when the state was last seen."""
+        last_seen = self._json_dict["last_seen"]
+        if isinstance(last_seen, str):
+            return cast(datetime, dt_util.parse_datetime(last_seen))
+        return cast(datetime, last_seen)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the dict the stored state was loaded from."""
+        return self._json_dict
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -164,7 +201,7 @@ class RestoreStateData:
             self.last_states = {}
         else:
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: _LoadedStoredState(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
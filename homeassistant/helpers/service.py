@@ -8,6 +8,7 @@ import dataclasses
 from enum import Enum
 from functools import cache, partial
 import logging
+import os
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
@@ -28,12 +29,14 @@ from homeassistant.const import (
     CONF_TARGET,
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
+    __version__,
 )
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
     HassJob,
     HomeAssistant,
+    Service,
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
@@ -63,6 +66,7 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .storage import Store
 from .typing import ConfigType, TemplateVarsType
 
 if TYPE_CHECKING:
@@ -78,6 +82,11 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+SERVICES_FILES_BUNDLE: HassKey[_ServicesFilesBundle] = HassKey("services_files_bundle")
+
+SERVICES_FILES_STORAGE_KEY = "core.services"
+SERVICES_FILES_STORAGE_VERSION = 1
+SERVICES_FILES_SAVE_DELAY = 10
 
 
 @cache
@@ -655,6 +664,92 @@ def _load_services_files(
     return [_load_services_file(hass, integration) for integration in integrations]
 
 
+def _get_services_file_key(integration: Integration) -> list[str | int | None]:
+    """Return the key a bundled services file of an integration has to match."""
+    try:
+        mtime_ns: int | None = os.stat(
+            integration.file_path / "services.yaml"
+        ).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return [str(integration.version or __version__), mtime_ns]
+
+
+def _load_bundled_services_files(
+    hass: HomeAssistant,
+    integrations: list[Integration],
+    bundled: dict[str, dict[str, Any]],
+) -> tuple[dict[str, JSON_TYPE], dict[str, dict[str, Any]]]:
+    """Load service files for integrations that are not bundled or outdated.
+
+    Returns the services of all integrations and the bundle entries
+    of the service files that had to be loaded.
+    """
+    contents: dict[str, JSON_TYPE] = {}
+    integrations_to_load: list[Integration] = []
+    keys: dict[str, list[str | int | None]] = {}
+    for integration in integrations:
+        domain = integration.domain
+        key = keys[domain] = _get_services_file_key(integration)
+        if (entry := bundled.get(domain)) is not None and entry["key"] == key:
+            contents[domain] = entry["services"]
+        else:
+            integrations_to_load.append(integration)
+
+    updated: dict[str, dict[str, Any]] = {}
+    if integrations_to_load:
+        for integration, services in zip(
+            integrations_to_load,
+            _load_services_files(hass, integrations_to_load),
+            strict=True,
+        ):
+            domain = integration.domain
+            contents[domain] = services
+            updated[domain] = {"key": keys[domain], "services": services}
+    return contents, updated
+
+
+class _ServicesFilesBundle:
+    """Loaded service files persisted between restarts.
+
+    The contents of the services.yaml files are stored so they can be
+    loaded with a single read instead of parsing the services.yaml file
+    of every integration again.
+    """
+
+    __slots__ = ("hass", "store", "domains")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bundle."""
+        self.hass = hass
+        self.store = Store[dict[str, dict[str, dict[str, Any]]]](
+            hass, SERVICES_FILES_STORAGE_VERSION, SERVICES_FILES_STORAGE_KEY
+        )
+        self.domains: dict[str, dict[str, Any]] | None = None
+
+    async def async_load_services_files(
+        self, integrations: list[Integration]
+    ) -> dict[str, JSON_TYPE]:
+        """Return the services of the integrations."""
+        if self.domains is None:
+            data = await self.store.async_load()
+            if self.domains is None:
+                self.domains = data["domains"] if data else {}
+        contents, updated = await self.hass.async_add_executor_job(
+            _load_bundled_services_files, self.hass, integrations, self.domains
+        )
+        if updated:
+            self.domains.update(updated)
+            self.store.async_delay_save(self._data_to_save, SERVICES_FILES_SAVE_DELAY)
+        return contents
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the data to store."""
+        assert self.domains is not None
+        return {"domains": self.domains}
+
+
 @callback
 def async_get_cached_service_description(
     hass: HomeAssistant, domain: str, service: str
@@ -684,11 +779,12 @@ async def async_get_all_descriptions(
     }
     # If we have a complete cache, check if it is still valid
     all_cache: tuple[set[tuple[str, str]], dict[str, dict[str, Any]]] | None
+    previous_descriptions: dict[str, dict[str, Any]] = {}
     if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
-        previous_all_services, previous_descriptions_cache = all_cache
+        previous_all_services, previous_descriptions = all_cache
         # If the services are the same, we can return the cache
         if previous_all_services == all_services:
-            return previous_descriptions_cache
+            return previous_descriptions
 
     # Files we loaded for missing descriptions
     loaded: dict[str, JSON_TYPE] = {}
@@ -712,10 +808,9 @@ async def async_get_all_descriptions(
             _LOGGER.error("Failed to load integration: %s", domain, exc_info=int_or_exc)
 
         if integrations:
-            contents = await hass.async_add_executor_job(
-                _load_services_files, hass, integrations
-            )
-            loaded = dict(zip(domains_with_missing_services, contents, strict=False))
+            if (bundle := hass.data.get(SERVICES_FILES_BUNDLE)) is None:
+                bundle = hass.data[SERVICES_FILES_BUNDLE] = _ServicesFilesBundle(hass)
+            loaded = await bundle.async_load_services_files(integrations)
 
     # Load translations for all service domains
     translations = await translation.async_get_translations(
@@ -725,6 +820,16 @@ async def async_get_all_descriptions(
     # Build response
     descriptions: dict[str, dict[str, Any]] = {}
     for domain, services_map in services.items():
+        # Keep the descriptions of domains that did not change so
+        # consumers can tell which domains have to be processed again
+        if (
+            previous_domain_descriptions := previous_descriptions.get(domain)
+        ) is not None and _domain_descriptions_unchanged(
+            domain, services_map, previous_domain_descriptions, descriptions_cache
+        ):
+            descriptions[domain] = previous_domain_descriptions
+            continue
+
         descriptions[domain] = {}
         domain_descriptions = descriptions[domain]
 
@@ -762,7 +867,14 @@ async def async_get_all_descriptions(
                     f"component.{domain}.services.{service_name}.description",
                     yaml_description.get("description", ""),
                 ),
-                "fields": dict(yaml_description.get("fields", {})),
+                # Copy the fields as the loaded services files are
+                # kept in the bundle and must not be translated
+                "fields": {
+                    field_name: dict(field_schema)
+                    for field_name, field_schema in yaml_description.get(
+                        "fields", {}
+                    ).items()
+                },
             }
 
             # Translate fields names & descriptions as well
@@ -797,6 +909,19 @@ async def async_get_all_descriptions(
     return descriptions
 
 
+def _domain_descriptions_unchanged(
+    domain: str,
+    services_map: dict[str, Service],
+    domain_descriptions: dict[str, Any],
+    descriptions_cache: dict[tuple[str, str], dict[str, Any] | None],
+) -> bool:
+    """Return if the previous descriptions of a domain are still valid."""
+    return domain_descriptions.keys() == services_map.keys() and all(
+        descriptions_cache.get((domain, service_name)) is description
+        for service_name, description in domain_descriptions.items()
+    )
+
+
 @callback
 def remove_entity_service_fields(call: ServiceCall) -> dict[Any, Any]:
     """Remove entity service fields."""
@@ -834,7 +959,13 @@ def async_set_service_schema(
             "optional": response == SupportsResponse.OPTIONAL,
         }
 
-    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
+    # Only the descriptions of the domain of the service are built again
+    if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
+        all_services, descriptions = all_cache
+        hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (
+            all_services - {(domain, service)},
+            descriptions,
+        )
     descriptions_cache[(domain, service)] = description
 
 
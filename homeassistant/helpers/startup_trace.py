@@ -0,0 +1,192 @@
+"""Trace where time is spent while Home Assistant starts."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import contextlib
+from dataclasses import dataclass
+from functools import partial
+import logging
+import time
+from typing import Any
+
+from typing_extensions import Generator
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.loader import IntegrationNotLoaded, async_get_loaded_integration
+from homeassistant.util.hass_dict import HassKey
+
+from .json import save_json
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+TRACE_FILE = "startup_trace.json"
+
+SPAN_INTEGRATION = "integration"
+"""Set up of an integration including waiting for its dependencies."""
+SPAN_DEPENDENCIES = "dependencies"
+"""Set up of the dependencies and installation of the requirements."""
+SPAN_IMPORT = "import"
+"""Import of the integration."""
+SPAN_CONFIG_VALIDATION = "config_validation"
+"""Validation of the configuration of the integration."""
+
+
+@dataclass(slots=True, frozen=True)
+class StartupSpan:
+    """A span of time spent while starting."""
+
+    domain: str
+    name: str
+    start: float
+    end: float
+    group: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Return the duration of the span."""
+        return self.end - self.start
+
+
+class StartupTrace:
+    """Record spans of time spent setting up integrations."""
+
+    __slots__ = ("started", "spans")
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.started = time.monotonic()
+        self.spans: list[StartupSpan] = []
+
+    @contextlib.contextmanager
+    def span(self, domain: str, name: str, group: str | None = None) -> Generator[None]:
+        """Record the time spent in the context as a span."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.spans.append(StartupSpan(domain, name, start, time.monotonic(), group))
+
+    def as_trace_events(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Every integration is shown as its own thread.
+        """
+        thread_ids: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            if (thread_id := thread_ids.get(span.domain)) is None:
+                thread_id = thread_ids[span.domain] = len(thread_ids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": thread_id,
+                        "args": {"name": span.domain},
+                    }
+                )
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.domain,
+                "ph": "X",
+                "ts": round((span.start - self.started) * 1_000_000),
+                "dur": round(span.duration * 1_000_000),
+                "pid": 1,
+                "tid": thread_id,
+            }
+            if span.group is not None:
+                event["args"] = {"group": span.group}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def critical_path(
+        self, dependencies: Mapping[str, Iterable[str]]
+    ) -> list[StartupSpan]:
+        """Return the chain of integration setups that finished last.
+
+        Starting at the integration that finished last, the path follows
+        the dependency that finished last until an integration is reached
+        that did not wait for any traced dependency.
+        """
+        setups = {
+            span.domain: span for span in self.spans if span.name == SPAN_INTEGRATION
+        }
+        if not setups:
+            return []
+        current = max(setups.values(), key=lambda span: span.end)
+        path = [current]
+        while waited := [
+            setups[domain]
+            for domain in dependencies.get(current.domain, ())
+            if domain in setups
+            and setups[domain].end <= current.end
+            and setups[domain] not in path
+        ]:
+            current = max(waited, key=lambda span: span.end)
+            path.append(current)
+        path.reverse()
+        return path
+
+
+@callback
+def async_enable(hass: HomeAssistant) -> None:
+    """Enable tracing the startup until Home Assistant has started."""
+    hass.data[DATA_STARTUP_TRACE] = StartupTrace()
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STARTED, partial(_async_finish_trace, hass)
+    )
+
+
+@contextlib.contextmanager
+def async_trace_span(
+    hass: HomeAssistant, domain: str, name: str, group: str | None = None
+) -> Generator[None]:
+    """Record the time spent in the context if the startup is traced."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None:
+        yield
+        return
+    with trace.span(domain, name, group):
+        yield
+
+
+def _get_dependencies(
+    hass: HomeAssistant, domains: Iterable[str]
+) -> dict[str, set[str]]:
+    """Return the dependencies of the traced integrations."""
+    dependencies: dict[str, set[str]] = {}
+    for domain in domains:
+        try:
+            integration = async_get_loaded_integration(hass, domain)
+        except IntegrationNotLoaded:
+            continue
+        dependencies[domain] = {
+            *integration.dependencies,
+            *integration.after_dependencies,
+        }
+    return dependencies
+
+
+async def _async_finish_trace(hass: HomeAssistant, _: Event) -> None:
+    """Report the critical path and write the trace when started."""
+    trace = hass.data.pop(DATA_STARTUP_TRACE)
+    dependencies = _get_dependencies(hass, {span.domain for span in trace.spans})
+    if path := trace.critical_path(dependencies):
+        previous_end = trace.started
+        steps: list[str] = []
+        for span in path:
+            steps.append(
+                f"{span.domain} ({span.end - max(span.start, previous_end):.2f}s)"
+            )
+            previous_end = span.end
+        _LOGGER.info(
+            "Startup critical path (%.2fs): %s",
+            path[-1].end - trace.started,
+            " -> ".join(steps),
+        )
+    trace_file = hass.config.path(TRACE_FILE)
+    await hass.async_add_executor_job(save_json, trace_file, trace.as_trace_events())
+    _LOGGER.info("Startup trace written to %s", trace_file)
@@ -33,6 +33,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -48,6 +49,17 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# Suffix of the file with the changes written since the store was last
+# written in full
+JOURNAL_SUFFIX = ".journal"
+# Write the store in full once the journal grows past this fraction
+# of the size of the store file
+JOURNAL_COMPACT_RATIO = 0.5
+# Key of the id of a full write in the store file and in the journal lines
+# appended after it. Only lines with the id of the store file are replayed,
+# so a journal left over from before the last full write is ignored.
+JOURNAL_ID = "journal_id"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -241,8 +253,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_collections: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        journal_collections maps keys of lists in the stored data to the key
+        identifying their items. When set, writes that only add, change or
+        remove items of these lists are appended to a journal next to the
+        store file instead of writing the whole file.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +277,22 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal_collections = (
+            journal_collections if encoder is None or encoder is JSONEncoder else None
+        )
+        # What was last written, only accessed while holding the write lock
+        self._journal_snapshot: _JournalSnapshot | None = None
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -325,6 +354,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal_collections:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +418,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal_collections:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -551,6 +585,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal_collections:
+            snapshot = _JournalSnapshot(data, self._journal_collections)
+            if (
+                previous := self._journal_snapshot
+            ) is not None and self._append_journal(previous, snapshot):
+                return
+            self._journal_snapshot = None
+
+        if self._journal_collections:
+            data[JOURNAL_ID] = snapshot.journal_id = random_uuid_hex()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +605,102 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal_collections:
+            # Lines left in the journal have the id of an older write and
+            # are not replayed, removing the journal only frees the space
+            try:
+                with suppress(FileNotFoundError):
+                    os.unlink(self.journal_path)
+                size = os.path.getsize(path)
+            except OSError as error:
+                _LOGGER.exception("Removing journal failed: %s", self.journal_path)
+                raise WriteError(error) from error
+            snapshot.journal_budget = int(size * JOURNAL_COMPACT_RATIO)
+            self._journal_snapshot = snapshot
+
+    def _append_journal(
+        self, previous: _JournalSnapshot, snapshot: _JournalSnapshot
+    ) -> bool:
+        """Append the changes since the previous write to the journal.
+
+        Return False if the store has to be written in full instead.
+        """
+        if (changes := previous.changes_to(snapshot)) is None:
+            return False
+        if not changes:
+            snapshot.journal_id = previous.journal_id
+            snapshot.journal_budget = previous.journal_budget
+            self._journal_snapshot = snapshot
+            return True
+        snapshot.journal_id = previous.journal_id
+        line = (
+            json_helper.json_bytes(
+                {JOURNAL_ID: snapshot.journal_id, "changes": changes}
+            )
+            + b"\n"
+        )
+        if len(line) > previous.journal_budget:
+            return False
+
+        _LOGGER.debug("Appending changes for %s to %s", self.key, self.journal_path)
+        try:
+            with open(self.journal_path, "ab") as journal:
+                if not self._private:
+                    os.fchmod(journal.fileno(), 0o644)
+                journal.write(line)
+                if self._atomic_writes:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+        except OSError as error:
+            # Write the store in full next time so a partially
+            # written line is removed together with the journal
+            self._journal_snapshot = None
+            _LOGGER.exception("Saving journal failed: %s", self.journal_path)
+            raise WriteError(error) from error
+
+        snapshot.journal_budget = previous.journal_budget - len(line)
+        self._journal_snapshot = snapshot
+        return True
+
+    def _replay_journal(self, data: dict[str, Any]) -> None:
+        """Apply the changes in the journal to the loaded data.
+
+        Only lines appended after the write of the store file are applied.
+        """
+        if (journal_id := data.get(JOURNAL_ID)) is None:
+            return
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return
+
+        _LOGGER.debug("Replaying %s changes for %s", len(lines), self.key)
+        stored = data["data"]
+        collections = {
+            collection: {item[item_key]: item for item in stored.get(collection, ())}
+            for collection, item_key in self._journal_collections.items()
+        }
+        for line in lines:
+            try:
+                entry = json_util.json_loads_object(line)
+            except ValueError:
+                # A crash while appending can leave an incomplete line
+                _LOGGER.warning("Ignoring invalid journal line for %s", self.key)
+                continue
+            if entry.get(JOURNAL_ID) != journal_id:
+                continue
+            changes: dict[str, Any] = entry["changes"]  # type: ignore[assignment]
+            for collection, change in changes.items():
+                items = collections[collection]
+                item_key = self._journal_collections[collection]
+                for item in change["set"]:
+                    items[item[item_key]] = item
+                for item_id in change["remove"]:
+                    items.pop(item_id, None)
+        for collection, items in collections.items():
+            stored[collection] = list(items.values())
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -569,6 +710,68 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._manager.async_invalidate(self.key)
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._journal_snapshot = None
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_collections:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+class _JournalSnapshot:
+    """Serialized items of the journaled lists of a write."""
+
+    __slots__ = ("header", "items", "journal_budget", "journal_id")
+
+    def __init__(self, data: dict[str, Any], collections: Mapping[str, str]) -> None:
+        """Serialize the data of a write."""
+        stored = data["data"]
+        self.items: dict[str, tuple[str, dict[bytes, None]]] = {}
+        rest: dict[str, Any] = {}
+        if isinstance(stored, dict):
+            for key, value in stored.items():
+                if (item_key := collections.get(key)) is not None and isinstance(
+                    value, list
+                ):
+                    self.items[key] = (
+                        item_key,
+                        dict.fromkeys(json_helper.json_bytes(item) for item in value),
+                    )
+                else:
+                    rest[key] = value
+        # The header covers everything outside of the journaled lists
+        self.header = json_helper.json_bytes(
+            {
+                "version": data["version"],
+                "minor_version": data["minor_version"],
+                "key": data["key"],
+                "data": rest if isinstance(stored, dict) else stored,
+            }
+        )
+        self.journal_budget = 0
+        self.journal_id: str | None = None
+
+    def changes_to(self, new: _JournalSnapshot) -> dict[str, Any] | None:
+        """Return the changes to the lists or None if anything else changed."""
+        if new.header != self.header or new.items.keys() != self.items.keys():
+            return None
+        changes: dict[str, Any] = {}
+        for collection, (item_key, new_items) in new.items.items():
+            old_items = self.items[collection][1]
+            if new_items.keys() == old_items.keys():
+                continue
+            added = [item for item in new_items if item not in old_items]
+            set_items = [json_util.json_loads_object(item) for item in added]
+            set_ids = {item[item_key] for item in set_items}
+            changes[collection] = {
+                "set": [json_helper.json_fragment(item) for item in added],
+                "remove": [
+                    item_id
+                    for item in old_items
+                    if item not in new_items
+                    and (item_id := json_util.json_loads_object(item)[item_key])
+                    not in set_ids
+                ],
+            }
+        return changes
@@ -1296,8 +1296,7 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
     entity_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_device(entity_reg, _device_id)
-    return [entry.entity_id for entry in entries]
+    return entity_reg.entities.get_entity_ids_for_device_id(_device_id)
 
 
 def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
@@ -1318,10 +1317,9 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
     for entry in hass.config_entries.async_entries():
         if entry.title != entry_name:
             continue
-        entries = entity_registry.async_entries_for_config_entry(
-            ent_reg, entry.entry_id
+        entities.extend(
+            ent_reg.entities.get_entity_ids_for_config_entry_id(entry.entry_id)
         )
-        entities.extend(entry.entity_id for entry in entries)
     if entities:
         return entities
 
@@ -1454,8 +1452,7 @@ def floor_areas(hass: HomeAssistant, floor_id_or_name: str) -> Iterable[str]:
         return []
 
     area_reg = area_registry.async_get(hass)
-    entries = area_registry.async_entries_for_floor(area_reg, _floor_id)
-    return [entry.id for entry in entries if entry.id]
+    return area_reg.areas.get_area_ids_for_floor(_floor_id)
 
 
 def areas(hass: HomeAssistant) -> Iterable[str | None]:
@@ -1548,19 +1545,17 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     if _area_id is None:
         return []
     ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
+    entities = ent_reg.entities
+    entity_ids = entities.get_entity_ids_for_area_id(_area_id)
     dev_reg = device_registry.async_get(hass)
     # We also need to add entities tied to a device in the area that don't themselves
     # have an area specified since they inherit the area from the device.
     entity_ids.extend(
         [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
+            entity_id
+            for device_id in dev_reg.devices.get_device_ids_for_area_id(_area_id)
+            for entity_id in entities.get_entity_ids_for_device_id(device_id)
+            if entities.data[entity_id].area_id is None
         ]
     )
     return entity_ids
@@ -1578,8 +1573,7 @@ def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     if _area_id is None:
         return []
     dev_reg = device_registry.async_get(hass)
-    entries = device_registry.async_entries_for_area(dev_reg, _area_id)
-    return [entry.id for entry in entries]
+    return dev_reg.devices.get_device_ids_for_area_id(_area_id)
 
 
 def labels(hass: HomeAssistant, lookup_value: Any = None) -> Iterable[str | None]:
@@ -1646,8 +1640,7 @@ def label_areas(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
     area_reg = area_registry.async_get(hass)
-    entries = area_registry.async_entries_for_label(area_reg, _label_id)
-    return [entry.id for entry in entries]
+    return area_reg.areas.get_area_ids_for_label(_label_id)
 
 
 def label_devices(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
@@ -1655,8 +1648,7 @@ def label_devices(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
     dev_reg = device_registry.async_get(hass)
-    entries = device_registry.async_entries_for_label(dev_reg, _label_id)
-    return [entry.id for entry in entries]
+    return dev_reg.devices.get_device_ids_for_label(_label_id)
 
 
 def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
@@ -1664,8 +1656,7 @@ def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
     ent_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_label(ent_reg, _label_id)
-    return [entry.entity_id for entry in entries]
+    return ent_reg.entities.get_entity_ids_for_label(_label_id)
 
 
 def closest(hass, *args):
@@ -7,6 +7,7 @@ from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
+import os
 import pathlib
 import string
 from typing import Any
@@ -15,6 +16,7 @@ from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    __version__,
 )
 from homeassistant.core import Event, HomeAssistant, async_get_hass, callback
 from homeassistant.loader import (
@@ -26,12 +28,21 @@ from homeassistant.loader import (
 from homeassistant.util.json import load_json
 
 from . import singleton
+from .json import json_bytes
+from .storage import Store
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+BUNDLE_STORAGE_KEY = "core.translations"
+BUNDLE_STORAGE_VERSION = 1
+BUNDLE_SAVE_DELAY = 10
+
+# Maximum number of serialized translation responses kept
+MAX_JSON_CACHE_SIZE = 32
+
 
 def recursive_flatten(
     prefix: str, data: dict[str, dict[str, Any] | str]
@@ -131,6 +142,34 @@ async def _async_get_component_strings(
     return translations_by_language
 
 
+def _get_bundle_keys(
+    languages: Iterable[str], integrations: dict[str, Integration]
+) -> dict[str, list[str | int | None]]:
+    """Return the keys the bundled translations of integrations have to match.
+
+    The key is made of the version of the integration, or of Home Assistant
+    for built-in integrations, and the modification times of the
+    translation files that are compiled into the bundle. Integrations
+    without translations are not bundled as there is nothing to load.
+    """
+    keys: dict[str, list[str | int | None]] = {}
+    for domain, integration in integrations.items():
+        if not integration.has_translations:
+            continue
+        key: list[str | int | None] = [str(integration.version or __version__)]
+        for language in languages:
+            try:
+                key.append(
+                    os.stat(
+                        integration.file_path / "translations" / f"{language}.json"
+                    ).st_mtime_ns
+                )
+            except OSError:
+                key.append(None)
+        keys[domain] = key
+    return keys
+
+
 @dataclass(slots=True)
 class _TranslationsCacheData:
     """Data for the translation cache.
@@ -144,16 +183,67 @@ class _TranslationsCacheData:
     cache: dict[str, dict[str, dict[str, dict[str, str]]]]
 
 
+class _TranslationBundle:
+    """Flattened translations of a language persisted between restarts.
+
+    The bundle holds the translations of every integration as they
+    are stored in the cache, so they can be loaded with a single read
+    instead of loading and flattening the translation files of each
+    integration again.
+    """
+
+    __slots__ = ("components", "store")
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the bundle."""
+        self.store = Store[dict[str, dict[str, Any]]](
+            hass, BUNDLE_STORAGE_VERSION, f"{BUNDLE_STORAGE_KEY}.{language}"
+        )
+        self.components: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the bundle."""
+        if data := await self.store.async_load():
+            self.components = data["components"]
+
+    @callback
+    def async_get(
+        self, component: str, key: list[str | int | None]
+    ) -> dict[str, dict[str, str]] | None:
+        """Return the translations by category of a component if still valid."""
+        if (bundled := self.components.get(component)) is None or bundled["key"] != key:
+            return None
+        return bundled["categories"]  # type: ignore[no-any-return]
+
+    @callback
+    def async_set(
+        self,
+        component: str,
+        key: list[str | int | None],
+        categories: dict[str, dict[str, str]],
+    ) -> None:
+        """Add the translations by category of a component."""
+        self.components[component] = {"key": key, "categories": categories}
+        self.store.async_delay_save(self._data_to_save, BUNDLE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to store."""
+        return {"components": self.components}
+
+
 class _TranslationCache:
     """Cache for flattened translations."""
 
-    __slots__ = ("hass", "cache_data", "lock")
+    __slots__ = ("hass", "cache_data", "lock", "bundles", "json_cache")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the cache."""
         self.hass = hass
         self.cache_data = _TranslationsCacheData({}, {})
         self.lock = asyncio.Lock()
+        self.bundles: dict[str, _TranslationBundle] = {}
+        self.json_cache: dict[tuple[str, str, frozenset[str]], bytes] = {}
 
     @callback
     def async_is_loaded(self, language: str, components: set[str]) -> bool:
@@ -189,6 +279,17 @@ class _TranslationCache:
 
         return self.get_cached(language, category, components)
 
+    async def async_fetch_json(
+        self,
+        language: str,
+        category: str,
+        components: set[str],
+    ) -> bytes:
+        """Load resources into the cache and return them serialized as JSON."""
+        await self.async_load(language, components)
+
+        return self.get_cached_json(language, category, components)
+
     def get_cached(
         self,
         language: str,
@@ -208,6 +309,22 @@ class _TranslationCache:
             result.update(category_cache[component])
         return result
 
+    def get_cached_json(
+        self,
+        language: str,
+        category: str,
+        components: set[str],
+    ) -> bytes:
+        """Read resources from the cache serialized as JSON."""
+        key = (language, category, frozenset(components))
+        if (payload := self.json_cache.get(key)) is None:
+            if len(self.json_cache) >= MAX_JSON_CACHE_SIZE:
+                self.json_cache.clear()
+            payload = self.json_cache[key] = json_bytes(
+                self.get_cached(language, category, components)
+            )
+        return payload
+
     async def _async_load(self, language: str, components: set[str]) -> None:
         """Populate the cache for a given set of components."""
         loaded = self.cache_data.loaded
@@ -229,6 +346,56 @@ class _TranslationCache:
                 continue
             integrations[domain] = int_or_exc
 
+        if (bundle := self.bundles.get(language)) is None:
+            bundle = self.bundles[language] = _TranslationBundle(self.hass, language)
+            await bundle.async_load()
+        keys = await self.hass.async_add_executor_job(
+            _get_bundle_keys, languages, integrations
+        )
+        self.json_cache.clear()
+
+        language_cache = self.cache_data.cache.setdefault(language, {})
+        components_to_load: set[str] = set()
+        for component in components:
+            if (key := keys.get(component)) is None or (
+                categories := bundle.async_get(component, key)
+            ) is None:
+                components_to_load.add(component)
+                continue
+            for category, resources in categories.items():
+                language_cache.setdefault(category, {})[component] = resources
+
+        if components_to_load:
+            _LOGGER.debug(
+                "Loading translation files for %s: %s", language, components_to_load
+            )
+            await self._async_load_files(
+                language, languages, components_to_load, integrations
+            )
+
+            for component in components_to_load.intersection(keys):
+                bundle.async_set(
+                    component,
+                    keys[component],
+                    {
+                        category: category_cache[component]
+                        for category, category_cache in language_cache.items()
+                        if component in category_cache
+                    },
+                )
+
+        loaded[language].update(components)
+        self.json_cache.clear()
+
+    async def _async_load_files(
+        self,
+        language: str,
+        languages: list[str],
+        components: set[str],
+        integrations: dict[str, Integration],
+    ) -> None:
+        """Populate the cache from the translation files of components."""
+        loaded = self.cache_data.loaded
         translation_by_language_strings = await _async_get_component_strings(
             self.hass, languages, components, integrations
         )
@@ -253,8 +420,6 @@ class _TranslationCache:
                 )
                 loaded_english_components.update(components)
 
-        loaded[language].update(components)
-
     def _validate_placeholders(
         self,
         language: str,
@@ -346,18 +511,42 @@ async def async_get_translations(
     Otherwise, default to loaded integrations combined with config flow
     integrations if config_flow is true.
     """
-    if integrations is None and config_flow:
-        components = (await async_get_config_flows(hass)) - hass.config.components
-    elif integrations is not None:
-        components = set(integrations)
-    else:
-        components = hass.config.top_level_components
-
+    components = await _async_get_components(hass, integrations, config_flow)
     return await _async_get_translations_cache(hass).async_fetch(
         language, category, components
     )
 
 
+async def async_get_translations_json(
+    hass: HomeAssistant,
+    language: str,
+    category: str,
+    integrations: Iterable[str] | None = None,
+    config_flow: bool | None = None,
+) -> bytes:
+    """Return all backend translations serialized as JSON.
+
+    The serialized translations are cached until the translation cache changes.
+    """
+    components = await _async_get_components(hass, integrations, config_flow)
+    return await _async_get_translations_cache(hass).async_fetch_json(
+        language, category, components
+    )
+
+
+async def _async_get_components(
+    hass: HomeAssistant,
+    integrations: Iterable[str] | None,
+    config_flow: bool | None,
+) -> set[str]:
+    """Return the components to get translations for."""
+    if integrations is None and config_flow:
+        return (await async_get_config_flows(hass)) - hass.config.components
+    if integrations is not None:
+        return set(integrations)
+    return hass.config.top_level_components
+
+
 @callback
 def async_get_cached_translations(
     hass: HomeAssistant,
@@ -244,6 +244,7 @@ class Manifest(TypedDict, total=False):
     codeowners: list[str]
     loggers: list[str]
     import_executor: bool
+    lazy_setup: bool
     single_config_entry: bool
 
 
@@ -901,6 +902,11 @@ class Integration:
             return None
         return AwesomeVersion(self.manifest["version"])
 
+    @cached_property
+    def lazy_setup(self) -> bool:
+        """Return if setup can be deferred until the integration is used."""
+        return self.manifest.get("lazy_setup", False)
+
     @cached_property
     def single_config_entry(self) -> bool:
         """Return if the integration supports a single config entry only."""
@@ -312,6 +312,31 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 100k unique topics against 5k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.matcher import TopicMatcher
+
+    matcher = TopicMatcher()
+    for i in range(5000):
+        if i % 2:
+            matcher.add(f"zigbee2mqtt/device_{i}/+/state", i)
+        else:
+            matcher.add(f"tasmota/discovery/{i}/#", i)
+    topics = [
+        f"zigbee2mqtt/device_{i % 5000}/{i}/state"
+        if i % 2
+        else f"tasmota/discovery/{i % 5000}/tele/{i}"
+        for i in range(10**5)
+    ]
+
+    start = timer()
+    for topic in topics:
+        matcher.match(topic)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
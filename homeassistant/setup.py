@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 import contextlib
 import contextvars
 from enum import StrEnum
@@ -28,14 +28,18 @@ from .core import (
     DOMAIN as HOMEASSISTANT_DOMAIN,
     Event,
     HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
     callback,
 )
-from .exceptions import DependencyError, HomeAssistantError
-from .helpers import singleton, translation
+from .exceptions import DependencyError, HomeAssistantError, ServiceNotFound
+from .helpers import singleton, startup_trace, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
+from .util.yaml import load_yaml_dict
 
 current_setup_group: contextvars.ContextVar[tuple[str, str | None] | None] = (
     contextvars.ContextVar("current_setup_group", default=None)
@@ -76,6 +80,14 @@ DATA_SETUP_TIME: HassKey[
 
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
+# DATA_DEFERRED_SETUP is a dict, indicating domains of which the setup
+# is deferred until they are used:
+# - Configs are added to DATA_DEFERRED_SETUP during bootstrap by
+#   async_defer_setup_components, the key is the domain.
+# - Configs are removed from DATA_DEFERRED_SETUP when the domain
+#   is set up successfully.
+DATA_DEFERRED_SETUP: HassKey[dict[str, ConfigType]] = HassKey("deferred_setup")
+
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
     "bootstrap_persistent_errors"
 )
@@ -137,6 +149,94 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str])
     setup_done_futures.update({domain: hass.loop.create_future() for domain in domains})
 
 
+async def async_defer_setup_components(
+    hass: core.HomeAssistant,
+    integrations: Iterable[loader.Integration],
+    config: ConfigType,
+) -> None:
+    """Defer the setup of integrations until they are first used.
+
+    The services of the integrations are registered with handlers
+    that set up the integration and call its own service instead.
+    Websocket commands with the domain as prefix set up the
+    integration as well.
+    """
+    deferred = hass.data.setdefault(DATA_DEFERRED_SETUP, {})
+    integrations = list(integrations)
+    services = await hass.async_add_executor_job(
+        _load_deferred_services, [itg for itg in integrations if itg.has_services]
+    )
+    for integration in integrations:
+        domain = integration.domain
+        deferred[domain] = config
+        for service in services.get(domain, ()):
+            hass.services.async_register(
+                domain,
+                service,
+                partial(_async_handle_deferred_service, hass),
+                supports_response=SupportsResponse.OPTIONAL,
+            )
+        _LOGGER.debug("Deferred setup of %s", domain)
+
+
+def _load_deferred_services(
+    integrations: list[loader.Integration],
+) -> dict[str, list[str]]:
+    """Load the service names of integrations."""
+    services: dict[str, list[str]] = {}
+    for integration in integrations:
+        try:
+            services[integration.domain] = list(
+                load_yaml_dict(str(integration.file_path / "services.yaml"))
+            )
+        except (FileNotFoundError, HomeAssistantError) as err:
+            _LOGGER.warning(
+                "Unable to load services.yaml for the %s integration: %s",
+                integration.domain,
+                err,
+            )
+    return services
+
+
+async def _async_handle_deferred_service(
+    hass: core.HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Set up a deferred integration and call its service."""
+    domain = call.domain
+    if domain in hass.config.components:
+        # The integration did not register the service itself
+        hass.services.async_remove(domain, call.service)
+        raise ServiceNotFound(domain, call.service)
+    if not await async_setup_deferred_component(hass, domain):
+        raise HomeAssistantError(f"Unable to set up {domain}")
+    return await hass.services.async_call(
+        domain,
+        call.service,
+        call.data,
+        blocking=True,
+        context=call.context,
+        return_response=call.return_response,
+    )
+
+
+@callback
+def async_get_deferred_domains(hass: core.HomeAssistant) -> set[str]:
+    """Return the domains of which the setup is deferred until they are used."""
+    if (deferred := hass.data.get(DATA_DEFERRED_SETUP)) is None:
+        return set()
+    return set(deferred)
+
+
+async def async_setup_deferred_component(hass: core.HomeAssistant, domain: str) -> bool:
+    """Set up an integration of which the setup was deferred."""
+    if domain in hass.config.components:
+        return True
+    if (config := hass.data.get(DATA_DEFERRED_SETUP, {}).get(domain)) is None:
+        return False
+    _LOGGER.info("Setting up deferred integration %s", domain)
+    return await async_setup_component(hass, domain, config)
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -164,10 +264,15 @@ async def async_setup_component(
     setup_futures[domain] = setup_future
 
     try:
-        result = await _async_setup_component(hass, domain, config)
+        with startup_trace.async_trace_span(
+            hass, domain, startup_trace.SPAN_INTEGRATION
+        ):
+            result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
+        if result and (deferred := hass.data.get(DATA_DEFERRED_SETUP)):
+            deferred.pop(domain, None)
     except BaseException as err:
         futures = [setup_future]
         if setup_done_future := setup_done_futures.pop(domain, None):
@@ -311,7 +416,10 @@ async def _async_setup_component(
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
-        await async_process_deps_reqs(hass, config, integration)
+        with startup_trace.async_trace_span(
+            hass, domain, startup_trace.SPAN_DEPENDENCIES
+        ):
+            await async_process_deps_reqs(hass, config, integration)
     except HomeAssistantError as err:
         log_error(str(err))
         return False
@@ -319,14 +427,18 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with startup_trace.async_trace_span(hass, domain, startup_trace.SPAN_IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration, component
-    )
+    with startup_trace.async_trace_span(
+        hass, domain, startup_trace.SPAN_CONFIG_VALIDATION
+    ):
+        integration_config_info = await conf_util.async_process_component_config(
+            hass, config, integration, component
+        )
     conf_util.async_handle_component_errors(hass, integration_config_info, integration)
     processed_config = conf_util.async_drop_config_annotations(
         integration_config_info, integration
@@ -694,11 +806,12 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         return
 
     started = time.monotonic()
+    integration, group = running
     try:
-        yield
+        with startup_trace.async_trace_span(hass, integration, phase, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
-        integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -756,7 +869,8 @@ def async_start_setup(
     setup_started[current] = started
 
     try:
-        yield
+        with startup_trace.async_trace_span(hass, integration, phase, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
@@ -41,12 +41,41 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+class NodeCache:
+    """Composed node trees of configuration files keyed by file name.
+
+    Nodes hold the YAML source before constructors run, so !secret,
+    !env_var and !include are still resolved on every load and secrets
+    are never cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.nodes: dict[str, tuple[tuple[int, int], yaml.Node | None]] = {}
+
+    def retain(self, names: set[str]) -> None:
+        """Drop the nodes of files that were not loaded.
+
+        Called after loading the configuration, so the nodes of deleted,
+        renamed or no longer included files are not kept.
+        """
+        for name in self.nodes.keys() - names:
+            del self.nodes[name]
+
+
 class Secrets:
-    """Store secrets while loading YAML."""
+    """Store secrets while loading YAML.
 
-    def __init__(self, config_dir: Path) -> None:
+    If a node cache is passed, the configuration files loaded with these
+    secrets are only parsed again when their modification time or size
+    change. The names of these files are collected in loaded_files.
+    """
+
+    def __init__(self, config_dir: Path, node_cache: NodeCache | None = None) -> None:
         """Initialize secrets."""
         self.config_dir = config_dir
+        self.node_cache = node_cache
+        self.loaded_files: set[str] = set()
         self._cache: dict[Path, dict[str, str]] = {}
 
     def get(self, requester_path: str, secret: str) -> str:
@@ -221,10 +250,16 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Files loaded with secrets which have a node cache are parsed once
+    and only parsed again when their modification time or size change.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            if secrets is None or secrets.node_cache is None:
+                return parse_yaml(conf_file, secrets)
+            return _parse_yaml_cached(conf_file, secrets, secrets.node_cache)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -263,6 +298,44 @@ def parse_yaml(
         return _parse_yaml_python(content, secrets)
 
 
+def _parse_yaml_cached(
+    conf_file: TextIO, secrets: Secrets, node_cache: NodeCache
+) -> JSON_TYPE | None:
+    """Parse a YAML file reusing the nodes of the last parse if unchanged."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (OSError, ValueError):
+        return parse_yaml(conf_file, secrets)
+    name = os.fspath(conf_file.name)
+    secrets.loaded_files.add(name)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if (cached := node_cache.nodes.get(name)) is not None and cached[0] == signature:
+        if (node := cached[1]) is None:
+            return None
+        stream = StringIO()
+        stream.name = name
+        loader = FastSafeLoader(stream, secrets)
+        try:
+            return loader.construct_document(node)
+        finally:
+            loader.dispose()
+
+    loader = FastSafeLoader(conf_file, secrets)
+    try:
+        node = loader.get_single_node()
+        data = None if node is None else loader.construct_document(node)
+    except yaml.YAMLError:
+        # Load with the Python loader which has more readable exceptions
+        conf_file.seek(0, 0)
+        return _parse_yaml_python(conf_file, secrets)
+    finally:
+        loader.dispose()
+    # Only cache after the first construction since it flattens merge
+    # keys in place, later constructions then do not modify the nodes
+    node_cache.nodes[name] = (signature, node)
+    return data
+
+
 def _parse_yaml_python(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
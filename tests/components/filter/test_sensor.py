@@ -1,6 +1,10 @@
 """The test for the data filter sensor platform."""
 
+from collections import deque
 from datetime import timedelta
+from itertools import pairwise
+import random
+import statistics
 from unittest.mock import patch
 
 import pytest
@@ -493,6 +497,64 @@ def test_time_sma(values: list[State]) -> None:
     assert filtered.state == 21.5
 
 
+def test_long_history() -> None:
+    """Test the outlier and time_sma filters over a long history.
+
+    The filters update their window incrementally, the results are compared
+    with computing them over the whole window.
+    """
+    rng = random.Random(1)
+    now = dt_util.utcnow()
+    samples = []
+    for _ in range(2000):
+        now += timedelta(seconds=rng.randint(1, 60))
+        samples.append((now, float(rng.randint(0, 40))))
+
+    outlier = OutlierFilter(window_size=7, precision=None, entity=None, radius=10)
+    window: deque[float] = deque(maxlen=7)
+    for timestamp, value in samples:
+        median = statistics.median(window) if window else 0
+        expected = median if len(window) == 7 and abs(value - median) > 10 else value
+        window.append(value)
+        state = State("sensor.test_monitored", str(value), last_updated=timestamp)
+        assert outlier.filter_state(state).state == expected
+
+    time_sma = TimeSMAFilter(
+        window_size=timedelta(minutes=5), precision=None, entity=None, type="last"
+    )
+    for index, (timestamp, value) in enumerate(samples):
+        state = State("sensor.test_monitored", str(value), last_updated=timestamp)
+        filtered = time_sma.filter_state(state)
+        # Time weighted average of the values in the window before the state
+        start = timestamp - timedelta(minutes=5)
+        total = 0.0
+        if (first := samples[0][0]) > start:
+            total += (first - start).total_seconds() * samples[0][1]
+        for (previous, previous_value), (current, _) in pairwise(samples[: index + 1]):
+            if current > start:
+                total += (current - max(previous, start)).total_seconds() * (
+                    previous_value
+                )
+        assert filtered.state == pytest.approx(total / 300)
+
+
+def test_time_sma_no_drift() -> None:
+    """Test the time_sma filter doesn't drift after large values left the window."""
+    time_sma = TimeSMAFilter(
+        window_size=timedelta(minutes=5), precision=None, entity=None, type="last"
+    )
+    now = dt_util.utcnow()
+    for index in range(200):
+        value = 1e17 if index == 1 else 1.0
+        state = State(
+            "sensor.test_monitored",
+            str(value),
+            last_updated=now + timedelta(seconds=10 * index),
+        )
+        filtered = time_sma.filter_state(state)
+    assert filtered.state == 1.0
+
+
 async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Verify we can reload filter sensors."""
     hass.states.async_set("sensor.test_monitored", 12345)
@@ -23,6 +23,7 @@ from homeassistant.components.frontend import (
 )
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
@@ -492,10 +493,10 @@ async def test_get_panels_non_admin(
 async def test_get_translations(hass: HomeAssistant, ws_client) -> None:
     """Test get_translations command."""
     with patch(
-        "homeassistant.components.frontend.async_get_translations",
-        side_effect=lambda hass, lang, category, integrations, config_flow: {
-            "lang": lang
-        },
+        "homeassistant.components.frontend.async_get_translations_json",
+        side_effect=lambda hass, lang, category, integrations, config_flow: json_bytes(
+            {"lang": lang}
+        ),
     ):
         await ws_client.send_json(
             {
@@ -518,11 +519,10 @@ async def test_get_translations_for_integrations(
 ) -> None:
     """Test get_translations for integrations command."""
     with patch(
-        "homeassistant.components.frontend.async_get_translations",
-        side_effect=lambda hass, lang, category, integration, config_flow: {
-            "lang": lang,
-            "integration": integration,
-        },
+        "homeassistant.components.frontend.async_get_translations_json",
+        side_effect=lambda hass, lang, category, integration, config_flow: json_bytes(
+            {"lang": lang, "integration": integration}
+        ),
     ):
         await ws_client.send_json(
             {
@@ -546,11 +546,10 @@ async def test_get_translations_for_single_integration(
 ) -> None:
     """Test get_translations for integration command."""
     with patch(
-        "homeassistant.components.frontend.async_get_translations",
-        side_effect=lambda hass, lang, category, integrations, config_flow: {
-            "lang": lang,
-            "integration": integrations,
-        },
+        "homeassistant.components.frontend.async_get_translations_json",
+        side_effect=lambda hass, lang, category, integrations, config_flow: json_bytes(
+            {"lang": lang, "integration": integrations}
+        ),
     ):
         await ws_client.send_json(
             {
@@ -0,0 +1,146 @@
+"""The tests for the history export."""
+
+from datetime import timedelta
+from http import HTTPStatus
+import math
+import struct
+from typing import Any
+
+from homeassistant.components.history.export import (
+    CONTENT_TYPE_HISTORY_EXPORT,
+    EXPORT_MAGIC,
+    EXPORT_VERSION,
+    SERIES_STATES,
+    SERIES_STATISTICS,
+    STATISTIC_COLUMNS,
+)
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import ClientSessionGenerator
+
+
+def _decode_export(data: bytes) -> list[tuple[int, str, dict[str, Any]]]:
+    """Decode an export following the documented format."""
+    offset = 0
+
+    def _unpack(fmt: str) -> tuple[Any, ...]:
+        nonlocal offset
+        values = struct.unpack_from(fmt, data, offset)
+        offset += struct.calcsize(fmt)
+        return values
+
+    def _read_str(length: int) -> str:
+        nonlocal offset
+        value = data[offset : offset + length].decode()
+        offset += length
+        return value
+
+    assert _unpack("<4sB") == (EXPORT_MAGIC, EXPORT_VERSION)
+    series = []
+    while offset < len(data):
+        kind, id_length = _unpack("<BH")
+        series_id = _read_str(id_length)
+        (rows,) = _unpack("<I")
+        if kind == SERIES_STATES:
+            timestamps = _unpack(f"<{rows}d")
+            (distinct_count,) = _unpack("<I")
+            distinct = [_read_str(_unpack("<H")[0]) for _ in range(distinct_count)]
+            states = [distinct[idx] for idx in _unpack(f"<{rows}I")]
+            series.append((kind, series_id, {"ts": timestamps, "states": states}))
+            continue
+        assert kind == SERIES_STATISTICS
+        columns = {"start": _unpack(f"<{rows}d")}
+        for column in STATISTIC_COLUMNS:
+            columns[column] = _unpack(f"<{rows}d")
+        series.append((kind, series_id, columns))
+    return series
+
+
+async def test_export(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test exporting states and statistics."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    hass.states.async_set("sensor.power", "on")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", "off")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", "on")
+    await async_wait_recording_done(hass)
+
+    period = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {"start": period, "state": 0, "sum": 2},
+            {"start": period + timedelta(hours=1), "state": 1, "sum": 3},
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/export/{(now - timedelta(hours=3)).isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power,sensor.missing",
+            "statistic_ids": "test:total_energy_import",
+        },
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == CONTENT_TYPE_HISTORY_EXPORT
+
+    states, stats = _decode_export(await response.read())
+    assert states[:2] == (SERIES_STATES, "sensor.power")
+    assert states[2]["states"] == ["on", "off", "on"]
+    assert list(states[2]["ts"]) == sorted(states[2]["ts"])
+
+    assert stats[:2] == (SERIES_STATISTICS, "test:total_energy_import")
+    assert stats[2]["start"] == (
+        period.timestamp(),
+        (period + timedelta(hours=1)).timestamp(),
+    )
+    assert stats[2]["state"] == (0, 1)
+    assert stats[2]["sum"] == (2, 3)
+    assert all(math.isnan(value) for value in stats[2]["mean"])
+
+
+async def test_export_invalid_requests(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test invalid export requests are rejected."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_client()
+
+    response = await client.get("/api/history/export")
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+    response = await client.get(
+        "/api/history/export", params={"filter_entity_id": "invalid"}
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+    response = await client.get(
+        "/api/history/export",
+        params={"filter_entity_id": "sensor.power", "period": "year"},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+    response = await client.get(
+        "/api/history/export/invalid", params={"filter_entity_id": "sensor.power"}
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
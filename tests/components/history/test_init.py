@@ -3,7 +3,7 @@
 from datetime import timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -12,6 +12,7 @@ from homeassistant.components import history
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import execute_stmt_lambda_element
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.json import JSONEncoder
@@ -454,6 +455,76 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_fetch_period_api_ndjson(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view streams one line per entity as NDJSON."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    hass.states.async_set("sensor.power", 0)
+    hass.states.async_set("sensor.energy", 1)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", 50)
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}",
+        params={"filter_entity_id": "sensor.power,sensor.missing,sensor.energy"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/x-ndjson"
+    lines = (await response.text()).splitlines()
+    assert len(lines) == 2
+    power, energy = (json.loads(line) for line in lines)
+    assert [state["state"] for state in power] == ["0", "50"]
+    assert [state["entity_id"] for state in energy] == ["sensor.energy"]
+
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}",
+        params={"filter_entity_id": "sensor.power,sensor.missing,sensor.energy"},
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == [power, energy]
+
+
+async def test_fetch_period_api_long_period_single_query(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the states of several entities over a long period use a single query."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    hass.states.async_set("sensor.power", 0)
+    hass.states.async_set("sensor.energy", 1)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", 50)
+    hass.states.async_set("sensor.energy", 2)
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.recorder.history.modern.execute_stmt_lambda_element",
+        wraps=execute_stmt_lambda_element,
+    ) as mock_execute:
+        response = await client.get(
+            f"/api/history/period/{(now - timedelta(days=3)).isoformat()}",
+            params={
+                "filter_entity_id": "sensor.power,sensor.energy",
+                "end_time": (now + timedelta(days=1)).isoformat(),
+                "minimal_response": "",
+            },
+        )
+        assert response.status == HTTPStatus.OK
+        power, energy = await response.json()
+
+    assert mock_execute.call_count == 1
+    # The period is longer than a day, so the rows are read in batches
+    assert mock_execute.call_args.args[2] == now - timedelta(days=3)
+    assert [state["state"] for state in power] == ["0", "50"]
+    assert [state["state"] for state in energy] == ["1", "2"]
+
+
 async def test_fetch_period_api_with_no_timestamp(
     hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
 ) -> None:
@@ -518,6 +589,53 @@ async def test_entity_ids_limit_via_api(
     assert response_json[1][0]["entity_id"] == "light.cow"
 
 
+async def test_entity_ids_order_via_api(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test history is returned in the order of the requested entity_ids."""
+    await async_setup_component(
+        hass,
+        "history",
+        {"history": {}},
+    )
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.nomatch", "on")
+
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}"
+        "?filter_entity_id=light.cow,light.unknown,light.nomatch,light.kitchen",
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert [states[0]["entity_id"] for states in response_json] == [
+        "light.cow",
+        "light.nomatch",
+        "light.kitchen",
+    ]
+
+    when = dt_util.utcnow()
+    hass.states.async_set("light.cow", "off")
+    hass.states.async_set("light.nomatch", "off")
+
+    await async_wait_recording_done(hass)
+
+    # Entities without states in the period are skipped
+    response = await client.get(
+        f"/api/history/period/{when.isoformat()}"
+        "?filter_entity_id=light.nomatch,light.kitchen,light.cow&skip_initial_state",
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert [states[0]["entity_id"] for states in response_json] == [
+        "light.nomatch",
+        "light.cow",
+    ]
+
+
 async def test_entity_ids_limit_via_api_with_skip_initial_state(
     hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
 ) -> None:
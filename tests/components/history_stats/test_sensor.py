@@ -1,5 +1,6 @@
 """The test for the History Statistics sensor platform."""
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -275,16 +276,34 @@ async def test_measure_multiple(recorder_mock: Recorder, hass: HomeAssistant) ->
             "input_select.test_id": [
                 # Because we use include_start_time_state we need to mock
                 # value at start
-                ha.State("input_select.test_id", "", last_changed=start_time),
-                ha.State("input_select.test_id", "orange", last_changed=t0),
-                ha.State("input_select.test_id", "default", last_changed=t1),
-                ha.State("input_select.test_id", "blue", last_changed=t2),
+                ha.State(
+                    "input_select.test_id",
+                    "",
+                    last_changed=start_time,
+                    last_updated=start_time,
+                ),
+                ha.State(
+                    "input_select.test_id", "orange", last_changed=t0, last_updated=t0
+                ),
+                ha.State(
+                    "input_select.test_id", "default", last_changed=t1, last_updated=t1
+                ),
+                ha.State(
+                    "input_select.test_id", "blue", last_changed=t2, last_updated=t2
+                ),
             ]
         }
 
-    with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        _fake_states,
+    # The history of the entities is fetched with a single query
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        patch(
+            "homeassistant.components.recorder.history.get_significant_states",
+            _fake_states,
+        ),
     ):
         await async_setup_component(
             hass,
@@ -1153,6 +1172,39 @@ async def test_reload_before_start_event(
     assert hass.states.get("sensor.second_test")
 
 
+async def test_setup_while_starting(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recorder is not waited for while Home Assistant is starting.
+
+    The recorder only commits once Home Assistant has started.
+    """
+    hass.state = ha.CoreState.starting
+    hass.states.async_set("binary_sensor.test_id", "on")
+
+    with patch.object(recorder_mock, "async_block_till_done") as mock_sync:
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "test",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "duration": "01:00",
+                },
+            },
+        )
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.test").state == "0.0"
+    mock_sync.assert_not_called()
+
+
 async def test_measure_sliding_window(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1727,3 +1779,166 @@ async def test_unique_id(
         entity_registry.async_get("sensor.test").unique_id
         == "some_history_stats_unique_id"
     )
+
+
+async def test_sliding_window_shares_timeline(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors of an entity share its timeline while the period slides."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    t0 = start_time - timedelta(minutes=30)
+    calls = 0
+
+    def _fake_states(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return {
+            "binary_sensor.test_id": [
+                ha.State(
+                    "binary_sensor.test_id",
+                    "on",
+                    last_changed=t0 - timedelta(hours=1),
+                    last_updated=t0 - timedelta(hours=1),
+                ),
+                ha.State(
+                    "binary_sensor.test_id", "off", last_changed=t0, last_updated=t0
+                ),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(start_time) as freezer,
+    ):
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor2",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "end": "{{ utcnow() }}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+        assert hass.states.get("sensor.sensor2").state == "1"
+
+        freezer.tick(timedelta(minutes=10))
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(minutes=20))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        # The state at the start of the period is off now
+        assert hass.states.get("sensor.sensor1").state == "0.33"
+        assert hass.states.get("sensor.sensor2").state == "1"
+        # The first refresh before tracking the state changes and the shared
+        # timeline queried the database
+        assert calls == 2
+
+
+async def test_timeline_keeps_changes_during_load(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test state changes while the timeline loads from the database are kept."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    loading = asyncio.Event()
+    loaded = asyncio.Event()
+    block = False
+    calls = 0
+
+    async def _fake_preload(
+        hass: HomeAssistant, start: datetime, end: datetime, **kwargs
+    ) -> list[ha.State]:
+        nonlocal calls
+        calls += 1
+        if block:
+            loading.set()
+            await loaded.wait()
+        return [
+            ha.State(
+                "binary_sensor.test_id",
+                "on",
+                last_changed=start_time - timedelta(hours=2),
+                last_updated=start_time - timedelta(hours=2),
+            ),
+            # The current state is known from tracking the state changes
+            ha.State(
+                "binary_sensor.test_id",
+                "off",
+                last_changed=start_time,
+                last_updated=start_time,
+            ),
+        ]
+
+    with (
+        patch(
+            "homeassistant.components.history_stats.data."
+            "async_preload_state_changes_during_period",
+            _fake_preload,
+        ),
+        freeze_time(start_time) as freezer,
+    ):
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+
+        block = True
+        freezer.tick(timedelta(minutes=10))
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await loading.wait()
+        freezer.tick(timedelta(minutes=5))
+        hass.states.async_set("binary_sensor.test_id", "off")
+        loaded.set()
+        await hass.async_block_till_done()
+
+        # On for 45 minutes before and 5 minutes after the start
+        assert hass.states.get("sensor.sensor1").state == "0.83"
+
+        freezer.tick(timedelta(minutes=10))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        # On for 35 minutes before and 5 minutes after the start
+        assert hass.states.get("sensor.sensor1").state == "0.67"
+        assert calls == 2
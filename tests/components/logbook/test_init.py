@@ -41,7 +41,7 @@ from homeassistant.const import (
     STATE_ON,
 )
 import homeassistant.core as ha
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import Context, Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.json import JSONEncoder
@@ -281,6 +281,42 @@ def test_process_custom_logbook_entries(hass_) -> None:
     assert_entry(entries[0], name=name, message=message, entity_id=entity_id)
 
 
+def test_context_origin_described_once(hass_) -> None:
+    """Test the origin of a shared context is only described once."""
+    described = []
+
+    def _describe(event):
+        described.append(event)
+        return {"name": "Test", "message": "triggered"}
+
+    hass_.data[logbook.DOMAIN].external_events["test_event"] = ("test", _describe)
+    context = Context()
+    rows = [MockRow("test_event", {}, context)]
+    rows.extend(
+        MockRow(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {
+                logbook.ATTR_NAME: f"Entry {idx}",
+                logbook.ATTR_MESSAGE: "caused by test",
+                logbook.ATTR_ENTITY_ID: "sun.sun",
+            },
+            context,
+        )
+        for idx in range(3)
+    )
+
+    entries = mock_humanify(hass_, rows)
+
+    assert len(entries) == 4
+    for entry in entries[1:]:
+        assert entry["context_event_type"] == "test_event"
+        assert entry["context_domain"] == "test"
+        assert entry["context_name"] == "Test"
+        assert entry["context_message"] == "triggered"
+    # Once for the origin row itself and once for the context
+    assert len(described) == 2
+
+
 def assert_entry(
     entry, when=None, name=None, message=None, domain=None, entity_id=None
 ):
@@ -382,6 +418,34 @@ async def test_logbook_view(
     assert response.status == HTTPStatus.OK
 
 
+async def test_logbook_view_streams_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the logbook view streams as a JSON array or NDJSON."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow().isoformat()
+    for idx in range(250):
+        logbook.async_log_entry(hass, "Test", f"message {idx}", "test")
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+
+    response = await client.get(f"/api/logbook/{start}")
+    assert response.status == HTTPStatus.OK
+    entries = await response.json()
+    assert [entry["message"] for entry in entries] == [
+        f"message {idx}" for idx in range(250)
+    ]
+
+    response = await client.get(
+        f"/api/logbook/{start}", headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/x-ndjson"
+    lines = (await response.text()).splitlines()
+    assert [json.loads(line) for line in lines] == entries
+
+
 async def test_logbook_view_invalid_start_date_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
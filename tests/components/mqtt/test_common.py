@@ -1190,7 +1190,7 @@ async def help_test_entity_id_update_subscriptions(
     assert mqtt_mock.async_subscribe.call_count == len(topics) + 2 + DISCOVERY_COUNT
     for topic in topics:
         mqtt_mock.async_subscribe.assert_any_call(
-            topic, ANY, ANY, ANY, HassJobType.Callback
+            topic, ANY, ANY, ANY, HassJobType.Callback, ANY
         )
     mqtt_mock.async_subscribe.reset_mock()
 
@@ -1206,7 +1206,7 @@ async def help_test_entity_id_update_subscriptions(
     assert state is not None
     for topic in topics:
         mqtt_mock.async_subscribe.assert_any_call(
-            topic, ANY, ANY, ANY, HassJobType.Callback
+            topic, ANY, ANY, ANY, HassJobType.Callback, ANY
         )
 
 
@@ -40,6 +40,13 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
+        "mqtt_message_stats": {
+            "coalesced": 0,
+            "dropped": 0,
+            "published": 0,
+            "publish_latency": None,
+            "publish_queue_max_depth": 0,
+        },
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
 
@@ -125,6 +132,13 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
+        "mqtt_message_stats": {
+            "coalesced": 0,
+            "dropped": 0,
+            "published": 0,
+            "publish_latency": None,
+            "publish_queue_max_depth": 0,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -134,6 +148,13 @@ async def test_entry_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": default_config,
+        "mqtt_message_stats": {
+            "coalesced": 0,
+            "dropped": 0,
+            "published": 0,
+            "publish_latency": None,
+            "publish_queue_max_depth": 0,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -254,6 +275,13 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
+        "mqtt_message_stats": {
+            "coalesced": 0,
+            "dropped": 0,
+            "published": 0,
+            "publish_latency": None,
+            "publish_queue_max_depth": 0,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -263,6 +291,13 @@ async def test_redact_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": expected_config,
+        "mqtt_message_stats": {
+            "coalesced": 0,
+            "dropped": 0,
+            "published": 0,
+            "publish_latency": None,
+            "publish_queue_max_depth": 0,
+        },
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -289,5 +324,12 @@ async def test_redact_diagnostics(
             "entities": [],
         },
         "mqtt_config": expected_config,
+        "mqtt_message_stats": {
+            "coalesced": 0,
+            "dropped": 0,
+            "published": 0,
+            "publish_latency": None,
+            "publish_queue_max_depth": 0,
+        },
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
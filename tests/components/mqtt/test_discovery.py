@@ -5,6 +5,7 @@ import copy
 import json
 from pathlib import Path
 import re
+from typing import Any
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
@@ -797,6 +798,81 @@ async def test_rapid_reconfigure(
     assert events[2].data["new_state"].attributes["friendly_name"] == "Wine"
 
 
+async def test_discovery_burst_is_batched(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test components discovered while reading a burst are added in one batch."""
+    await mqtt_mock_entry()
+    batches: list[list[MQTTDiscoveryPayload]] = []
+    async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_NEW.format("binary_sensor", "mqtt"), batches.append
+    )
+
+    def _loop_read(max_packets: int) -> int:
+        for object_id in ("beer", "milk", "wine"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/{object_id}/config",
+                f'{{ "name": "{object_id}", "state_topic": "test-topic" }}',
+            )
+        assert not batches
+        return 0
+
+    mqtt_client_mock.loop_read.side_effect = _loop_read
+    hass.data["mqtt"].client._async_reader_callback(mqtt_client_mock)
+    await hass.async_block_till_done()
+
+    assert [
+        [payload.discovery_data["discovery_hash"] for payload in batch]
+        for batch in batches
+    ] == [
+        [
+            ("binary_sensor", "beer"),
+            ("binary_sensor", "milk"),
+            ("binary_sensor", "wine"),
+        ]
+    ]
+    assert len(hass.states.async_entity_ids("binary_sensor")) == 3
+
+
+async def test_discovery_platform_setup_failed(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test components are logged and discovered again if the platform failed."""
+    await mqtt_mock_entry()
+    with patch(
+        "homeassistant.components.mqtt.discovery.async_forward_entry_setup_and_setup_discovery",
+        side_effect=RuntimeError("Boom"),
+    ):
+        for object_id in ("beer", "milk"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/{object_id}/config",
+                f'{{ "name": "{object_id}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+    assert "Error setting up MQTT binary_sensor platform" in caplog.text
+    for object_id in ("beer", "milk"):
+        assert (
+            f"Discovered binary_sensor {object_id} was not added as its platform"
+            " failed to set up"
+        ) in caplog.text
+    assert not hass.states.async_entity_ids("binary_sensor")
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/beer/config",
+        '{ "name": "beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+
 async def test_duplicate_removal(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1777,20 +1853,19 @@ async def test_update_with_bad_config_not_breaks_discovery(
 
 
 @pytest.mark.parametrize(
-    "signal_message",
+    ("signal_message", "test_data"),
     [
-        MQTT_DISCOVERY_NEW,
-        MQTT_DISCOVERY_UPDATED,
-        MQTT_DISCOVERY_DONE,
+        (MQTT_DISCOVERY_NEW, [{"name": "test", "state_topic": "test-topic"}]),
+        (MQTT_DISCOVERY_UPDATED, {"name": "test", "state_topic": "test-topic"}),
+        (MQTT_DISCOVERY_DONE, {"name": "test", "state_topic": "test-topic"}),
     ],
 )
 async def test_discovery_dispatcher_signal_type_messages(
-    hass: HomeAssistant, signal_message: SignalTypeFormat[MQTTDiscoveryPayload]
+    hass: HomeAssistant, signal_message: SignalTypeFormat[Any], test_data: Any
 ) -> None:
     """Test discovery dispatcher messages."""
 
     domain_id_tuple = ("sensor", "very_unique")
-    test_data = {"name": "test", "state_topic": "test-topic"}
     calls = []
 
     def _callback(*args) -> None:
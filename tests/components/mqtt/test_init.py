@@ -45,7 +45,13 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 import homeassistant.core as ha
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJobType,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr, entity_registry as er, template
 from homeassistant.helpers.entity import Entity
@@ -313,6 +319,106 @@ async def test_publish(
     publish_mock.reset_mock()
 
 
+@patch("homeassistant.components.mqtt.client.MAX_INFLIGHT_MESSAGES", (1, 1, 1))
+async def test_publish_queue(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test published messages are queued and handed over within the limits."""
+    mqtt_mock = await mqtt_mock_entry()
+    publish_mock: MagicMock = mqtt_mock._mqttc.publish
+    publish_mock.reset_mock()
+
+    tasks = [
+        hass.async_create_task(mqtt.async_publish(hass, topic, payload, 0, retain))
+        for topic, payload, retain in (
+            ("state-topic", "state", True),
+            ("command-topic", "1", False),
+            ("echo-topic", "echo", True),
+            ("echo-topic", "3", False),
+            ("command-topic", "2", False),
+        )
+    ]
+    # Messages are handed over in the next iteration of the event loop
+    assert not publish_mock.called
+    await asyncio.sleep(0)
+    # Only one QoS 0 message may be in flight
+    assert publish_mock.call_count == 1
+    await asyncio.gather(*tasks)
+
+    # Commands are published before retained messages, but messages on a
+    # topic are published in order
+    assert [call_args[0] for call_args in publish_mock.call_args_list] == [
+        ("command-topic", "1", 0, False),
+        ("command-topic", "2", 0, False),
+        ("state-topic", "state", 0, True),
+        ("echo-topic", "echo", 0, True),
+        ("echo-topic", "3", 0, False),
+    ]
+    mqtt_data = hass.data["mqtt"]
+    assert mqtt_data.messages_published == 5
+    assert mqtt_data.publish_queue_max_depth == 5
+
+
+@patch("homeassistant.components.mqtt.client.MAX_INFLIGHT_MESSAGES", (1, 1, 1))
+async def test_publish_queue_limit_per_qos(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test messages only wait for the limit of their QoS level and topic."""
+    mqtt_mock = await mqtt_mock_entry()
+    publish_mock: MagicMock = mqtt_mock._mqttc.publish
+    publish_mock.reset_mock()
+
+    tasks = [
+        hass.async_create_task(mqtt.async_publish(hass, topic, "payload", qos))
+        for topic, qos in (
+            ("topic-a", 1),
+            ("topic-b", 1),
+            ("topic-c", 0),
+            ("topic-b", 0),
+        )
+    ]
+    await asyncio.sleep(0)
+    # QoS 0 is not blocked by QoS 1, but messages on a topic keep their order
+    assert [call_args[0][:3:2] for call_args in publish_mock.call_args_list] == [
+        ("topic-a", 1),
+        ("topic-c", 0),
+    ]
+    await asyncio.gather(*tasks)
+    assert [call_args[0][:3:2] for call_args in publish_mock.call_args_list] == [
+        ("topic-a", 1),
+        ("topic-c", 0),
+        ("topic-b", 1),
+        ("topic-b", 0),
+    ]
+
+
+async def test_publish_queue_error(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test an error handing over a message is raised to its publisher only."""
+    mqtt_mock = await mqtt_mock_entry()
+    publish_mock: MagicMock = mqtt_mock._mqttc.publish
+    publish_mock.reset_mock()
+    publish = publish_mock.side_effect
+
+    def _publish(topic: str, payload: Any, qos: int, retain: bool) -> Any:
+        if topic == "bad-topic":
+            raise ValueError("Invalid topic")
+        return publish(topic, payload, qos, retain)
+
+    publish_mock.side_effect = _publish
+    tasks = [
+        hass.async_create_task(mqtt.async_publish(hass, topic, "payload"))
+        for topic in ("good-topic", "bad-topic", "other-topic")
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert results[2] is None
+    assert publish_mock.call_count == 3
+    assert hass.data["mqtt"].messages_published == 2
+
+
 async def test_convert_outgoing_payload(hass: HomeAssistant) -> None:
     """Test the converting of outgoing MQTT payloads without template."""
     command_template = mqtt.MqttCommandTemplate(None, hass=hass)
@@ -469,6 +575,51 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+@pytest.mark.parametrize(
+    ("value_template", "payload", "rendered"),
+    [
+        ("{{ value_json.id }}", '{"id": 4321}', "4321"),
+        ("{{value_json.a.b}}", '{"a": {"b": true}}', "True"),
+        ("{{ value_json['a b'][1] }}", '{"a b": [1, " two "]}', "two"),
+        ('{{ value_json["a"] }}', '{"a": {"b": null}}', "{'b': None}"),
+        ("{{ value_json['items'] }}", '{"items": 1.5}', "1.5"),
+    ],
+)
+async def test_value_template_json_path(
+    hass: HomeAssistant, value_template: str, payload: str, rendered: str
+) -> None:
+    """Test templates only looking up a JSON value are not rendered."""
+    tpl = template.Template(value_template, hass)
+    val_tpl = mqtt.MqttValueTemplate(tpl, hass=hass)
+    assert tpl.async_render_with_possible_json_value(payload) == rendered
+    with patch(
+        "homeassistant.helpers.template.Template.async_render_with_possible_json_value"
+    ) as mock_render:
+        assert val_tpl.async_render_with_possible_json_value(payload) == rendered
+    assert not mock_render.called
+
+
+@pytest.mark.parametrize(
+    ("value_template", "payload", "rendered"),
+    [
+        # Missing keys render an empty string
+        ("{{ value_json.id }}", '{"other": 1}', ""),
+        # Attributes take precedence over keys
+        ("{{ value_json.items }}", '{"items": 1}', "<built-in method items"),
+        # Not a JSON payload
+        ("{{ value_json.id }}", "ON", ""),
+        ("{{ value_json[0] }}", '{"0": 1}', ""),
+    ],
+)
+async def test_value_template_json_path_fallback(
+    hass: HomeAssistant, value_template: str, payload: str, rendered: str
+) -> None:
+    """Test templates looking up a JSON value are rendered if the lookup fails."""
+    tpl = template.Template(value_template, hass)
+    val_tpl = mqtt.MqttValueTemplate(tpl, hass=hass)
+    assert val_tpl.async_render_with_possible_json_value(payload).startswith(rendered)
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
@@ -1067,6 +1218,121 @@ async def test_subscribe_topic(
         unsub()
 
 
+async def test_subscribe_topic_coalesce(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test coalescing messages read at once on a topic."""
+    await mqtt_mock_entry()
+    client = hass.data["mqtt"].client
+    mock_process_write_state_requests = Mock()
+    # Messages with the number of messages handled before them
+    coalesced_calls: list[tuple[str, Any, int]] = []
+    calls: list[tuple[str, Any, int]] = []
+    mqtt.client.async_subscribe_internal(
+        hass,
+        "test-topic/#",
+        lambda msg: coalesced_calls.append(
+            (msg.topic, msg.payload, mock_process_write_state_requests.call_count)
+        ),
+        job_type=HassJobType.Callback,
+        coalesce=True,
+    )
+    mqtt.client.async_subscribe_internal(
+        hass,
+        "test-topic/#",
+        lambda msg: calls.append(
+            (msg.topic, msg.payload, mock_process_write_state_requests.call_count)
+        ),
+        job_type=HassJobType.Callback,
+    )
+
+    def _loop_read(max_packets: int) -> int:
+        for topic, payload in (
+            ("test-topic/a", "1"),
+            ("test-topic/b", "2"),
+            ("test-topic/a", "3"),
+            ("test-topic/a", "4"),
+        ):
+            async_fire_mqtt_message(hass, topic, payload)
+        assert not calls
+        assert not coalesced_calls
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_client_mock.loop_read.side_effect = _loop_read
+    with patch.object(
+        hass.data["mqtt"].state_write_requests,
+        "process_write_state_requests",
+        mock_process_write_state_requests,
+    ):
+        client._async_reader_callback(mqtt_client_mock)
+
+    # The latest message on a topic is passed in the order it was received
+    assert coalesced_calls == [("test-topic/b", "2", 1), ("test-topic/a", "4", 3)]
+    assert calls == [
+        ("test-topic/a", "1", 0),
+        ("test-topic/b", "2", 1),
+        ("test-topic/a", "3", 2),
+        ("test-topic/a", "4", 3),
+    ]
+    # State writes are processed after each message they were requested for
+    assert [
+        (call_args[0][0].topic, call_args[0][0].payload)
+        for call_args in mock_process_write_state_requests.call_args_list
+    ] == [
+        ("test-topic/a", b"1"),
+        ("test-topic/b", b"2"),
+        ("test-topic/a", b"3"),
+        ("test-topic/a", b"4"),
+    ]
+    assert hass.data["mqtt"].messages_coalesced == 1
+    assert hass.data["mqtt"].messages_dropped == 2
+
+    # Messages not read in a batch are delivered right away
+    async_fire_mqtt_message(hass, "test-topic/a", "5")
+    assert coalesced_calls[-1][:2] == ("test-topic/a", "5")
+    assert calls[-1][:2] == ("test-topic/a", "5")
+
+
+async def test_subscribe_topic_coalesce_retained(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test coalescing retained messages read at once on a topic."""
+    await mqtt_mock_entry()
+    client = hass.data["mqtt"].client
+    coalesced_calls: list[tuple[str, Any, bool]] = []
+    calls: list[tuple[str, Any, bool]] = []
+    mqtt.client.async_subscribe_internal(
+        hass,
+        "test-topic",
+        lambda msg: coalesced_calls.append((msg.topic, msg.payload, msg.retain)),
+        job_type=HassJobType.Callback,
+        coalesce=True,
+    )
+    mqtt.client.async_subscribe_internal(
+        hass,
+        "test-topic",
+        lambda msg: calls.append((msg.topic, msg.payload, msg.retain)),
+        job_type=HassJobType.Callback,
+    )
+
+    def _loop_read(max_packets: int) -> int:
+        async_fire_mqtt_message(hass, "test-topic", "1", retain=True)
+        async_fire_mqtt_message(hass, "test-topic", "2", retain=True)
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_client_mock.loop_read.side_effect = _loop_read
+    client._async_reader_callback(mqtt_client_mock)
+
+    # The superseded retained message doesn't hide the latest one
+    assert coalesced_calls == [("test-topic", "2", True)]
+    # Only the first retained message is passed to other subscriptions
+    assert calls == [("test-topic", "1", True)]
+
+
 async def test_subscribe_topic_not_initialize(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -0,0 +1,66 @@
+"""The tests for the MQTT topic matcher."""
+
+import pytest
+
+from homeassistant.components.mqtt.matcher import TopicMatcher
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("test/topic", "test/topic", True),
+        ("test/topic", "test/topic/", False),
+        ("test/+", "test/topic", True),
+        ("test/+", "test/topic/more", False),
+        ("test/+", "test", False),
+        ("test/+", "test/", True),
+        ("test/+/state", "test/device/state", True),
+        ("test/+/state", "test/device/other", False),
+        ("test/#", "test", True),
+        ("test/#", "test/topic", True),
+        ("test/#", "test/topic/more", True),
+        ("test/#", "other/topic", False),
+        ("+/+", "/finance", True),
+        ("/+", "/finance", True),
+        ("+", "/finance", False),
+        ("#", "test/topic", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics follows the MQTT specification."""
+    matcher: TopicMatcher[str] = TopicMatcher()
+    matcher.add(topic_filter, topic_filter)
+
+    assert matcher.match(topic) == ([topic_filter] if matches else [])
+
+
+def test_add_remove() -> None:
+    """Test adding and removing values."""
+    matcher: TopicMatcher[str] = TopicMatcher()
+    matcher.add("test/+/state", "a")
+    matcher.add("test/+/state", "b")
+    matcher.add("test/#", "c")
+
+    assert sorted(matcher.match("test/device/state")) == ["a", "b", "c"]
+    assert sorted(matcher) == ["a", "b", "c"]
+    assert matcher.has_topic_filter("test/+/state")
+    assert not matcher.has_topic_filter("test/+")
+
+    matcher.remove("test/+/state", "a")
+    assert sorted(matcher.match("test/device/state")) == ["b", "c"]
+    with pytest.raises(KeyError):
+        matcher.remove("test/+/state", "a")
+    with pytest.raises(KeyError):
+        matcher.remove("test/+/other", "b")
+
+    matcher.remove("test/+/state", "b")
+    assert not matcher.has_topic_filter("test/+/state")
+    assert matcher.match("test/device/state") == ["c"]
+
+    matcher.remove("test/#", "c")
+    assert list(matcher) == []
+    assert matcher.match("test/device/state") == []
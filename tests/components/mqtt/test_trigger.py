@@ -253,7 +253,7 @@ async def test_encoding_default(
     )
 
     setup_comp.async_subscribe.assert_called_with(
-        "test-topic", ANY, 0, "utf-8", HassJobType.Callback
+        "test-topic", ANY, 0, "utf-8", HassJobType.Callback, False
     )
 
 
@@ -273,5 +273,5 @@ async def test_encoding_custom(
     )
 
     setup_comp.async_subscribe.assert_called_with(
-        "test-topic", ANY, 0, None, HassJobType.Callback
+        "test-topic", ANY, 0, None, HassJobType.Callback, False
     )
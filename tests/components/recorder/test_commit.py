@@ -0,0 +1,52 @@
+"""Test the recorder commit controller."""
+
+from homeassistant.components.recorder.commit import (
+    COMMIT_BACKLOG_HIGH,
+    COMMIT_BACKLOG_LOW,
+    MAX_COMMIT_INTERVAL_FACTOR,
+    CommitController,
+)
+
+
+def test_commit_interval_adapts_to_backlog() -> None:
+    """Test the interval grows under load and shrinks once the queue drains."""
+    controller = CommitController(5, is_sqlite=True)
+    assert controller.interval == 5
+
+    controller.pending_rows = 10
+    controller.record_commit(0.25, COMMIT_BACKLOG_HIGH)
+    assert controller.interval == 10
+    assert controller.last_commit_rows == 10
+    assert controller.last_commit_duration == 0.25
+    assert controller.last_commit_backlog == COMMIT_BACKLOG_HIGH
+    assert controller.pending_rows == 0
+
+    for _ in range(10):
+        controller.record_commit(0.1, COMMIT_BACKLOG_HIGH)
+    assert controller.interval == 5 * MAX_COMMIT_INTERVAL_FACTOR
+
+    # Between the marks the interval is kept
+    controller.record_commit(0.1, COMMIT_BACKLOG_LOW)
+    assert controller.interval == 5 * MAX_COMMIT_INTERVAL_FACTOR
+
+    for _ in range(10):
+        controller.record_commit(0.1, 0)
+    # SQLite never commits more often than configured
+    assert controller.interval == 5
+
+
+def test_commit_interval_shrinks_below_configured_for_servers() -> None:
+    """Test the interval may shrink below the configured one for server databases."""
+    controller = CommitController(5, is_sqlite=False)
+    for _ in range(10):
+        controller.record_commit(0.1, 0)
+    assert controller.interval == 2.5
+
+    controller = CommitController(1, is_sqlite=False)
+    for _ in range(10):
+        controller.record_commit(0.1, 0)
+    assert controller.interval == 1
+
+    controller = CommitController(0, is_sqlite=False)
+    controller.record_commit(0.1, COMMIT_BACKLOG_HIGH)
+    assert controller.interval == 0
@@ -388,6 +388,32 @@ async def test_state_changes_during_period_descending(
         < hist_states[2].last_changed
     )
 
+    # The newest states are returned when limited
+    hist = history.state_changes_during_period(
+        hass,
+        start,
+        end,
+        entity_id,
+        no_attributes=False,
+        descending=True,
+        limit=2,
+        include_start_time_state=False,
+    )
+    assert_multiple_states_equal_without_context(
+        states[-1:-3:-1], list(hist[entity_id])
+    )
+    hist = history.state_changes_during_period(
+        hass,
+        start,
+        end,
+        entity_id,
+        no_attributes=False,
+        descending=False,
+        limit=2,
+        include_start_time_state=False,
+    )
+    assert_multiple_states_equal_without_context(states[:2], list(hist[entity_id]))
+
 
 async def test_get_last_state_changes(hass: HomeAssistant) -> None:
     """Test number of state changes."""
@@ -0,0 +1,142 @@
+"""The tests for batching history queries."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.history.preload import (
+    async_preload_last_state_changes,
+    async_preload_state_changes_during_period,
+)
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import (
+    assert_multiple_states_equal_without_context,
+    async_wait_recording_done,
+)
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.fixture(autouse=True)
+def setup_recorder(recorder_mock: Recorder) -> recorder.Recorder:
+    """Set up recorder."""
+
+
+async def test_preload_merges_queries(hass: HomeAssistant) -> None:
+    """Test queries made at the same time are merged and give the same states."""
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+
+    with freeze_time(start) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "1")
+        freezer.move_to(point)
+        hass.states.async_set("sensor.one", "2")
+        hass.states.async_set("sensor.one", "2", {"attribute": "changed"})
+        hass.states.async_set("sensor.two", "2")
+        hass.states.async_set("sensor.one", "3")
+        freezer.move_to(end)
+        hass.states.async_set("sensor.two", "3")
+        freezer.move_to(end + timedelta(seconds=1))
+        hass.states.async_set("sensor.two", "4")
+    await async_wait_recording_done(hass)
+
+    expected = {
+        "one": history.state_changes_during_period(
+            hass, start, entity_id="sensor.one", include_start_time_state=False
+        )["sensor.one"],
+        "two": history.state_changes_during_period(
+            hass, point, entity_id="sensor.two", include_start_time_state=False
+        )["sensor.two"],
+        "two_limited": history.state_changes_during_period(
+            hass,
+            start,
+            entity_id="sensor.two",
+            descending=True,
+            limit=2,
+            include_start_time_state=False,
+        )["sensor.two"],
+        "last": history.get_last_state_changes(hass, 2, "sensor.one")["sensor.one"],
+    }
+
+    with (
+        patch.object(
+            history,
+            "get_significant_states",
+            wraps=history.get_significant_states,
+        ) as mock_get_significant_states,
+        patch.object(
+            history,
+            "state_changes_during_period",
+            wraps=history.state_changes_during_period,
+        ) as mock_state_changes_during_period,
+    ):
+        one, two, two_limited, last = await asyncio.gather(
+            async_preload_state_changes_during_period(
+                hass, start, entity_id="sensor.one", include_start_time_state=False
+            ),
+            async_preload_state_changes_during_period(
+                hass, point, entity_id="sensor.two", include_start_time_state=False
+            ),
+            async_preload_state_changes_during_period(
+                hass,
+                start,
+                entity_id="sensor.two",
+                descending=True,
+                limit=2,
+                include_start_time_state=False,
+            ),
+            async_preload_last_state_changes(hass, 2, "sensor.one"),
+        )
+
+    assert mock_get_significant_states.call_count == 1
+    assert mock_state_changes_during_period.call_count == 0
+    assert_multiple_states_equal_without_context(one, expected["one"])
+    assert_multiple_states_equal_without_context(two, expected["two"])
+    assert_multiple_states_equal_without_context(two_limited, expected["two_limited"])
+    # The newest states are returned when limited in descending order
+    assert [state.state for state in two_limited] == ["4", "3"]
+    assert_multiple_states_equal_without_context(last, expected["last"])
+
+
+async def test_preload_single_entity(hass: HomeAssistant) -> None:
+    """Test equal queries of a single entity run once and without limit all states."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.one", "2")
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "state_changes_during_period",
+        wraps=history.state_changes_during_period,
+    ) as mock_state_changes_during_period:
+        first, second = await asyncio.gather(
+            async_preload_state_changes_during_period(
+                hass, None, entity_id="sensor.one", limit=5
+            ),
+            async_preload_state_changes_during_period(
+                hass, None, entity_id="sensor.one", limit=5
+            ),
+        )
+
+    assert mock_state_changes_during_period.call_count == 1
+    assert [state.state for state in first] == ["1", "2"]
+    assert first == second
+    assert first is not second
@@ -2085,6 +2085,7 @@ async def test_recorder_info(
     await client.send_json_auto_id({"type": "recorder/info"})
     response = await client.receive_json()
     assert response["success"]
+    commit = response["result"].pop("commit")
     assert response["result"] == {
         "backlog": 0,
         "max_backlog": 65000,
@@ -2093,6 +2094,10 @@ async def test_recorder_info(
         "recording": True,
         "thread_running": True,
     }
+    assert commit["interval"] == 0
+    assert commit["last_backlog"] >= 0
+    assert commit["last_rows"] > 0
+    assert commit["last_duration"] >= 0
 
 
 async def test_recorder_info_no_recorder(
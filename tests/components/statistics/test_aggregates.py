@@ -0,0 +1,102 @@
+"""Test the incrementally updated aggregates of the statistics sensor."""
+
+from collections import deque
+from datetime import datetime, timedelta
+import random
+import statistics
+
+from homeassistant.components.statistics.aggregates import (
+    ExtremesAggregate,
+    SortedAggregate,
+    SumAggregate,
+    WindowAggregate,
+    float_sqrt_of_fraction,
+)
+from homeassistant.util import dt as dt_util
+
+
+def _slide(
+    aggregate: WindowAggregate, values: list[float], size: int
+) -> list[list[float]]:
+    """Slide a window over the values and return each window."""
+    states: deque[float | bool] = deque()
+    ages: deque[datetime] = deque()
+    now = dt_util.utcnow()
+    windows: list[list[float]] = []
+    for index, value in enumerate(values):
+        if len(states) == size:
+            aggregate.sample_removing(states, ages)
+            states.popleft()
+            ages.popleft()
+        states.append(value)
+        ages.append(now + timedelta(seconds=index))
+        aggregate.sample_added(states, ages)
+        windows.append(list(states))
+    return windows
+
+
+def test_sum_aggregate_matches_statistics() -> None:
+    """Test the exact sums give the same results as the statistics module."""
+    rng = random.Random(1)
+    values = [round(rng.uniform(-1000, 1000), rng.randint(0, 6)) for _ in range(500)]
+    aggregate = SumAggregate(squares=True)
+    states: deque[float | bool] = deque()
+    ages: deque[datetime] = deque()
+    for value in values:
+        if len(states) == 20:
+            aggregate.sample_removing(states, ages)
+            states.popleft()
+        states.append(value)
+        aggregate.sample_added(states, ages)
+        count = len(states)
+        assert float(aggregate.values.value / count) == statistics.mean(states)
+        if count >= 2:
+            deviations = aggregate.sum_of_squared_deviations(count)
+            assert float(deviations / (count - 1)) == statistics.variance(states)
+            assert float_sqrt_of_fraction(deviations / (count - 1)) == statistics.stdev(
+                states
+            )
+
+
+def test_sum_aggregate_not_finite() -> None:
+    """Test the sum is unknown while a sample is not finite."""
+    aggregate = SumAggregate()
+    windows = _slide(aggregate, [1.0, float("inf"), 2.0, 3.0], 2)
+
+    assert windows[-1] == [2.0, 3.0]
+    assert aggregate.values.value == 5
+
+
+def test_extremes_and_sorted_aggregates() -> None:
+    """Test the extremes and sorted samples while sliding over the samples."""
+    rng = random.Random(2)
+    values = [float(rng.randint(0, 20)) for _ in range(300)]
+    extremes = ExtremesAggregate()
+    ordered = SortedAggregate()
+    states: deque[float | bool] = deque()
+    ages: deque[datetime] = deque()
+    for value in values:
+        if len(states) == 15:
+            extremes.sample_removing(states, ages)
+            ordered.sample_removing(states, ages)
+            states.popleft()
+        states.append(value)
+        extremes.sample_added(states, ages)
+        ordered.sample_added(states, ages)
+        assert extremes.maximum_index == states.index(max(states))
+        assert extremes.minimum_index == states.index(min(states))
+        assert ordered.sorted_values == sorted(states)
+
+
+def test_extremes_aggregate_nan() -> None:
+    """Test the extremes are unknown while a sample is not a number."""
+    aggregate = ExtremesAggregate()
+    _slide(aggregate, [3.0, float("nan"), 1.0], 2)
+    assert aggregate.maximum_index is None
+    assert aggregate.minimum_index is None
+
+    aggregate = ExtremesAggregate()
+    windows = _slide(aggregate, [3.0, float("nan"), 1.0, 2.0], 2)
+    assert windows[-1] == [1.0, 2.0]
+    assert aggregate.maximum_index == 1
+    assert aggregate.minimum_index == 0
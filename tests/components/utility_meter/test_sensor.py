@@ -14,7 +14,6 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.components.utility_meter import DEFAULT_OFFSET
 from homeassistant.components.utility_meter.const import (
     ATTR_VALUE,
     DAILY,
@@ -30,7 +29,6 @@ from homeassistant.components.utility_meter.sensor import (
     ATTR_STATUS,
     COLLECTING,
     PAUSED,
-    UtilityMeterSensor,
 )
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
@@ -1892,29 +1890,51 @@ async def test_bad_offset(hass: HomeAssistant) -> None:
     )
 
 
-def test_calculate_adjustment_invalid_new_state(
+async def test_invalid_new_state(
+    hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Test that calculate_adjustment method returns None if the new state is invalid."""
-    mock_sensor = UtilityMeterSensor(
-        cron_pattern=None,
-        delta_values=False,
-        meter_offset=DEFAULT_OFFSET,
-        meter_type=DAILY,
-        name="Test utility meter",
-        net_consumption=False,
-        parent_meter="sensor.test",
-        periodically_resetting=True,
-        sensor_always_available=False,
-        unique_id="test_utility_meter",
-        source_entity="sensor.test",
-        tariff=None,
-        tariff_entity=None,
+    """Test an invalid new state of the source is not added to the meter."""
+    yaml_config = {
+        "utility_meter": {
+            "energy_bill": {
+                "source": "sensor.energy",
+                "periodically_resetting": False,
+            }
+        }
+    }
+    source_entity_id = yaml_config[DOMAIN]["energy_bill"]["source"]
+
+    assert await async_setup_component(hass, DOMAIN, yaml_config)
+    await hass.async_block_till_done()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    hass.states.async_set(
+        source_entity_id, 2, {ATTR_UNIT_OF_MEASUREMENT: UnitOfEnergy.KILO_WATT_HOUR}
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set(
+        source_entity_id,
+        "unknown",
+        {ATTR_UNIT_OF_MEASUREMENT: UnitOfEnergy.KILO_WATT_HOUR},
+    )
+    await hass.async_block_till_done()
+
+    assert (
+        f"energy_bill received an invalid new state from {source_entity_id} : unknown"
+        in caplog.text
+    )
+
+    hass.states.async_set(
+        source_entity_id, 5, {ATTR_UNIT_OF_MEASUREMENT: UnitOfEnergy.KILO_WATT_HOUR}
     )
+    await hass.async_block_till_done()
 
-    new_state: State = State(entity_id="sensor.test", state="unknown")
-    assert mock_sensor.calculate_adjustment(None, new_state) is None
-    assert "Invalid state unknown" in caplog.text
+    state = hass.states.get("sensor.energy_bill")
+    assert state is not None
+    assert state.state == "3"
 
 
 async def test_unit_of_measurement_missing_invalid_new_state(
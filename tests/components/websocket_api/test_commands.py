@@ -10,6 +10,7 @@ import pytest
 import voluptuous as vol
 
 from homeassistant import loader
+from homeassistant.components import websocket_api
 from homeassistant.components.device_automation import toggle_entity
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -24,16 +26,20 @@ from homeassistant.core import Context, HomeAssistant, State, SupportsResponse,
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import async_defer_setup_components, async_setup_component
 from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    MockModule,
     MockUser,
     async_mock_service,
+    mock_integration,
     mock_platform,
 )
 from tests.typing import (
@@ -705,6 +711,35 @@ async def test_get_services(
         assert msg["result"].keys() == hass.services.async_services().keys()
 
 
+async def test_get_services_only_serializes_changed_domains(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_services only serializes the descriptions of changed domains."""
+    hass.services.async_register("domain_a", "service", lambda call: None)
+    hass.services.async_register("domain_b", "service", lambda call: None)
+
+    await websocket_client.send_json({"id": 5, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert {"domain_a", "domain_b"}.issubset(msg["result"])
+
+    hass.services.async_register("domain_b", "new_service", lambda call: None)
+    with patch(
+        "homeassistant.components.websocket_api.commands.json_bytes",
+        side_effect=json_bytes,
+    ) as mock_json_bytes:
+        await websocket_client.send_json({"id": 6, "type": "get_services"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"].keys() == hass.services.async_services().keys()
+    assert msg["result"]["domain_b"].keys() == {"service", "new_service"}
+    assert [call.args[0] for call in mock_json_bytes.mock_calls] == [
+        "domain_b",
+        msg["result"]["domain_b"],
+    ]
+
+
 async def test_get_config(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -733,6 +768,46 @@ async def test_get_config(
     assert result == config
 
 
+async def test_deferred_integration_command(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test a command of a deferred integration sets it up."""
+
+    @websocket_api.websocket_command({vol.Required("type"): "lazy/ping"})
+    @callback
+    def handle_ping(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"], "pong")
+
+    async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+        websocket_api.async_register_command(hass, handle_ping)
+        return True
+
+    mock_integration(hass, MockModule("lazy", async_setup=async_setup))
+    await async_defer_setup_components(
+        hass, [await async_get_integration(hass, "lazy")], {}
+    )
+
+    await websocket_client.send_json({"id": 5, "type": "get_config"})
+    msg = await websocket_client.receive_json()
+    assert "lazy" in msg["result"]["components"]
+    assert "lazy" not in hass.config.components
+
+    await websocket_client.send_json({"id": 6, "type": "lazy/ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert msg["result"] == "pong"
+    assert "lazy" in hass.config.components
+
+    await websocket_client.send_json({"id": 7, "type": "lazy/unknown"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_COMMAND
+
+
 async def test_ping(websocket_client: MockHAClientWebSocket) -> None:
     """Test get_panels command."""
     await websocket_client.send_json({"id": 5, "type": "ping"})
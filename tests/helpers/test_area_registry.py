@@ -427,6 +427,12 @@ async def test_entries_for_floor(
     assert not ar.async_entries_for_floor(area_registry, "unknown")
     assert not ar.async_entries_for_floor(area_registry, "")
 
+    assert area_registry.areas.get_area_ids_for_floor(first_floor.floor_id) == [
+        kitchen.id,
+        living_room.id,
+    ]
+    assert not area_registry.areas.get_area_ids_for_floor("unknown")
+
 
 async def test_removing_labels(
     hass: HomeAssistant,
@@ -492,6 +498,12 @@ async def test_entries_for_label(
     assert not ar.async_entries_for_label(area_registry, "unknown")
     assert not ar.async_entries_for_label(area_registry, "")
 
+    assert area_registry.areas.get_area_ids_for_label(label2.label_id) == [
+        kitchen.id,
+        bedroom.id,
+    ]
+    assert not area_registry.areas.get_area_ids_for_label("unknown")
+
 
 async def test_async_get_or_create_thread_checks(
     hass: HomeAssistant, area_registry: ar.AreaRegistry
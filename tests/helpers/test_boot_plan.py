@@ -0,0 +1,78 @@
+"""Tests for the boot plan helper."""
+
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.boot_plan import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    BootPlan,
+)
+
+from tests.common import async_fire_time_changed
+
+
+async def test_boot_plan_round_trip(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a saved plan is used on the next startup with the same config."""
+    plan = BootPlan(hass)
+    assert await plan.async_load({"light", "group"}) is None
+
+    integration = await loader.async_get_integration(hass, "group")
+    await integration.async_get_component()
+    await integration.async_get_platforms(["light"])
+
+    plan.async_schedule_save({"light", "group"})
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    stored = hass_storage[STORAGE_KEY]
+    assert stored["version"] == STORAGE_VERSION
+    assert stored["data"]["domains"] == ["group", "light"]
+    assert "light" in stored["data"]["imports"]["group"]
+
+    plan = BootPlan(hass)
+    data = await plan.async_load({"group", "light"})
+    assert data is not None
+    assert data["domains"] == ["group", "light"]
+
+    with patch("homeassistant.helpers.boot_plan._async_prefetch") as mock_prefetch:
+        plan.async_prefetch()
+    mock_prefetch.assert_called_once_with(hass, data["imports"])
+
+    # A different configuration does not use the plan
+    assert await BootPlan(hass).async_load({"light"}) is None
+
+
+async def test_boot_plan_prefetch(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test prefetching imports integrations and platforms and skips failures."""
+    plan = BootPlan(hass)
+    await plan.async_load({"group"})
+    plan.data = {
+        "key": plan.key,
+        "domains": ["group"],
+        "imports": {"not_exist": [], "group": ["light", "not_exist"]},
+    }
+    with patch(
+        "homeassistant.requirements.async_process_requirements"
+    ) as mock_process_requirements:
+        plan.async_prefetch()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Prefetching must not install packages
+    mock_process_requirements.assert_not_called()
+    components = hass.data[loader.DATA_COMPONENTS]
+    assert "group" in components
+    assert "group.light" in components
+    assert "not_exist" not in components
@@ -2405,6 +2405,12 @@ async def test_entries_for_label(
     assert not dr.async_entries_for_label(device_registry, "unknown")
     assert not dr.async_entries_for_label(device_registry, "")
 
+    assert device_registry.devices.get_device_ids_for_label("label1") == [
+        entry_1.id,
+        entry_1_and_2.id,
+    ]
+    assert not device_registry.devices.get_device_ids_for_label("unknown")
+
 
 @pytest.mark.parametrize(
     (
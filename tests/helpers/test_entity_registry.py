@@ -1908,6 +1908,60 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_label(entity_registry, "unknown")
     assert not er.async_entries_for_label(entity_registry, "")
 
+    assert entity_registry.entities.get_entity_ids_for_label("label1") == [
+        label_1.entity_id,
+        label_1_and_2.entity_id,
+    ]
+    assert entity_registry.entities.get_entity_ids_for_label("label2") == [
+        label_2.entity_id,
+        label_1_and_2.entity_id,
+    ]
+    assert not entity_registry.entities.get_entity_ids_for_label("unknown")
+
+
+async def test_entity_ids_for_device_and_area(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test getting entity ids by device and area."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    enabled = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "123",
+        config_entry=config_entry,
+        device_id=device_entry.id,
+    )
+    disabled = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "456",
+        device_id=device_entry.id,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    in_area = entity_registry.async_get_or_create("light", "hue", "789")
+    in_area = entity_registry.async_update_entity(in_area.entity_id, area_id="kitchen")
+
+    entities = entity_registry.entities
+    assert entities.get_entity_ids_for_device_id(device_entry.id) == [enabled.entity_id]
+    assert entities.get_entity_ids_for_device_id(
+        device_entry.id, include_disabled_entities=True
+    ) == [enabled.entity_id, disabled.entity_id]
+    assert not entities.get_entity_ids_for_device_id("unknown")
+    assert entities.get_entity_ids_for_config_entry_id(config_entry.entry_id) == [
+        enabled.entity_id
+    ]
+    assert entities.get_entity_ids_for_area_id("kitchen") == [in_area.entity_id]
+
+    entity_registry.async_update_entity(in_area.entity_id, area_id=None)
+    assert not entities.get_entity_ids_for_area_id("kitchen")
+
 
 async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     """Make sure we can clear categories."""
@@ -0,0 +1,85 @@
+"""Test the numeric source helper."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import numeric_source
+from homeassistant.helpers.numeric_source import (
+    DATA_NUMERIC_SOURCES,
+    NumericStateChangedData,
+    async_track_numeric_state_change,
+)
+
+
+async def test_shared_source(hass: HomeAssistant) -> None:
+    """Test consumers of the same source share the listener and parsed states."""
+    first: list[tuple[Decimal | None, Decimal | None]] = []
+    second: list[tuple[Decimal | None, Decimal | None]] = []
+
+    @callback
+    def first_action(change: NumericStateChangedData) -> None:
+        first.append((change.old_value, change.new_value))
+
+    @callback
+    def second_action(change: NumericStateChangedData) -> None:
+        second.append((change.old_value, change.new_value))
+
+    unsub_first = async_track_numeric_state_change(hass, "sensor.Source", first_action)
+    unsub_second = async_track_numeric_state_change(
+        hass, "sensor.source", second_action
+    )
+    assert len(hass.data[DATA_NUMERIC_SOURCES]) == 1
+
+    with patch.object(
+        numeric_source, "decimal_state", wraps=numeric_source.decimal_state
+    ) as mock_decimal_state:
+        hass.states.async_set("sensor.source", "1.5")
+        hass.states.async_set("sensor.source", "unknown")
+        hass.states.async_set("sensor.source", "2")
+        await hass.async_block_till_done()
+
+    expected = [
+        (None, Decimal("1.5")),
+        (Decimal("1.5"), None),
+        (None, Decimal(2)),
+    ]
+    assert first == expected
+    assert second == expected
+    # The old state was parsed as the new state of the previous change
+    assert mock_decimal_state.call_count == 4
+
+    unsub_first()
+    hass.states.async_set("sensor.source", "3")
+    await hass.async_block_till_done()
+    assert len(first) == 3
+    assert second[-1] == (Decimal(2), Decimal(3))
+
+    unsub_second()
+    assert not hass.data[DATA_NUMERIC_SOURCES]
+
+
+async def test_action_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an error in one consumer doesn't affect the others."""
+    values: list[Decimal | None] = []
+
+    @callback
+    def failing_action(change: NumericStateChangedData) -> None:
+        raise ValueError("failed")
+
+    @callback
+    def action(change: NumericStateChangedData) -> None:
+        values.append(change.new_value)
+
+    async_track_numeric_state_change(hass, "sensor.source", failing_action)
+    async_track_numeric_state_change(hass, "sensor.source", action)
+
+    hass.states.async_set("sensor.source", "1")
+    await hass.async_block_till_done()
+
+    assert values == [Decimal(1)]
+    assert "Error while dispatching state change of sensor.source" in caplog.text
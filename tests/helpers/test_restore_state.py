@@ -406,6 +406,45 @@ async def test_load_error(hass: HomeAssistant) -> None:
     assert state is None
 
 
+async def test_states_decoded_on_access(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loaded states are only decoded when they are read."""
+    now = dt_util.utcnow()
+    stored = [
+        StoredState(State("input_boolean.b0", "on"), None, now).as_dict(),
+        StoredState(
+            State("input_boolean.b1", "off"),
+            Mock(as_dict=Mock(return_value={"native_value": 1})),
+            now,
+        ).as_dict(),
+    ]
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": json_round_trip(stored),
+    }
+
+    with patch.object(State, "from_dict", wraps=State.from_dict) as mock_from_dict:
+        await async_load(hass)
+        data = async_get(hass)
+        assert mock_from_dict.call_count == 0
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert mock_from_dict.call_count == 1
+
+    assert state.state == "off"
+    extra_data = await entity.async_get_last_extra_data()
+    assert extra_data.as_dict() == {"native_value": 1}
+    assert data.last_states["input_boolean.b1"].last_seen == now
+
+    # States which were not read are written back as they were loaded
+    assert data.last_states["input_boolean.b0"].as_dict() == json_round_trip(stored[0])
+
+
 async def test_state_saved_on_remove(hass: HomeAssistant) -> None:
     """Test that we save entity state on removal."""
     platform = MockEntityPlatform(hass, domain="input_boolean")
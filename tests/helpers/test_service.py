@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Iterable
 from copy import deepcopy
+from datetime import timedelta
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -43,10 +44,12 @@ from homeassistant.helpers import (
 import homeassistant.helpers.config_validation as cv
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockEntity,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_area_registry,
     mock_device_registry,
@@ -1117,6 +1120,66 @@ async def test_register_with_mixed_case(hass: HomeAssistant) -> None:
     assert descriptions[DOMAIN_LOGGER]["new_service"]["description"] == "new service"
 
 
+async def test_async_get_all_descriptions_only_changed_domains(
+    hass: HomeAssistant,
+) -> None:
+    """Test only the descriptions of changed domains are built again."""
+    hass.services.async_register("domain_a", "service", lambda call: None)
+    hass.services.async_register("domain_b", "service", lambda call: None)
+    descriptions = await service.async_get_all_descriptions(hass)
+
+    service.async_set_service_schema(
+        hass, "domain_b", "service", {"description": "new description"}
+    )
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions is not descriptions
+    assert new_descriptions["domain_a"] is descriptions["domain_a"]
+    assert new_descriptions["domain_b"]["service"]["description"] == "new description"
+
+    hass.services.async_register("domain_a", "new_service", lambda call: None)
+    descriptions = await service.async_get_all_descriptions(hass)
+    assert descriptions["domain_a"].keys() == {"service", "new_service"}
+    assert descriptions["domain_b"] is new_descriptions["domain_b"]
+
+
+async def test_async_get_all_descriptions_services_files_bundle(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loaded services files are stored in a bundle and loaded from it."""
+    assert await async_setup_component(hass, DOMAIN_GROUP, {DOMAIN_GROUP: {}})
+    descriptions = await service.async_get_all_descriptions(hass)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    bundled = hass_storage[service.SERVICES_FILES_STORAGE_KEY]["data"]["domains"]
+    assert "reload" in bundled[DOMAIN_GROUP]["services"]
+
+    # Loading the descriptions again does not load the services files
+    hass.data.pop(service.SERVICES_FILES_BUNDLE)
+    hass.data.pop(service.SERVICE_DESCRIPTION_CACHE)
+    hass.data.pop(service.ALL_SERVICE_DESCRIPTIONS_CACHE)
+    with patch(
+        "homeassistant.helpers.service._load_services_files",
+        side_effect=service._load_services_files,
+    ) as proxy_load_services_files:
+        assert await service.async_get_all_descriptions(hass) == descriptions
+    assert not proxy_load_services_files.called
+
+    # The bundle is not used when the services file has changed
+    bundled[DOMAIN_GROUP]["key"][-1] -= 1
+    hass.data.pop(service.SERVICES_FILES_BUNDLE)
+    hass.data.pop(service.SERVICE_DESCRIPTION_CACHE)
+    hass.data.pop(service.ALL_SERVICE_DESCRIPTIONS_CACHE)
+    with patch(
+        "homeassistant.helpers.service._load_services_files",
+        side_effect=service._load_services_files,
+    ) as proxy_load_services_files:
+        assert await service.async_get_all_descriptions(hass) == descriptions
+    assert proxy_load_services_files.mock_calls[0][1][1] == [
+        await async_get_integration(hass, DOMAIN_GROUP)
+    ]
+
+
 async def test_call_with_required_features(hass: HomeAssistant, mock_entities) -> None:
     """Test service calls invoked only if entity has required features."""
     test_service_mock = AsyncMock(return_value=None)
@@ -0,0 +1,118 @@
+"""Tests for the startup trace helper."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.helpers.startup_trace import (
+    SPAN_INTEGRATION,
+    StartupSpan,
+    StartupTrace,
+)
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+def test_critical_path() -> None:
+    """Test the critical path follows the dependencies that finished last."""
+    trace = StartupTrace()
+    trace.started = 0
+    trace.spans = [
+        StartupSpan("http", SPAN_INTEGRATION, 0, 2),
+        StartupSpan("logger", SPAN_INTEGRATION, 0, 1),
+        StartupSpan("api", SPAN_INTEGRATION, 0, 3),
+        StartupSpan("frontend", SPAN_INTEGRATION, 0, 5),
+        StartupSpan("frontend", "import", 2, 3),
+        StartupSpan("unrelated", SPAN_INTEGRATION, 0, 4),
+    ]
+    dependencies = {
+        "frontend": {"api", "logger"},
+        "api": {"http"},
+        "unrelated": {"frontend"},
+    }
+
+    assert [span.domain for span in trace.critical_path(dependencies)] == [
+        "http",
+        "api",
+        "frontend",
+    ]
+    assert StartupTrace().critical_path(dependencies) == []
+
+
+def test_trace_events() -> None:
+    """Test exporting the spans as trace events."""
+    trace = StartupTrace()
+    trace.started = 10
+    trace.spans = [
+        StartupSpan("http", SPAN_INTEGRATION, 10, 12.5),
+        StartupSpan("http", "config_entry_setup", 11, 12, "entry_id"),
+    ]
+
+    assert trace.as_trace_events() == {
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "http"},
+            },
+            {
+                "name": SPAN_INTEGRATION,
+                "cat": "http",
+                "ph": "X",
+                "ts": 0,
+                "dur": 2_500_000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "config_entry_setup",
+                "cat": "http",
+                "ph": "X",
+                "ts": 1_000_000,
+                "dur": 1_000_000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"group": "entry_id"},
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+async def test_trace_startup(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the setup of integrations is traced until started."""
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"]))
+    caplog.set_level("INFO")
+
+    startup_trace.async_enable(hass)
+    assert await async_setup_component(hass, "comp_b", {})
+
+    trace = hass.data[startup_trace.DATA_STARTUP_TRACE]
+    assert {(span.domain, span.name) for span in trace.spans} >= {
+        ("comp_a", SPAN_INTEGRATION),
+        ("comp_a", "import"),
+        ("comp_a", "config_validation"),
+        ("comp_b", SPAN_INTEGRATION),
+        ("comp_b", "dependencies"),
+    }
+
+    with patch("homeassistant.helpers.startup_trace.save_json") as mock_save_json:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    assert startup_trace.DATA_STARTUP_TRACE not in hass.data
+    mock_save_json.assert_called_once_with(
+        hass.config.path(startup_trace.TRACE_FILE), trace.as_trace_events()
+    )
+    assert "Startup critical path" in caplog.text
+    assert "comp_a" in caplog.text
+    assert "comp_b" in caplog.text
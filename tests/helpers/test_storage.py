@@ -664,6 +664,111 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changes to journaled lists are appended and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+
+        def _store() -> storage.Store:
+            return storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+            )
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as fp:
+                return fp.read()
+
+        store = _store()
+        items = [{"id": str(idx), "value": "x" * 20} for idx in range(20)]
+        await store.async_save({"items": items, "other": 1})
+        base = await hass.async_add_executor_job(_read, store.path)
+        assert not os.path.exists(store.journal_path)
+
+        items[3] = {"id": "3", "value": "changed"}
+        del items[5]
+        items.append({"id": "new", "value": "added"})
+        await store.async_save({"items": items, "other": 1})
+        # Saving the same data again does not write anything
+        await store.async_save({"items": items, "other": 1})
+
+        assert await hass.async_add_executor_job(_read, store.path) == base
+        journal = await hass.async_add_executor_job(_read, store.journal_path)
+        assert journal.count(b"\n") == 1
+        assert json.loads(journal) == {
+            "journal_id": json.loads(base)["journal_id"],
+            "changes": {
+                "items": {
+                    "set": [
+                        {"id": "3", "value": "changed"},
+                        {"id": "new", "value": "added"},
+                    ],
+                    "remove": ["5"],
+                }
+            },
+        }
+
+        # An incomplete line from an interrupted write is ignored
+        def _append_partial() -> None:
+            with open(store.journal_path, "ab") as fp:
+                fp.write(b'{"items": {"set": [')
+
+        await hass.async_add_executor_job(_append_partial)
+        assert await _store().async_load() == {"items": items, "other": 1}
+
+        # Changes outside of the journaled lists write the store in full
+        await store.async_save({"items": items, "other": 2})
+        assert not os.path.exists(store.journal_path)
+        assert await _store().async_load() == {"items": items, "other": 2}
+
+        # A journal left over from before the last full write is not replayed
+        def _write_stale_journal() -> None:
+            with open(store.journal_path, "wb") as fp:
+                fp.write(journal)
+
+        await hass.async_add_executor_job(_write_stale_journal)
+        assert await _store().async_load() == {"items": items, "other": 2}
+        await hass.async_add_executor_job(os.unlink, store.journal_path)
+
+        # A journal growing past the compaction ratio writes the store in full
+        items = [{"id": str(idx), "value": "y" * 20} for idx in range(20)]
+        await store.async_save({"items": items, "other": 2})
+        assert not os.path.exists(store.journal_path)
+        assert await _store().async_load() == {"items": items, "other": 2}
+
+        await store.async_remove()
+        assert not os.path.exists(store.path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_remove_error(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test failing to remove the journal is logged and the next write is full."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        )
+        items = [{"id": str(idx), "value": "x" * 20} for idx in range(20)]
+        with patch(
+            "homeassistant.helpers.storage.os.unlink", side_effect=PermissionError
+        ):
+            await store.async_save({"items": items})
+        assert "Error writing config for" in caplog.text
+
+        items.append({"id": "new", "value": "added"})
+        await store.async_save({"items": items})
+        assert not os.path.exists(store.journal_path)
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        ).async_load() == {"items": items}
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
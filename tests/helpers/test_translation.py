@@ -1,6 +1,7 @@
 """Test the translation helper."""
 
 import asyncio
+from datetime import timedelta
 import pathlib
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -12,6 +13,10 @@ from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture(autouse=True)
@@ -685,3 +690,67 @@ async def test_get_translations_still_has_title_without_translations_files(
     assert translations == {
         "component.component1.title": "Component 1",
     }
+
+
+async def test_translation_bundle(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test translations are stored in a bundle and loaded from it."""
+    translations = await translation.async_get_translations(
+        hass, "de", "entity", integrations={"test"}
+    )
+    assert translations["component.test.entity.switch.other1.name"] == "Anderes 1"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    bundled = hass_storage["core.translations.de"]["data"]["components"]["test"]
+    assert bundled["categories"]["entity"] == translations
+
+    # A new cache loads the translations from the bundle
+    cache = translation._TranslationCache(hass)
+    with patch(
+        "homeassistant.helpers.translation._async_get_component_strings"
+    ) as mock_get_strings:
+        assert await cache.async_fetch("de", "entity", {"test"}) == translations
+    assert not mock_get_strings.called
+
+    # The bundle is not used when the translation files have changed
+    bundled["key"][-1] -= 1
+    cache = translation._TranslationCache(hass)
+    with patch(
+        "homeassistant.helpers.translation._async_get_component_strings",
+        side_effect=translation._async_get_component_strings,
+    ) as mock_get_strings:
+        assert await cache.async_fetch("de", "entity", {"test"}) == translations
+    assert mock_get_strings.called
+
+
+async def test_get_translations_json(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test getting translations serialized as JSON."""
+    payload = await translation.async_get_translations_json(
+        hass, "en", "entity", integrations={"test"}
+    )
+    assert json_loads(payload) == await translation.async_get_translations(
+        hass, "en", "entity", integrations={"test"}
+    )
+    assert (
+        await translation.async_get_translations_json(
+            hass, "en", "entity", integrations={"test"}
+        )
+        is payload
+    )
+
+    # Loading other translations invalidates the serialized translations
+    await translation.async_get_translations(
+        hass, "en", "entity", integrations={"test_package"}
+    )
+    assert (
+        await translation.async_get_translations_json(
+            hass, "en", "entity", integrations={"test"}
+        )
+        is not payload
+    )
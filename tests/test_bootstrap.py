@@ -10,6 +10,7 @@ import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from typing_extensions import Generator
 
@@ -19,16 +20,22 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_DEBUG, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import boot_plan
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
-from homeassistant.setup import BASE_PLATFORMS
+from homeassistant.setup import (
+    BASE_PLATFORMS,
+    async_get_deferred_domains,
+    async_setup_deferred_component,
+)
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -549,6 +556,34 @@ async def test_setup_after_deps_not_trigger_load(hass: HomeAssistant) -> None:
     assert "second_dep" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_uses_boot_plan(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the boot plan is saved and the next startup prefetches from it."""
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(
+        hass, MockModule(domain="child", partial_manifest={"dependencies": ["root"]})
+    )
+
+    await bootstrap._async_set_up_integrations(hass, {"child": {}})
+    # The plan is not saved during startup
+    assert boot_plan.STORAGE_KEY not in hass_storage
+    freezer.tick(boot_plan.SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    plan = hass_storage[boot_plan.STORAGE_KEY]["data"]
+    assert {"child", "root"}.issubset(plan["domains"])
+    assert {"child", "root"}.issubset(plan["imports"])
+
+    with patch("homeassistant.helpers.boot_plan._async_prefetch") as mock_prefetch:
+        domains, _ = await bootstrap._async_resolve_domains_to_setup(
+            hass, {"child": {}}, boot_plan.BootPlan(hass)
+        )
+    assert {"child", "root"}.issubset(domains)
+    mock_prefetch.assert_called_once_with(hass, plan["imports"])
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when referenced integration doesn't exist."""
@@ -583,6 +618,53 @@ async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     assert order == ["root", "second_dep"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_defers_lazy_integrations(hass: HomeAssistant) -> None:
+    """Test lazy integrations are only set up when needed at startup."""
+    order = []
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    for domain in ("lazy_unused", "lazy_configured", "lazy_dependency"):
+        mock_integration(
+            hass,
+            MockModule(
+                domain=domain,
+                async_setup=gen_domain_setup(domain),
+                partial_manifest={"lazy_setup": True},
+            ),
+        )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="root",
+            async_setup=gen_domain_setup("root"),
+            dependencies=["lazy_dependency"],
+        ),
+    )
+
+    with patch(
+        "homeassistant.bootstrap.DEFAULT_INTEGRATIONS",
+        {"lazy_unused", "lazy_dependency"},
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"root": {}, "lazy_configured": {}}
+        )
+
+    assert set(order) == {"root", "lazy_configured", "lazy_dependency"}
+    assert "lazy_unused" not in hass.config.components
+    assert async_get_deferred_domains(hass) == {"lazy_unused"}
+
+    assert await async_setup_deferred_component(hass, "lazy_unused")
+    assert "lazy_unused" in hass.config.components
+    assert async_get_deferred_domains(hass) == set()
+
+
 @pytest.fixture
 def mock_is_virtual_env() -> Generator[Mock]:
     """Mock is_virtual_env."""
@@ -11,7 +11,7 @@ import voluptuous as vol
 from homeassistant import config_entries, loader, setup
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
 from homeassistant.core import CoreState, HomeAssistant, callback
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.exceptions import HomeAssistantError, ServiceNotFound
 from homeassistant.helpers import discovery, translation
 from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
@@ -1210,3 +1210,40 @@ async def test_async_prepare_setup_platform(
         await setup.async_prepare_setup_platform(hass, {}, "button", "test") is None
     )
     assert button_platform is not None
+
+
+async def test_deferred_setup_on_service_call(hass: HomeAssistant) -> None:
+    """Test calling a service of a deferred integration sets it up."""
+    integration = await loader.async_get_integration(hass, "backup")
+    await setup.async_defer_setup_components(hass, [integration], {})
+
+    assert setup.async_get_deferred_domains(hass) == {"backup"}
+    assert hass.services.has_service("backup", "create")
+    assert "backup" not in hass.config.components
+
+    with patch(
+        "homeassistant.components.backup.manager.BackupManager.generate_backup"
+    ) as mock_generate_backup:
+        await hass.services.async_call("backup", "create", blocking=True)
+        await hass.services.async_call("backup", "create", blocking=True)
+
+    assert "backup" in hass.config.components
+    assert mock_generate_backup.call_count == 2
+    assert setup.async_get_deferred_domains(hass) == set()
+
+
+async def test_deferred_setup_service_not_registered(hass: HomeAssistant) -> None:
+    """Test a service of a deferred integration it does not register is removed."""
+    mock_integration(hass, MockModule("backup"))
+    integration = await loader.async_get_integration(hass, "backup")
+    with patch(
+        "homeassistant.setup._load_deferred_services",
+        return_value={"backup": ["create"]},
+    ):
+        await setup.async_defer_setup_components(hass, [integration], {})
+
+    with pytest.raises(ServiceNotFound):
+        await hass.services.async_call("backup", "create", blocking=True)
+
+    assert "backup" in hass.config.components
+    assert not hass.services.has_service("backup", "create")
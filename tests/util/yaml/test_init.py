@@ -566,6 +566,64 @@ def test_no_recursive_secrets(
     assert e.value.args == ("Secrets not supported in this YAML file",)
 
 
+def test_parsed_nodes_cached(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test unchanged configuration files are not parsed again."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text(
+        "base: &base\n  a: 1\nkey: !secret a\nmerged:\n  <<: *base\n"
+    )
+    secrets_file = tmp_path / yaml.SECRET_YAML
+    secrets_file.write_text("a: one\n")
+    node_cache = yaml.NodeCache()
+
+    def _load() -> dict:
+        return yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path, node_cache))
+
+    assert _load() == {"base": {"a": 1}, "key": "one", "merged": {"a": 1}}
+    assert str(config_file) in node_cache.nodes
+    # Secrets are resolved on each load and never cached
+    assert str(secrets_file) not in node_cache.nodes
+
+    node = node_cache.nodes[str(config_file)][1]
+
+    secrets_file.write_text("a: two\n")
+    data = _load()
+    assert data == {"base": {"a": 1}, "key": "two", "merged": {"a": 1}}
+    assert data["merged"].__config_file__ == str(config_file)
+    assert node_cache.nodes[str(config_file)][1] is node
+
+    config_file.write_text("key: !secret a\nother: 2\n")
+    assert _load() == {"key": "two", "other": 2}
+
+    # Without a node cache files are always parsed
+    assert yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path)) == {
+        "key": "two",
+        "other": 2,
+    }
+
+
+def test_node_cache_retain(tmp_path: pathlib.Path) -> None:
+    """Test the nodes of files which are no longer loaded are dropped."""
+    config_file = tmp_path / YAML_CONFIG_FILE
+    config_file.write_text("included: !include included.yaml\n")
+    included_file = tmp_path / "included.yaml"
+    included_file.write_text("a: 1\n")
+    node_cache = yaml.NodeCache()
+
+    secrets = yaml.Secrets(tmp_path, node_cache)
+    assert yaml.load_yaml_dict(config_file, secrets) == {"included": {"a": 1}}
+    assert secrets.loaded_files == {str(config_file), str(included_file)}
+    node_cache.retain(secrets.loaded_files)
+    assert node_cache.nodes.keys() == {str(config_file), str(included_file)}
+
+    config_file.write_text("other: 2\n")
+    included_file.unlink()
+    secrets = yaml.Secrets(tmp_path, node_cache)
+    assert yaml.load_yaml_dict(config_file, secrets) == {"other": 2}
+    node_cache.retain(secrets.loaded_files)
+    assert node_cache.nodes.keys() == {str(config_file)}
+
+
 def test_input_class() -> None:
     """Test input class."""
     yaml_input = yaml_loader.Input("hello")